@@ -1,24 +1,43 @@
+import asyncio
+import json
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from typing import Optional
-from app.api.dependencies import get_availability_service
-from app.models.dto import AvailabilityRequest, AvailabilityResponse
-from app.core.response import ApiResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Literal, Optional, Union
+from app.api.dependencies import get_availability_service, get_change_feed
+from app.models.dto import (
+    AvailabilityRequest, AvailabilityResponse, CompactAvailabilityResponse, CompactRoomAvailability, RoomAvailability,
+    FreeWindowRequest, FreeWindowSearchResponse,
+)
+from app.core.response import ApiResponse, EnvelopeJSONResponse
 from app.services.availability_service import AvailabilityService
+from app.services.availability_changes import RESYNC, AvailabilityChangeFeed, ChangeSubscription
+from app.validate.date_validator import validate_date
+from app.validate.request_validator import validate_map_coordinates
 from app.core.limiter import limiter
 from app.core.config import RATE_LIMIT_PER_MINUTE
 
 router = APIRouter(prefix="/api/rooms/availability", tags=["예약 가능 여부"])
 
+# 변경분 구독(SSE) 연결 유지용 주석 전송 주기 (초). 프록시의 유휴 연결 종료 방지
+SSE_KEEPALIVE_SECONDS = 15.0
+
 @router.get(
     "/",
-    response_model=ApiResponse[AvailabilityResponse],
+    response_model=ApiResponse[Union[AvailabilityResponse, CompactAvailabilityResponse]],
     summary="합주실 지도 기반 검색 (예약 가능 여부 포함)",
     description="""
 지정된 날짜와 시간대에 대해 인원수에 맞는 합주실을 **지도 영역** 내에서 검색하고 예약 가능 여부를 확인합니다.
 모든 검색은 지도 기반이므로 좌표 정보가 필수입니다.
+
+`mode=snapshot`이면 백그라운드에서 미리 조회해 둔 스냅샷으로 즉시 응답하며, 룸별 `checked_at`(조회 시각)을 포함합니다.
+스냅샷이 없거나 오래된 룸만 실시간으로 조회합니다. 예약 직전에는 `/recheck`로 최신 상태를 확인하세요.
+
+`compact=true`이면 룸 상세 정보 없이 예약 가능 룸의 `biz_item_id`만 반환합니다. (요청 시간대가 모두 예약 가능한 룸만 포함)
+룸 상세 정보는 `/api/rooms/catalog`(ETag 캐시)에서 `biz_item_id`로 조회하세요.
 """,
 )
-@router.get("", response_model=ApiResponse[AvailabilityResponse], include_in_schema=False)
+@router.get("", response_model=ApiResponse[Union[AvailabilityResponse, CompactAvailabilityResponse]], include_in_schema=False)
 @limiter.limit(f"{RATE_LIMIT_PER_MINUTE}/minute")  # Rate Limit 적용
 async def check_room_availability(
     request: Request,
@@ -30,6 +49,8 @@ async def check_room_availability(
     swLng: float = Query(..., description="남서쪽 경도 (필수)"),
     neLat: float = Query(..., description="북동쪽 위도 (필수)"),
     neLng: float = Query(..., description="북동쪽 경도 (필수)"),
+    mode: Literal["live", "snapshot"] = Query("live", description="조회 방식 (live: 실시간 / snapshot: 백그라운드 스냅샷 우선)"),
+    compact: bool = Query(False, description="룸 상세 정보 없이 biz_item_id + 슬롯 비트마스크만 반환"),
     service: AvailabilityService = Depends(get_availability_service)
 ):
 
@@ -46,9 +67,12 @@ async def check_room_availability(
         swLng: 남서쪽 경도 (필수)
         neLat: 북동쪽 위도 (필수)
         neLng: 북동쪽 경도 (필수)
+        mode: live(기본, 요청 시점 업스트림 조회) / snapshot(백그라운드 스냅샷 우선, 룸별 checked_at 포함)
+        compact: True면 CompactAvailabilityResponse (룸 상세 정보는 카탈로그 엔드포인트에서 조회)
 
     Returns:
         ApiResponse[AvailabilityResponse]: 예약 가능 여부 및 상세 정보 (branch_summary 포함)
+        ApiResponse[CompactAvailabilityResponse]: compact=true인 경우
 
     Raises:
         HTTPException: 유효하지 않은 파라미터 시 400 에러
@@ -62,8 +86,238 @@ async def check_room_availability(
         swLat = swLat,
         swLng = swLng,
         neLat = neLat,
-        neLng = neLng
+        neLng = neLng,
+        mode = mode
     )
 
     result = await service.check_availability(request=svc_request)
-    return ApiResponse.success(result=result)
\ No newline at end of file
+    if compact:
+        return EnvelopeJSONResponse(ApiResponse[CompactAvailabilityResponse].success(result=_to_compact(result)))
+    # 룸 수에 비례해 커지는 응답이므로 재검증 / dict 변환 없이 바로 직렬화 (출력 바이트는 동일)
+    return EnvelopeJSONResponse(ApiResponse[AvailabilityResponse].success(result=result))
+
+
+def _to_compact(response: AvailabilityResponse) -> CompactAvailabilityResponse:
+    """룸 상세 정보를 빼고 예약 가능 룸의 biz_item_id만 남긴 응답으로 변환합니다."""
+    return CompactAvailabilityResponse(
+        date=response.date,
+        start_hour=response.start_hour,
+        end_hour=response.end_hour,
+        hour_slots=response.hour_slots,
+        rooms=[
+            CompactRoomAvailability(
+                biz_item_id=res.room_detail.biz_item_id,
+                checked_at=res.checked_at,
+            )
+            for res in response.results
+        ],
+        branch_summary=response.branch_summary,
+    )
+
+
+@router.get(
+    "/stream",
+    summary="합주실 지도 기반 검색 - 스트리밍 (NDJSON)",
+    description="""
+`/api/rooms/availability`와 같은 조건으로 검색하되, 플랫폼(크롤러)별 조회가 끝나는 대로 결과를 한 줄씩(NDJSON) 전송합니다.
+
+각 줄은 `{"type": ..., "data": ...}` 형식입니다.
+- `room`: 예약 가능한 룸 1개 (RoomAvailability)
+- `branch_summary`: 이번에 갱신된 지점만 담은 지점 요약 delta (business_id → BranchStats)
+- `summary`: 마지막 프레임 (전체 branch_summary, available_biz_item_ids, 조회 실패 룸 수)
+
+요청 파라미터 오류는 스트리밍 시작 전에 일반 에러 응답(Envelope)으로 반환됩니다.
+""",
+    response_class=StreamingResponse,
+)
+@limiter.limit(f"{RATE_LIMIT_PER_MINUTE}/minute")  # Rate Limit 적용
+async def stream_room_availability(
+    request: Request,
+    date: str = Query(..., description="날짜 (YYYY-MM-DD)"),
+    capacity: int = Query(..., description="사용 인원 수"),
+    start_hour: str = Query(..., description="시작 시간 (HH:MM)"),
+    end_hour: str = Query(..., description="종료 시간 (HH:MM)"),
+    swLat: float = Query(..., description="남서쪽 위도 (필수)"),
+    swLng: float = Query(..., description="남서쪽 경도 (필수)"),
+    neLat: float = Query(..., description="북동쪽 위도 (필수)"),
+    neLng: float = Query(..., description="북동쪽 경도 (필수)"),
+    mode: Literal["live", "snapshot"] = Query("live", description="조회 방식 (live: 실시간 / snapshot: 백그라운드 스냅샷 우선)"),
+    service: AvailabilityService = Depends(get_availability_service)
+):
+    """
+    크롤러가 끝나는 순서대로 예약 가능 룸과 지점 요약 delta를 NDJSON으로 스트리밍합니다.
+
+    Returns:
+        StreamingResponse: application/x-ndjson 스트림 (마지막 줄은 summary 프레임)
+
+    Raises:
+        HTTPException: 유효하지 않은 파라미터 시 400 에러 (스트리밍 시작 전)
+    """
+    svc_request = AvailabilityRequest(
+        date = date,
+        capacity = capacity,
+        start_hour = start_hour,
+        end_hour = end_hour,
+        swLat = swLat,
+        swLng = swLng,
+        neLat = neLat,
+        neLng = neLng,
+        mode = mode
+    )
+
+    frames = await service.stream_availability(request=svc_request)
+    return StreamingResponse(_encode_ndjson(frames), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/windows",
+    response_model=ApiResponse[FreeWindowSearchResponse],
+    summary="빈 시간대 검색 (날짜 범위 + 연속 이용 시간)",
+    description="""
+날짜 범위(최대 7일) 안에서 `duration`시간 이상 연속으로 예약 가능한 구간을 지도 영역 내 룸별로 모두 찾습니다.
+구간은 최대 길이로 반환되며 `end_hour`는 구간의 마지막 정시 슬롯입니다. (예: 18:00 ~ 21:00 → 4시간)
+빈 구간이 없는 룸은 결과에서 제외됩니다.
+""",
+)
+@limiter.limit(f"{RATE_LIMIT_PER_MINUTE}/minute")  # Rate Limit 적용
+async def search_free_windows(
+    request: Request,
+    start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    duration: int = Query(..., ge=1, le=24, description="연속 이용 시간 (시간)"),
+    capacity: int = Query(..., description="사용 인원 수"),
+    swLat: float = Query(..., description="남서쪽 위도 (필수)"),
+    swLng: float = Query(..., description="남서쪽 경도 (필수)"),
+    neLat: float = Query(..., description="북동쪽 위도 (필수)"),
+    neLng: float = Query(..., description="북동쪽 경도 (필수)"),
+    service: AvailabilityService = Depends(get_availability_service)
+):
+    """
+    날짜 범위 안의 룸별 연속 빈 시간대를 조회합니다.
+
+    Returns:
+        ApiResponse[FreeWindowSearchResponse]: 빈 구간이 있는 룸과 구간 목록
+
+    Raises:
+        HTTPException: 유효하지 않은 날짜 범위 / 좌표 시 400 에러
+    """
+    svc_request = FreeWindowRequest(
+        start_date = start_date,
+        end_date = end_date,
+        duration = duration,
+        capacity = capacity,
+        swLat = swLat,
+        swLng = swLng,
+        neLat = neLat,
+        neLng = neLng
+    )
+
+    result = await service.find_free_windows(svc_request)
+    return EnvelopeJSONResponse(ApiResponse[FreeWindowSearchResponse].success(result=result))
+
+
+@router.get(
+    "/recheck",
+    response_model=ApiResponse[RoomAvailability],
+    summary="룸 1개 실시간 재조회 (예약 직전 확인)",
+    description="""
+캐시와 스냅샷을 거치지 않고 업스트림에서 룸 1개의 예약 가능 여부를 다시 조회합니다.
+결과에는 조회 시각(`checked_at`)이 포함되며, 조회한 일정은 스냅샷에도 반영됩니다.
+""",
+)
+@limiter.limit(f"{RATE_LIMIT_PER_MINUTE}/minute")  # Rate Limit 적용
+async def recheck_room_availability(
+    request: Request,
+    date: str = Query(..., description="날짜 (YYYY-MM-DD)"),
+    start_hour: str = Query(..., description="시작 시간 (HH:MM)"),
+    end_hour: str = Query(..., description="종료 시간 (HH:MM)"),
+    business_id: str = Query(..., description="지점 ID"),
+    biz_item_id: str = Query(..., description="룸 ID"),
+    service: AvailabilityService = Depends(get_availability_service)
+):
+    """
+    룸 1개의 예약 가능 여부를 실시간으로 재조회합니다.
+
+    Returns:
+        ApiResponse[RoomAvailability]: 요청 시간대의 예약 가능 여부 (checked_at 포함)
+
+    Raises:
+        HTTPException: 유효하지 않은 파라미터 시 400, 룸이 없으면 404
+    """
+    result = await service.recheck_room(date, start_hour, end_hour, business_id, biz_item_id)
+    return ApiResponse.success(result=result)
+
+
+@router.get(
+    "/changes",
+    summary="예약 현황 변경분 구독 (SSE)",
+    description="""
+지정한 날짜와 지도 영역의 룸 중 예약 현황이 바뀐 룸의 변경분만 Server-Sent Events로 전송합니다.
+(실시간 조회 / 백그라운드 스냅샷 갱신 / recheck로 업스트림에서 새 일정을 받을 때 직전에 본 일정과 비교)
+
+이벤트 종류:
+- `delta`: 룸 1개의 변경분 (`booked`: 새로 예약된 슬롯, `freed`: 새로 비워진 슬롯, `unknown`: 조회 불가로 바뀐 슬롯)
+- `resync`: 전달하지 못한 변경분이 쌓여 버려졌으므로 전체 조회(`/api/rooms/availability`)로 다시 동기화 필요
+
+초기 상태는 `/api/rooms/availability?mode=snapshot`으로 조회한 뒤 구독하세요.
+""",
+    response_class=StreamingResponse,
+)
+@limiter.limit(f"{RATE_LIMIT_PER_MINUTE}/minute")  # Rate Limit 적용
+async def stream_availability_changes(
+    request: Request,
+    date: str = Query(..., description="날짜 (YYYY-MM-DD)"),
+    swLat: float = Query(..., description="남서쪽 위도 (필수)"),
+    swLng: float = Query(..., description="남서쪽 경도 (필수)"),
+    neLat: float = Query(..., description="북동쪽 위도 (필수)"),
+    neLng: float = Query(..., description="북동쪽 경도 (필수)"),
+    feed: AvailabilityChangeFeed = Depends(get_change_feed)
+):
+    """
+    날짜 + 지도 영역의 예약 현황 변경분을 SSE로 전송합니다.
+
+    Returns:
+        StreamingResponse: text/event-stream (연결이 끊길 때까지 유지)
+
+    Raises:
+        HTTPException: 유효하지 않은 날짜 / 좌표 시 400 에러 (스트리밍 시작 전)
+    """
+    validate_date(date)
+    validate_map_coordinates(swLat, swLng, neLat, neLng)
+
+    subscription = feed.subscribe(date, swLat, swLng, neLat, neLng)
+    return StreamingResponse(
+        _encode_sse(feed, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _encode_sse(
+    feed: AvailabilityChangeFeed, subscription: ChangeSubscription, keepalive_seconds: float = SSE_KEEPALIVE_SECONDS
+) -> AsyncIterator[bytes]:
+    """구독 큐의 delta를 SSE 이벤트로 직렬화 (연결 종료 시 구독 해제)"""
+    try:
+        yield b": subscribed\n\n"
+        while True:
+            try:
+                item = await asyncio.wait_for(subscription.queue.get(), timeout=keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if item == RESYNC:
+                yield b"event: resync\ndata: {}\n\n"
+            else:
+                yield f"event: delta\ndata: {item.model_dump_json()}\n\n".encode("utf-8")
+    finally:
+        feed.unsubscribe(subscription)
+
+
+async def _encode_ndjson(frames) -> AsyncIterator[bytes]:
+    """(type, data) 프레임을 NDJSON 한 줄로 직렬화 (일반 응답과 동일하게 alias 기준)"""
+    async for frame_type, data in frames:
+        line = json.dumps(
+            {"type": frame_type, "data": jsonable_encoder(data, by_alias=True)},
+            ensure_ascii=False,
+        )
+        yield (line + "\n").encode("utf-8")
@@ -1,9 +1,15 @@
 from __future__ import annotations
 from fastapi import Depends, Header, HTTPException
+import secrets
 import uuid
+from app.core.config import IS_DEBUG, MONITORING_API_KEY
 from app.crawler.base import BaseCrawler
 from app.crawler.registry import registry
 from app.services.availability_service import AvailabilityService
+from app.services.availability_cache import AvailabilityCache, availability_cache
+from app.services.availability_snapshot import AvailabilitySnapshotStore, availability_snapshots
+from app.services.availability_changes import AvailabilityChangeFeed, availability_changes
+from app.utils.circuit_breaker import CircuitBreakerRegistry, circuit_breakers
 
 # --- Favorites API Dependencies ---
 from app.repositories.base import IFavoriteRepository
@@ -21,11 +27,34 @@ def get_crawlers_map() -> dict[str, BaseCrawler]:
     return registry.get_all_map()
 
 
+def get_availability_cache() -> AvailabilityCache:
+    """프로세스 전역 예약 현황 캐시 반환 (요청 간 공유)."""
+    return availability_cache
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """프로세스 전역 서킷 브레이커 저장소 반환 (요청 간 공유)."""
+    return circuit_breakers
+
+
+def get_snapshot_store() -> AvailabilitySnapshotStore:
+    """프로세스 전역 예약 현황 스냅샷 저장소 반환 (백그라운드 스케줄러와 공유)."""
+    return availability_snapshots
+
+
+def get_change_feed() -> AvailabilityChangeFeed:
+    """프로세스 전역 예약 현황 변경분 구독 관리자 반환 (스냅샷 저장소가 발행)."""
+    return availability_changes
+
+
 def get_availability_service(
-    crawlers_map: dict[str, BaseCrawler] = Depends(get_crawlers_map)
+    crawlers_map: dict[str, BaseCrawler] = Depends(get_crawlers_map),
+    cache: AvailabilityCache = Depends(get_availability_cache),
+    breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers),
+    snapshots: AvailabilitySnapshotStore = Depends(get_snapshot_store),
 ) -> AvailabilityService:
     """AvailabilityService 인스턴스 반환 (DI용)."""
-    return AvailabilityService(crawlers_map)
+    return AvailabilityService(crawlers_map, cache=cache, breakers=breakers, snapshots=snapshots)
 
 
 from functools import lru_cache
@@ -62,3 +91,21 @@ def validate_device_id(
         raise HTTPException(status_code=400, detail="Invalid X-Device-Id format")
     
     return x_device_id
+
+
+def require_monitoring_access(
+    x_admin_key: str | None = Header(default=None, alias="X-Admin-Key")
+) -> None:
+    """
+    운영 모니터링 API 접근 검증 Dependency
+
+    개발 환경(IS_DEBUG)에서는 항상 허용하고, 그 외에는 X-Admin-Key 헤더가
+    MONITORING_API_KEY와 일치할 때만 허용합니다. (키 미설정 시 운영 환경에서는 차단)
+
+    Raises:
+        HTTPException(403): 접근 키가 없거나 일치하지 않는 경우
+    """
+    if IS_DEBUG:
+        return
+    if not MONITORING_API_KEY or not x_admin_key or not secrets.compare_digest(x_admin_key, MONITORING_API_KEY):
+        raise HTTPException(status_code=403, detail="Monitoring access denied")
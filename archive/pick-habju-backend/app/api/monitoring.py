@@ -0,0 +1,47 @@
+"""
+운영 모니터링 API (/api/monitoring)
+
+업스트림(네이버, 드림, 그루브) 보호 장치의 현재 상태를 조회합니다.
+- 서킷 브레이커: 크롤러 / 호스트별 상태(closed, open, half_open), 연속 실패 횟수
+- 업스트림 제한기: 호스트별 현재 동시 요청 한도, 진행 중 요청 수, 초당 요청 한도
+- 파싱 실행기: 프로세스 풀 대기 작업 수, 인라인 / 풀 파싱 횟수와 소요 시간
+- 요청 합치기: 진행 중 요청 수, 실제 전송 / 합류한 호출 수
+- 예약 현황 스냅샷: 저장된 룸 일정 수, 날짜 수, 가장 오래된 스냅샷 경과 시간
+- 변경분 구독: 구독자 수, 발행된 변경분 수
+
+개발 환경(IS_DEBUG)이 아니면 X-Admin-Key 헤더(MONITORING_API_KEY)가 필요합니다.
+"""
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_circuit_breakers, require_monitoring_access
+from app.core.response import ApiResponse
+from app.services.availability_changes import availability_changes
+from app.services.availability_snapshot import availability_snapshots
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from app.utils.parse_executor import parse_executor
+from app.utils.request_coalescer import request_coalescer
+from app.utils.upstream_limiter import upstream_limiters
+
+router = APIRouter(prefix="/api/monitoring", tags=["모니터링"], dependencies=[Depends(require_monitoring_access)])
+
+
+@router.get(
+    "/upstreams",
+    response_model=ApiResponse[dict],
+    summary="업스트림 서킷 브레이커 / 요청 제한 / 파싱 실행기 상태 조회",
+)
+async def get_upstream_status(breakers: CircuitBreakerRegistry = Depends(get_circuit_breakers)):
+    """
+    서킷 브레이커, 업스트림 제한기, 파싱 실행기의 현재 상태를 반환합니다.
+
+    Returns:
+        ApiResponse[dict]: {"circuit_breakers": [...], "upstream_limiters": [...], "parse_executor": {...}, "request_coalescer": {...}, "snapshots": {...}, "changes": {...}}
+    """
+    return ApiResponse.success(result={
+        "circuit_breakers": breakers.snapshot(),
+        "upstream_limiters": upstream_limiters.snapshot(),
+        "parse_executor": parse_executor.snapshot(),
+        "request_coalescer": request_coalescer.snapshot(),
+        "snapshots": availability_snapshots.snapshot(),
+        "changes": availability_changes.snapshot(),
+    })
@@ -0,0 +1,77 @@
+import hashlib
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Header, Response, status
+from app.core.config import ROOM_CATALOG_MAX_AGE_SECONDS
+from app.core.response import ApiResponse, EnvelopeJSONResponse
+from app.models.dto import RoomCatalogResponse, RoomDetail
+from app.utils.room_loader import get_room_catalog
+
+router = APIRouter(prefix="/api/rooms/catalog", tags=["룸 카탈로그"])
+
+
+class RoomCatalogEncoder:
+    """
+    카탈로그 응답 본문과 ETag를 보관하여 카탈로그가 바뀔 때만 다시 직렬화합니다.
+
+    설계 결정:
+    - 룸 인덱스는 갱신될 때마다 새 리스트를 만들므로 리스트 객체가 같으면 내용도 같음
+      (보관 중인 리스트를 참조로 잡고 있어 객체 id 재사용 문제 없음)
+    - ETag는 응답 본문의 해시 → 카탈로그 내용이 같으면 서버 재시작 후에도 같은 값
+    """
+
+    def __init__(self):
+        self._rooms: Optional[List[RoomDetail]] = None
+        self._body = b""
+        self._etag = ""
+
+    def encode(self, rooms: List[RoomDetail]) -> Tuple[bytes, str]:
+        if rooms is not self._rooms:
+            envelope = ApiResponse[RoomCatalogResponse].success(result=RoomCatalogResponse(rooms=rooms))
+            body = EnvelopeJSONResponse(envelope).body
+            self._rooms, self._body = rooms, body
+            self._etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return self._body, self._etag
+
+    def clear(self):
+        self._rooms, self._body, self._etag = None, b"", ""
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 (약한 비교, 목록 / * 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+@router.get(
+    "",
+    response_model=ApiResponse[RoomCatalogResponse],
+    summary="룸 카탈로그 전체 조회 (ETag 캐시)",
+    description="""
+`/api/rooms/availability?compact=true` 응답의 `biz_item_id`로 룸 상세 정보(이미지, 인원, 가격, 좌표 등)를 찾기 위한 카탈로그입니다.
+
+응답에는 `ETag`와 `Cache-Control`이 포함됩니다. 다음 요청에 `If-None-Match`로 ETag를 보내면
+카탈로그가 바뀌지 않은 경우 본문 없이 `304 Not Modified`를 반환합니다.
+""",
+)
+def get_catalog(
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag"),
+):
+    """
+    예약 가능 여부 조회(get_rooms_by_criteria)와 같은 룸 인덱스에서 카탈로그 전체를 반환합니다.
+
+    Returns:
+        ApiResponse[RoomCatalogResponse]: 룸 카탈로그 (변경이 없으면 304)
+    """
+    body, etag = room_catalog_encoder.encode(get_room_catalog())
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={ROOM_CATALOG_MAX_AGE_SECONDS}"}
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Global singleton instance
+room_catalog_encoder = RoomCatalogEncoder()
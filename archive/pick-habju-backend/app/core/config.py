@@ -33,6 +33,70 @@ SUPABASE_TABLE = os.getenv("SUPABASE_TABLE", "v_full_info")
 
 RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "5"))
 
+# 룸별 예약 현황 캐시 TTL (초). 0이면 캐시를 사용하지 않습니다.
+AVAILABILITY_CACHE_TTL_SECONDS = float(os.getenv("AVAILABILITY_CACHE_TTL_SECONDS", "30"))
+
+# 룸 카탈로그 공간 인덱스 갱신 주기 (초). 룸 수집 스크립트의 변경도 이 주기로만 반영됩니다. 0이면 매 요청 Supabase 범위 쿼리를 사용합니다.
+ROOM_INDEX_TTL_SECONDS = float(os.getenv("ROOM_INDEX_TTL_SECONDS", "300"))
+# 룸 카탈로그 엔드포인트 응답의 클라이언트 캐시 유효 시간 (초). 이후에는 ETag로 재검증합니다.
+ROOM_CATALOG_MAX_AGE_SECONDS = int(os.getenv("ROOM_CATALOG_MAX_AGE_SECONDS", "300"))
+
+# 룸 수집 작업의 지도 검색 방식 (browser: Playwright로 pcmap 페이지 렌더링 / http: 장소 검색 GraphQL API 직접 호출)
+MAP_SEARCH_BACKEND = os.getenv("MAP_SEARCH_BACKEND", "browser")
+
+# 그루브 로그인 세션 재사용 최대 시간 (초). 지나면 다음 요청 시 다시 로그인합니다.
+GROOVE_SESSION_TTL_SECONDS = float(os.getenv("GROOVE_SESSION_TTL_SECONDS", "600"))
+
+# 네이버 schedule 조회 시 한 GraphQL 요청에 묶을 최대 룸 수 (같은 business_id 기준). 1이면 룸별 개별 요청.
+NAVER_BATCH_SIZE = int(os.getenv("NAVER_BATCH_SIZE", "10"))
+
+# 예약 가능 여부 조회 시 크롤러별 응답 대기 한도 (초). 넘기면 해당 크롤러의 룸은 "unknown"으로 응답합니다. 0이면 제한 없음.
+AVAILABILITY_DEADLINE_SECONDS = float(os.getenv("AVAILABILITY_DEADLINE_SECONDS", "8"))
+
+# 빈 시간대 검색(/api/rooms/availability/windows)에서 한 번에 조회할 수 있는 최대 일수
+FREE_WINDOW_MAX_DAYS = int(os.getenv("FREE_WINDOW_MAX_DAYS", "7"))
+
+# 네이버 요청 헤징: 최근 응답 시간의 이 백분위수를 넘기면 같은 요청을 한 번 더 보냅니다. 0이면 헤징하지 않습니다.
+NAVER_HEDGE_PERCENTILE = float(os.getenv("NAVER_HEDGE_PERCENTILE", "0.95"))
+
+# 서킷 브레이커: 연속 실패 CIRCUIT_FAILURE_THRESHOLD회면 열리고, CIRCUIT_RECOVERY_SECONDS 후 시험 요청(half-open)을 허용합니다.
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RECOVERY_SECONDS = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30"))
+CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1"))
+
+# 크롤러 응답 파싱용 프로세스 풀 워커 수. 0이면 항상 이벤트 루프에서 파싱합니다.
+PARSE_POOL_WORKERS = int(os.getenv("PARSE_POOL_WORKERS", "2"))
+# 이 크기(문자 수) 미만의 응답은 프로세스 간 전달 비용이 더 크므로 이벤트 루프에서 바로 파싱합니다.
+PARSE_INLINE_THRESHOLD_BYTES = int(os.getenv("PARSE_INLINE_THRESHOLD_BYTES", "32768"))
+
+# 예약 현황 스냅샷: 오늘부터 며칠간의 하루 일정을 백그라운드에서 미리 조회할지. 0이면 스케줄러를 실행하지 않습니다.
+AVAILABILITY_SNAPSHOT_DAYS = int(os.getenv("AVAILABILITY_SNAPSHOT_DAYS", "0"))
+# 스냅샷 기본 갱신 주기 (초). 먼 날짜는 SNAPSHOT_DISTANCE_DAYS일마다 기본 주기만큼 길어지고, 조회가 많은 날짜/지점은 짧아집니다.
+SNAPSHOT_REFRESH_SECONDS = float(os.getenv("SNAPSHOT_REFRESH_SECONDS", "120"))
+SNAPSHOT_MIN_REFRESH_SECONDS = float(os.getenv("SNAPSHOT_MIN_REFRESH_SECONDS", "30"))
+SNAPSHOT_DISTANCE_DAYS = float(os.getenv("SNAPSHOT_DISTANCE_DAYS", "7"))
+# 조회 수요(날짜/지점별 최근 조회 수) 감쇠 반감기 (초)
+SNAPSHOT_DEMAND_HALF_LIFE_SECONDS = float(os.getenv("SNAPSHOT_DEMAND_HALF_LIFE_SECONDS", "600"))
+# 이 시간(초)보다 오래된 스냅샷은 사용하지 않고 실시간 조회로 대체합니다.
+SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("SNAPSHOT_MAX_AGE_SECONDS", "900"))
+# 스냅샷 스케줄러 실행 권한 파일 잠금 경로. 같은 호스트의 여러 워커 중 잠금을 잡은 프로세스 하나만 스케줄러를 실행합니다. (빈 값이면 잠금 없이 실행)
+SNAPSHOT_SCHEDULER_LOCK_FILE = os.getenv("SNAPSHOT_SCHEDULER_LOCK_FILE", "/tmp/pick-habju-snapshot-scheduler.lock")
+
+# 업스트림별 (동시 요청 수 상한, 초당 요청 수 상한). 크롤러 타입 기준이며 AIMD로 이 범위 안에서 자동 조절됩니다.
+UPSTREAM_LIMITS = {
+    "naver": (
+        int(os.getenv("NAVER_MAX_CONCURRENCY", "16")),
+        float(os.getenv("NAVER_RATE_PER_SECOND", "30")),
+    ),
+    "dream": (
+        int(os.getenv("DREAM_MAX_CONCURRENCY", "6")),
+        float(os.getenv("DREAM_RATE_PER_SECOND", "10")),
+    ),
+}
+
+# 운영 모니터링 API(/api/monitoring) 접근 키. X-Admin-Key 헤더와 일치해야 하며, 미설정 시 개발 환경(IS_DEBUG)에서만 허용합니다.
+MONITORING_API_KEY = os.getenv("MONITORING_API_KEY")
+
 if not SUPABASE_URL or not SUPABASE_KEY:
     raise ValueError("SUPABASE_URL과 SUPABASE_KEY 환경변수가 필요합니다.")
 
@@ -1,5 +1,7 @@
 from typing import TypeVar, Generic, Optional, Any
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import to_json
 from app.core.error_codes import ErrorCode
 
 # Rationale:
@@ -81,6 +83,28 @@ class ApiResponse(BaseModel, Generic[T]):
         )
 
 
+class EnvelopeJSONResponse(JSONResponse):
+    """
+    ApiResponse(pydantic 모델)를 pydantic-core 직렬화기로 바로 bytes로 만드는 JSON 응답
+
+    엔드포인트가 이 응답 객체를 직접 반환하면 FastAPI는 response_model 재검증과
+    jsonable_encoder(dict 변환) → json.dumps 단계를 건너뜁니다.
+    출력 바이트는 기본 JSONResponse(by_alias, ensure_ascii=False, 공백 없는 구분자)와 같습니다.
+
+    Rationale:
+        - 지도 영역이 넓으면 수백 개 룸의 RoomDetail이 응답에 실리며, 기본 경로에서는
+          같은 모델을 다시 검증하고 Python dict로 풀어낸 뒤 문자열로 만드는 비용이 직렬화 대부분을 차지함
+        - pydantic-core(Rust) 직렬화기를 그대로 쓰므로 orjson 등 추가 의존성이 필요 없음
+        - response_model은 데코레이터에 그대로 두어 OpenAPI 스키마는 유지
+        - ApiResponse[구체 타입]으로 만들어 넘기면 result도 타입에 맞춘 직렬화기를 사용 (Any 추론보다 빠름)
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return to_json(content, by_alias=True)
+        return super().render(content)
+
+
 class ValidationErrorDetail(BaseModel):
     """
     Validation 에러의 상세 정보를 담는 모델
@@ -1,39 +1,79 @@
 from abc import ABC, abstractmethod
 from typing import List, Union
-from app.models.dto import RoomDetail, RoomAvailability
+from app.models.dto import RoomDetail, RoomAvailability, DaySchedule
+from app.utils.slot_mask import FULL_DAY_SLOTS
 
 RoomResult = Union[RoomAvailability, Exception]
+DayResult = Union[DaySchedule, Exception]
+
+
+def slice_day_results(results: List[DayResult], hour_slots: List[str]) -> List[RoomResult]:
+    """DaySchedule 결과 리스트를 요청 시간대 기준 RoomAvailability 리스트로 변환.
+
+    Exception은 그대로 유지하여 기존 check_availability 계약과 동일한 형태를 반환합니다.
+    """
+    return [
+        result.to_room_availability(hour_slots) if isinstance(result, DaySchedule) else result
+        for result in results
+    ]
+
 
 class BaseCrawler(ABC):
     """
     모든 크롤러가 구현해야 하는 기본 인터페이스.
-    
+
     새로운 합주실 크롤러를 추가할 때:
     1. 이 클래스를 상속받아 구현
     2. check_availability 메서드 구현
-    3. 모듈 하단에서 registry.register()로 등록
-    
+    3. (선택) 하루 전체 일정을 한 번에 받아오는 경우 fetch_day_schedules 재정의
+    4. 모듈 하단에서 registry.register()로 등록
+
     Example:
         class NewCrawler(BaseCrawler):
             async def check_availability(self, ...):
                 # 구현
                 pass
-        
+
         registry.register("new", NewCrawler())
     """
     @abstractmethod
     async def check_availability(self, date: str, hour_slots: List[str], target_rooms: List[RoomDetail]) -> List[RoomResult]:
         """
         주어진 날짜와 시간대에 대한 방 예약 가능 여부를 확인.
-        
+
         Args:
             date: 조회할 날짜 (YYYY-MM-DD 형식)
             hour_slots: 조회할 시간대 리스트 (예: ["18:00", "19:00"])
             target_rooms: 조회할 방 정보 리스트
-            
+
         Returns:
             RoomAvailability 또는 Exception 리스트
             - 성공 시: RoomAvailability 객체 반환
             - 실패 시: Exception 반환 (로깅용)
         """
         pass
+
+    async def fetch_day_schedules(self, date: str, target_rooms: List[RoomDetail]) -> List[DayResult]:
+        """
+        주어진 날짜의 하루 전체(00시~23시) 예약 현황을 룸별로 조회.
+
+        기본 구현은 check_availability를 하루 전체 슬롯으로 호출한 뒤 변환합니다.
+        업스트림이 하루치 데이터를 한 번에 내려주는 크롤러는 이 메서드를 재정의하고
+        check_availability는 slice_day_results로 위임하는 것을 권장합니다.
+
+        Args:
+            date: 조회할 날짜 (YYYY-MM-DD 형식)
+            target_rooms: 조회할 방 정보 리스트
+
+        Returns:
+            target_rooms 순서와 동일한 DaySchedule 또는 Exception 리스트
+        """
+        results = await self.check_availability(date, FULL_DAY_SLOTS, target_rooms)
+        return [
+            DaySchedule(
+                room_detail=result.room_detail,
+                date=date,
+                hourly=[result.available_slots.get(slot, False) for slot in FULL_DAY_SLOTS],
+            ) if isinstance(result, RoomAvailability) else result
+            for result in results
+        ]
@@ -1,23 +1,67 @@
 from app.exception.crawler.dream_exception import DreamRequestError
-from bs4 import BeautifulSoup
 import html
+import re
 import sys
 import asyncio
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from app.models.dto import RoomDetail, RoomAvailability
+from app.models.dto import RoomDetail, DaySchedule
 from app.utils.client_loader import load_client
+from app.utils.parse_executor import parse_executor
 from app.exception.base_exception import BaseCustomException
 from app.exception.crawler.dream_exception import DreamAvailabilityError
 
-from app.crawler.base import BaseCrawler, RoomResult
+from app.crawler.base import BaseCrawler, RoomResult, DayResult, slice_day_results
 from app.crawler.registry import registry
 
 
 
 sys.stdout.reconfigure(encoding='utf-8')
 
+
+# label 시작 태그 (따옴표 안의 '>'는 태그 끝으로 보지 않음)
+_LABEL_TAG_RE = re.compile(r"""<label\b(?:[^>"']|"[^"]*"|'[^']*')*>""", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([^\s=/>"']+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+))""")
+# title 속성의 정각 표기 (예: "2024-05-20 14시00분 (월)" -> 14)
+_HOUR_RE = re.compile(r"(\d{2})시00분")
+
+
+def _label_attrs(tag: str) -> dict:
+    attrs = {}
+    for match in _ATTR_RE.finditer(tag, 6):
+        name = match.group(1).lower()
+        if name not in attrs:  # 중복 속성은 HTML 파서처럼 처음 값 사용
+            attrs[name] = next(g for g in match.groups()[1:] if g is not None)
+    return attrs
+
+
+def parse_day_hourly(items_html: str) -> List[bool]:
+    """HTML의 label 태그를 한 번만 훑어 0~23시 예약 가능 여부를 파싱합니다.
+
+    설계 결정:
+    - 시간대마다 문서 전체를 다시 탐색하지 않고, label 태그를 한 번 훑으며 {시: active 여부} 색인 생성
+      (요청 시간대 수와 무관하게 비용이 일정)
+    - 판정 기준은 기존과 동일: title에 "HH시00분"이 포함된 첫 번째 label의 class에 active가 있으면 예약 가능,
+      해당 label이 없으면 예약 불가
+    - 파싱 실행기(parse_executor)가 프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둠
+    """
+    hourly: List[Optional[bool]] = [None] * 24
+
+    for tag in _LABEL_TAG_RE.finditer(items_html):
+        attrs = _label_attrs(tag.group(0))
+        title = attrs.get("title")
+        if not title:
+            continue
+        active = "active" in attrs.get("class", "").split()
+        for hour_str in _HOUR_RE.findall(title):
+            hour = int(hour_str)
+            if hour < 24 and hourly[hour] is None:
+                hourly[hour] = active
+
+    return [bool(ok) for ok in hourly]
+
+
 class DreamCrawler(BaseCrawler):
     _URL = "https://www.xn--hy1bm6g6ujjkgomr.com/plugin/wz.bookingT1.prm/ajax.calendar.time.php"
     HEADERS = {
@@ -27,22 +71,19 @@ class DreamCrawler(BaseCrawler):
     DATE_LIMIT_DAYS = 121  # Reservation window limit per Dream policy.
 
     async def check_availability(self, date: str, hour_slots: List[str], target_rooms: List[RoomDetail]) -> List[RoomResult]:
+        # 드림은 하루치 캘린더 HTML을 내려주므로 DaySchedule에서 요청 시간대만 추출
+        return slice_day_results(await self.fetch_day_schedules(date, target_rooms), hour_slots)
+
+    async def fetch_day_schedules(self, date: str, target_rooms: List[RoomDetail]) -> List[DayResult]:
         today = datetime.strptime(datetime.now().strftime('%Y-%m-%d'), '%Y-%m-%d').date()
         target_date = datetime.strptime(date, '%Y-%m-%d').date()
 
         if (target_date - today).days >= self.DATE_LIMIT_DAYS:
-            return [
-                RoomAvailability(
-                    room_detail=room,
-                    available="unknown",
-                    available_slots={hour_str: "unknown" for hour_str in hour_slots},
-                )
-                for room in target_rooms
-            ]
-
-        async def safe_fetch(room: RoomDetail) -> RoomResult:
+            return [DaySchedule.unknown(room, date) for room in target_rooms]
+
+        async def safe_fetch(room: RoomDetail) -> DayResult:
             try:
-                return await self._fetch_dream_availability_room(date, hour_slots, room)
+                return await self._fetch_dream_day_schedule(date, room)
             except BaseCustomException as e:
                 return e
             except Exception as e:
@@ -51,13 +92,13 @@ class DreamCrawler(BaseCrawler):
 
         return await asyncio.gather(*[safe_fetch(room) for room in target_rooms])
 
-    async def _fetch_dream_availability_room(self, date: str, hour_slots: List[str], room: RoomDetail) -> RoomAvailability:
+    async def _fetch_dream_day_schedule(self, date: str, room: RoomDetail) -> DaySchedule:
         data = {
             'rm_ix': room.biz_item_id,
             'sch_date': date
         }
 
-        response = await load_client(self._URL, headers=self.HEADERS, data=data)
+        response = await load_client(self._URL, upstream="dream", coalesce=True, headers=self.HEADERS, data=data)
 
         try:
             response_data = response.json()
@@ -69,36 +110,14 @@ class DreamCrawler(BaseCrawler):
         except Exception as e:
             raise DreamAvailabilityError(f"[{room.name}] 응답 아이템 읽기 오류: {e}")
 
-        # BeautifulSoup으로 파싱
-        available_slots = self._parse_html_content(items_html, hour_slots)
-        available = all(available_slots.values())
-
-        return RoomAvailability(
-            room_detail=room,
-            available=available,
-            available_slots=available_slots
-        )
-
-    def _parse_html_content(self, items_html: str, hour_slots: List[str]) -> dict:
-        """BeautifulSoup을 사용하여 HTML에서 시간대별 예약 가능 여부를 파싱합니다."""
-        soup = BeautifulSoup(items_html, "lxml")
-        available_slots = {}
-
-        for time in hour_slots:
-            target_time = time.split(":")[0] + "시00분"  # 예: "14:00" -> "14시00분"
-
-            # title 속성에 target_time이 포함된 label 태그 찾기
-            # 예: title="2024-05-20 14시00분 (월)"
-            label = soup.find('label', title=lambda t: t and isinstance(t, str) and target_time in t)
+        # 하루 전체 시간대 파싱 (큰 응답은 프로세스 풀에서 처리)
+        hourly = await parse_executor.run(parse_day_hourly, items_html)
 
-            if label:
-                # class 속성에 'active'가 있으면 예약 가능
-                classes = label.get("class", [])
-                available_slots[time] = "active" in classes
-            else:
-                available_slots[time] = False
+        return DaySchedule(room_detail=room, date=date, hourly=hourly)
 
-        return available_slots
+    def _parse_day_hourly(self, items_html: str) -> List[bool]:
+        """HTML에서 0~23시 예약 가능 여부를 파싱합니다."""
+        return parse_day_hourly(items_html)
 
 # Register the crawler
 registry.register("dream", DreamCrawler())
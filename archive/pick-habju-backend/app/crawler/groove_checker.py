@@ -1,21 +1,53 @@
-from typing import List
-from bs4 import BeautifulSoup
+import re
+from typing import Dict, List, Tuple
 import httpx
-import asyncio
 from datetime import datetime
 
 from app.core.config import GROOVE_RESERVE_URL, GROOVE_RESERVE_URL1
 from app.exception.crawler.groove_exception import GrooveCredentialError, GrooveLoginError
-from app.utils.login import LoginManager
-from app.models.dto import RoomAvailability, RoomDetail
+from app.utils.login import groove_session
+from app.utils.parse_executor import parse_executor
+from app.models.dto import DaySchedule, RoomDetail
 
-from app.crawler.base import BaseCrawler, RoomResult
+from app.crawler.base import BaseCrawler, RoomResult, DayResult, slice_day_results
 from app.crawler.registry import registry
 
+# 예약 테이블의 슬롯 태그 (예: <div id="reserve_time_13_18" class="reserve_time_off">)
+_SLOT_TAG_RE = re.compile(r"<[a-zA-Z][^<>]*?reserve_time_[^<>]*>")
+_SLOT_ID_RE = re.compile(r"""(?<![\w-])id\s*=\s*["']?reserve_time_([^"'\s>]+)_(\d+)["'\s>]""")
+_CLASS_RE = re.compile(r"""(?<![\w-])class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+
+def parse_reserve_table(html: str) -> Dict[Tuple[str, int], bool]:
+    """예약 테이블 HTML을 한 번만 훑어 {(룸 id, 시): 예약 가능 여부} 맵을 만듭니다.
+
+    설계 결정:
+    - 전체 DOM 트리를 만들지 않고 reserve_time_ 이 들어간 시작 태그만 정규식으로 추출
+      (룸 × 시간마다 CSS 선택자로 트리를 다시 탐색하던 방식은 룸 수에 대해 제곱으로 증가)
+    - 판정 기준은 기존 선택자(#reserve_time_{id}_{시}.reserve_time_off)와 동일:
+      해당 id의 태그에 reserve_time_off 클래스가 있으면 예약 가능
+    """
+    slots: Dict[Tuple[str, int], bool] = {}
+    for tag in _SLOT_TAG_RE.finditer(html):
+        text = tag.group(0)
+        id_match = _SLOT_ID_RE.search(text)
+        if id_match is None:
+            continue
+        class_match = _CLASS_RE.search(text)
+        classes = next((g for g in class_match.groups() if g is not None), "").split() if class_match else []
+        key = (id_match.group(1), int(id_match.group(2)))
+        slots[key] = slots.get(key, False) or "reserve_time_off" in classes
+    return slots
+
+
 class GrooveCrawler(BaseCrawler):
     RESERVATION_LIMIT_DAYS = 84  # Reservation window limit per Groove policy.
 
     async def check_availability(self, date: str, hour_slots: List[str], target_rooms: List[RoomDetail]) -> List[RoomResult]:
+        # 예약 테이블 한 페이지에 하루 전체가 있으므로 DaySchedule에서 요청 시간대만 추출
+        return slice_day_results(await self.fetch_day_schedules(date, target_rooms), hour_slots)
+
+    async def fetch_day_schedules(self, date: str, target_rooms: List[RoomDetail]) -> List[DayResult]:
         # 1. 오늘 날짜와 목표 날짜를 date 객체로 변환
         today = datetime.now().date()
         target_date = datetime.strptime(date, '%Y-%m-%d').date()
@@ -23,24 +55,14 @@ class GrooveCrawler(BaseCrawler):
         # 2. 오늘로부터 84일 이후인지 확인
         if (target_date - today).days >= self.RESERVATION_LIMIT_DAYS:
             # 즉시 'unknown' 결과를 반환
-            unknown_results = []
-            for room in target_rooms:
-                slots = {hour_str: "unknown" for hour_str in hour_slots}
-                result = RoomAvailability(
-                    room_detail=room,
-                    available="unknown",
-                    available_slots=slots,
-                )
-                unknown_results.append(result)
-            return unknown_results
+            return [DaySchedule.unknown(room, date) for room in target_rooms]
 
         # 3. 날짜가 유효한 범위 내에 있으면 데이터 가져오기 진행
         try:
             html = await self._login_and_fetch_html(date, branch_gubun="sadang")
-            soup = BeautifulSoup(html, "html.parser")
-            tasks = [self._fetch_room_availability(room, hour_slots, soup) for room in target_rooms]
-            results = await asyncio.gather(*tasks)
-            return results
+            # 지점 전체 룸이 담긴 큰 페이지이므로 파싱 실행기에 위임
+            slots = await parse_executor.run(parse_reserve_table, html)
+            return [self._build_day_schedule(room, date, slots) for room in target_rooms]
         except Exception as e:
             # 로그인 실패 전체 에러 핸들링을 원한다면 여기서 처리 가능하지만, 
             # 개별 room 에러가 아니라 전체 에러이므로 리스트로 변환해서 리턴하거나 
@@ -48,11 +70,9 @@ class GrooveCrawler(BaseCrawler):
             return [e] * len(target_rooms)
 
     # --- 개별 슬롯(off/on) 체크 함수 ---
-    def _check_hour_slot(self, soup: BeautifulSoup, biz_item_id: str, hour_str: str) -> bool:
+    def _check_hour_slot(self, slots: Dict[Tuple[str, int], bool], biz_item_id: str, hour_str: str) -> bool:
         hour_int = int(hour_str.split(":")[0])
-        selector = f'#reserve_time_{biz_item_id}_{hour_int}.reserve_time_off'
-        elem = soup.select_one(selector)
-        return bool(elem)
+        return slots.get((biz_item_id, hour_int), False)
 
     # --- 예약정보 조회 함수 ---
     async def _fetch_reserve_html(self, client: httpx.AsyncClient, date: str, branch_gubun: str):
@@ -65,31 +85,24 @@ class GrooveCrawler(BaseCrawler):
             }
         )
 
-    # --- 로그인 및 HTML fetch를 try~except로 감싸는 함수 ---
+    # --- 로그인 세션을 재사용하여 HTML fetch (만료 시 세션 매니저가 재로그인) ---
     async def _login_and_fetch_html(self, date: str, branch_gubun: str="sadang"):
         try:
-            async with httpx.AsyncClient() as client:
-                await LoginManager.login(client)
-                resp = await self._fetch_reserve_html(client, date, branch_gubun)
+            resp = await groove_session.request(
+                lambda client: self._fetch_reserve_html(client, date, branch_gubun)
+            )
             return resp.text
         except (GrooveCredentialError, GrooveLoginError):
             # 특정 로그인/자격증명 예외를 다시 발생시켜 호출자가 처리하도록 함
             raise
 
-    # --- 방의 예약가능 상태 확인 함수 ---
-    async def _fetch_room_availability(
-            self, room: RoomDetail, hour_slots: List[str], soup: BeautifulSoup
-    ) -> RoomAvailability:
+    # --- 방의 하루 전체 예약가능 상태 확인 함수 ---
+    def _build_day_schedule(self, room: RoomDetail, date: str, slots: Dict[Tuple[str, int], bool]) -> DaySchedule:
         rm_ix = room.biz_item_id
 
-        slots = {hour_str: self._check_hour_slot(soup, rm_ix, hour_str) for hour_str in hour_slots}
-        overall = all(slots.values())
+        hourly = [self._check_hour_slot(slots, rm_ix, f"{hour:02d}:00") for hour in range(24)]
 
-        return RoomAvailability(
-            room_detail=room,
-            available=overall,
-            available_slots=slots,
-        )
+        return DaySchedule(room_detail=room, date=date, hourly=hourly)
 
 # Register the crawler
 registry.register("groove", GrooveCrawler())
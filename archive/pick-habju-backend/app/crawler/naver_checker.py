@@ -1,39 +1,26 @@
 import httpx
-from typing import List, Dict, Union
+from typing import Dict, List, Union
 import asyncio
 
-from app.models.dto import RoomDetail, RoomAvailability
+from app.core.config import NAVER_BATCH_SIZE, NAVER_HEDGE_PERCENTILE
+from app.models.dto import RoomDetail, DaySchedule
 from app.exception.crawler.naver_exception import NaverAvailabilityError, NaverRequestError
-from app.exception.api.client_loader_exception import RequestFailedError
+from app.exception.api.client_loader_exception import CircuitOpenError, RequestFailedError
 from app.utils.client_loader import load_client
+from app.utils.hedging import LatencyTracker, hedged_call
+from app.utils.request_coalescer import coalesce_key, request_coalescer
 from app.exception.base_exception import BaseCustomException
 
-from app.crawler.base import BaseCrawler, RoomResult
+from app.crawler.base import BaseCrawler, RoomResult, DayResult, slice_day_results
 from app.crawler.registry import registry
 
-class NaverCrawler(BaseCrawler):
-    async def check_availability(self, date: str, hour_slots: List[str], target_rooms: List[RoomDetail]) -> List[RoomResult]:
-        async def safe_fetch(room: RoomDetail) -> RoomResult:
-            try:
-                return await self._fetch_naver_availability_room(date, hour_slots, room)
-            except BaseCustomException as e:
-                return e
-            except Exception as e:
-                # 예상치 못한 에러는 룸 정보를 포함하여 새로운 예외로 반환
-                return Exception(f"[{room.name}] Unexpected error: {str(e)}")
-
-        return await asyncio.gather(*[safe_fetch(room) for room in target_rooms])
-
-    async def _fetch_naver_availability_room(self, date: str, hour_slots: List[str], room: RoomDetail) -> RoomAvailability:
-        url = "https://booking.naver.com/graphql?opName=schedule"
-        start_dt = f"{date}T00:00:00"
-        end_dt = f"{date}T23:59:59"
-        headers = {"Content-Type": "application/json"}
-        body = {
-            "operationName": "schedule",
-            "query": """
-            query schedule($scheduleParams: ScheduleParams) {
-              schedule(input: $scheduleParams) {
+NAVER_GRAPHQL_URL = "https://booking.naver.com/graphql?opName=schedule"
+NAVER_HEADERS = {"Content-Type": "application/json"}
+
+# 네이버 schedule 요청 지연 분포 (헤지 요청 기준 계산용)
+naver_latency = LatencyTracker(percentile=NAVER_HEDGE_PERCENTILE)
+
+_SCHEDULE_FIELDS = """{
                 bizItemSchedule {
                   hourly {
                     unitStartTime
@@ -41,53 +28,178 @@ class NaverCrawler(BaseCrawler):
                     unitBookingCount
                   }
                 }
-              }
-            }""",
+              }"""
+
+
+class NaverCrawler(BaseCrawler):
+    async def check_availability(self, date: str, hour_slots: List[str], target_rooms: List[RoomDetail]) -> List[RoomResult]:
+        # 네이버는 하루 전체 일정을 한 번에 내려주므로 DaySchedule에서 요청 시간대만 추출
+        return slice_day_results(await self.fetch_day_schedules(date, target_rooms), hour_slots)
+
+    async def fetch_day_schedules(self, date: str, target_rooms: List[RoomDetail]) -> List[DayResult]:
+        """룸별 하루 일정 조회.
+
+        같은 business_id(지점)의 룸들은 NAVER_BATCH_SIZE개씩 하나의 aliased GraphQL 문서로 묶어
+        한 번에 조회합니다. (지점당 룸 5~10개 기준 요청 수가 지점 수 수준으로 감소)
+        """
+        # business_id별로 (원래 순번, 룸) 묶기
+        groups: Dict[str, List[int]] = {}
+        for i, room in enumerate(target_rooms):
+            groups.setdefault(room.business_id, []).append(i)
+
+        batch_size = max(1, NAVER_BATCH_SIZE)
+        chunks = [
+            indices[start:start + batch_size]
+            for indices in groups.values()
+            for start in range(0, len(indices), batch_size)
+        ]
+
+        results: List[DayResult] = [None] * len(target_rooms)
+
+        async def run_chunk(indices: List[int]):
+            rooms = [target_rooms[i] for i in indices]
+            for i, result in zip(indices, await self._safe_fetch_chunk(date, rooms)):
+                results[i] = result
+
+        await asyncio.gather(*[run_chunk(indices) for indices in chunks])
+        return results
+
+    async def _safe_fetch_chunk(self, date: str, rooms: List[RoomDetail]) -> List[DayResult]:
+        try:
+            if len(rooms) == 1:
+                return [await self._fetch_naver_day_schedule(date, rooms[0])]
+            return await self._fetch_naver_day_schedules_batch(date, rooms)
+        except BaseCustomException as e:
+            return [e] * len(rooms)
+        except Exception as e:
+            # 예상치 못한 에러는 룸 정보를 포함하여 새로운 예외로 반환
+            return [Exception(f"[{room.name}] Unexpected error: {str(e)}") for room in rooms]
+
+    @staticmethod
+    def _schedule_params(date: str, room: RoomDetail) -> dict:
+        return {
+            "businessTypeId": 10,
+            "businessId": room.business_id,
+            "bizItemId": room.biz_item_id,
+            "startDateTime": f"{date}T00:00:00",
+            "endDateTime": f"{date}T23:59:59",
+            "fixedTime": True,
+            "includesHolidaySchedules": True
+        }
+
+    async def _fetch_naver_day_schedule(self, date: str, room: RoomDetail) -> DaySchedule:
+        body = {
+            "operationName": "schedule",
+            "query": f"""
+            query schedule($scheduleParams: ScheduleParams) {{
+              schedule(input: $scheduleParams) {_SCHEDULE_FIELDS}
+            }}""",
             "variables": {
-                "scheduleParams": {
-                    "businessTypeId": 10,
-                    "businessId": room.business_id,
-                    "bizItemId": room.biz_item_id,
-                    "startDateTime": start_dt,
-                    "endDateTime": end_dt,
-                    "fixedTime": True,
-                    "includesHolidaySchedules": True
-                }
+                "scheduleParams": self._schedule_params(date, room)
             }
         }
 
+        data = await self._post_graphql(body, label=room.name)
+        schedule = (data.get("data") or {}).get("schedule", {})
+        if schedule is None:
+            raise NaverAvailabilityError(f"[{room.name}] 네이버 API 응답에 일정이 없습니다.")
+        return self._build_day_schedule(room, date, schedule)
+
+    async def _fetch_naver_day_schedules_batch(self, date: str, rooms: List[RoomDetail]) -> List[DayResult]:
+        """같은 지점의 여러 룸을 별칭(s0, s1, ...)을 붙인 하나의 GraphQL 문서로 조회합니다.
+
+        설계 결정:
+        - 별칭별로 결과가 분리되어 오므로 일부 룸만 실패(null)해도 나머지 룸은 정상 반환
+        - 배치 요청이 4xx/5xx로 거부되거나 응답에 별칭 결과가 하나도 없으면 룸별 개별 요청으로 대체
+        - 서킷 차단(CircuitOpenError)은 대체하지 않고 그대로 전달 (개별 요청도 같은 차단에 걸림)
+        """
+        variable_defs = ", ".join(f"$p{i}: ScheduleParams" for i in range(len(rooms)))
+        selections = "\n".join(
+            f"              s{i}: schedule(input: $p{i}) {_SCHEDULE_FIELDS}" for i in range(len(rooms))
+        )
+        body = {
+            "operationName": "schedule",
+            "query": f"""
+            query schedule({variable_defs}) {{
+{selections}
+            }}""",
+            "variables": {f"p{i}": self._schedule_params(date, room) for i, room in enumerate(rooms)}
+        }
+
+        label = f"{rooms[0].business_id} 외 {len(rooms) - 1}개 룸"
         try:
-            response = await load_client(url, json=body, headers=headers)
-            data = response.json()
+            data = (await self._post_graphql(body, label=label)).get("data") or {}
+        except (NaverRequestError, NaverAvailabilityError):
+            # 별칭 문서 자체가 거부된 경우 (CircuitOpenError는 여기서 잡히지 않음)
+            data = {}
+
+        if not any(data.get(f"s{i}") for i in range(len(rooms))):
+            return await asyncio.gather(*[self._safe_fetch_single(date, room) for room in rooms])
+
+        results: List[DayResult] = []
+        for i, room in enumerate(rooms):
+            schedule = data.get(f"s{i}")
+            if schedule is None:
+                results.append(NaverAvailabilityError(f"[{room.name}] 네이버 API 응답에 일정이 없습니다."))
+                continue
+            try:
+                results.append(self._build_day_schedule(room, date, schedule))
+            except BaseCustomException as e:
+                results.append(e)
+        return results
+
+    async def _safe_fetch_single(self, date: str, room: RoomDetail) -> DayResult:
+        try:
+            return await self._fetch_naver_day_schedule(date, room)
+        except BaseCustomException as e:
+            return e
+        except Exception as e:
+            return Exception(f"[{room.name}] Unexpected error: {str(e)}")
+
+    async def _post_graphql(self, body: dict, label: str) -> dict:
+        try:
+            # 최근 p95(NAVER_HEDGE_PERCENTILE)보다 오래 걸리면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+            # 동시 조회의 같은 요청은 하나로 합침 (헤지 요청끼리는 합쳐지지 않도록 헤징 바깥에서 합침)
+            response = await request_coalescer.run(
+                coalesce_key("POST", NAVER_GRAPHQL_URL, json=body, headers=NAVER_HEADERS),
+                lambda: hedged_call(
+                    lambda: load_client(NAVER_GRAPHQL_URL, upstream="naver", json=body, headers=NAVER_HEADERS),
+                    naver_latency,
+                ),
+            )
+            return response.json()
+        except CircuitOpenError:
+            # 차단 상태는 그대로 전달하여 서비스 계층에서 unknown으로 처리
+            raise
         except RequestFailedError as e:
             # 공통 클라이언트 계층의 실패를 네이버 전용 예외로 매핑
-            raise NaverRequestError(f"[{room.name}] 네이버 API 호출 실패: {e}")
+            raise NaverRequestError(f"[{label}] 네이버 API 호출 실패: {e}")
         except Exception as e:
-            raise NaverAvailabilityError(f"[{room.name}] 네이버 API 호출/파싱 오류: {e}")
+            raise NaverAvailabilityError(f"[{label}] 네이버 API 호출/파싱 오류: {e}")
 
+    @staticmethod
+    def _build_day_schedule(room: RoomDetail, date: str, schedule: dict) -> DaySchedule:
         try:
-            api_slots = data.get("data", {}).get("schedule", {}).get("bizItemSchedule", {}).get("hourly", [])
+            api_slots = (schedule.get("bizItemSchedule") or {}).get("hourly", [])
             if api_slots is None:
                 api_slots = []
 
-            available_slots: Dict[str, bool] = {slot: False for slot in hour_slots}
+            hourly: List[Union[bool, str]] = [False] * 24
+            sub_hourly: Dict[str, Union[bool, str]] = {}
 
             for slot_data in api_slots:
                 time_str = slot_data["unitStartTime"][-8:]
-                hour_min = time_str[:5]
-                if hour_min in available_slots:
-                    available_slots[hour_min] = slot_data["unitBookingCount"] < slot_data["unitStock"]
+                available = slot_data["unitBookingCount"] < slot_data["unitStock"]
+                # 정각 단위는 hourly에 (예: "14:00:00" -> 14시), 30분 단위 등은 "HH:MM" 그대로 보관
+                if time_str[3:5] == "00":
+                    hourly[int(time_str[:2])] = available
+                else:
+                    sub_hourly[time_str[:5]] = available
 
         except Exception as e:
             raise NaverAvailabilityError(f"[{room.name}] 응답 파싱 오류: {e}")
 
-        available = all(val for hour, val in available_slots.items() if hour in hour_slots)
-
-        return RoomAvailability(
-            room_detail=room,
-            available=available,
-            available_slots=available_slots
-        )
+        return DaySchedule(room_detail=room, date=date, hourly=hourly, sub_hourly=sub_hourly)
 
 # Register the crawler
 registry.register("naver", NaverCrawler())
@@ -2,20 +2,66 @@ import os
 import asyncio
 import logging
 from typing import List, Dict, Optional
-from playwright.sync_api import sync_playwright
+import httpx
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 from concurrent.futures import ThreadPoolExecutor
+from app.utils.upstream_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# 전국 수집(--auto) 대상 검색어: 서울 25개 구 + 주요 광역시 / 도시 10곳
+REGION_QUERIES: List[str] = [
+    # Seoul 25 districts
+    "강남구 합주실", "강동구 합주실", "강북구 합주실", "강서구 합주실", "관악구 합주실",
+    "광진구 합주실", "구로구 합주실", "금천구 합주실", "노원구 합주실", "도봉구 합주실",
+    "동대문구 합주실", "동작구 합주실", "마포구 합주실", "서대문구 합주실", "서초구 합주실",
+    "성동구 합주실", "성북구 합주실", "송파구 합주실", "양천구 합주실", "영등포구 합주실",
+    "용산구 합주실", "은평구 합주실", "종로구 합주실", "중구 합주실", "중랑구 합주실",
+    # Major Metropolitan Cities & Areas
+    "부산 합주실", "대구 합주실", "인천 합주실", "광주 합주실", "대전 합주실", "울산 합주실",
+    "수원 합주실", "성남 합주실", "고양 합주실", "부천 합주실",
+]
+
+# 현재 Apollo 캐시의 PlaceSummary 키 목록 (목록이 바뀌면 새 검색 결과가 반영된 것)
+_PLACE_KEYS_JS = """
+    () => {
+        const state = window.__APOLLO_STATE__;
+        if (!state) return "";
+        return Object.keys(state).filter(key => key.startsWith('PlaceSummary:')).join(',');
+    }
+"""
+
+# PlaceSummary 키 목록이 비어 있지 않고 이전 목록과 달라지면 그 목록을 반환 (아니면 falsy → 계속 대기)
+_PLACES_READY_JS = f"""
+    (previous) => {{
+        const keys = ({_PLACE_KEYS_JS})();
+        return keys !== "" && keys !== previous ? keys : false;
+    }}
+"""
+
 class NaverMapCrawler:
-    """네이버 지도에서 합주실을 검색하고 Business ID를 수집합니다."""
+    """네이버 지도에서 합주실을 검색하고 Business ID를 수집합니다.
+
+    설계 결정:
+    - Chromium은 크롤링 1회(검색어 목록 전체)에 한 번만 띄우고, 검색어마다 격리된 context/page를 사용
+    - 동시에 여는 page 수는 POOL_SIZE로 제한 (워커가 큐에서 검색어를 하나씩 가져감)
+    - 고정 sleep 대신 호스트별 토큰 버킷(RATE_PER_SECOND)으로 페이지 이동 간격을 조절
+    - 페이지 준비는 고정 대기 / networkidle 대신 __APOLLO_STATE__에 새 PlaceSummary 키가
+      나타나는 시점으로 판단 (PAGE_WAIT_MS는 최대 대기 시간)
+    - Playwright는 별도 스레드의 전용 이벤트 루프에서 실행 (Windows에서 서버 이벤트 루프와 충돌 방지)
+    """
     
     BASE_URL = "https://pcmap.place.naver.com/place/list"
     
     # Configurable timeouts via environment variables
+    # 검색 결과(PlaceSummary)가 나타날 때까지 최대 대기 시간. 시간이 지나면 그 시점의 상태로 추출
     PAGE_WAIT_MS = int(os.getenv("CRAWLER_PAGE_WAIT_MS", "3000"))
     SCROLL_WAIT_MS = int(os.getenv("CRAWLER_SCROLL_WAIT_MS", "1500"))
     MAX_PAGES = int(os.getenv("CRAWLER_MAX_PAGES", "5"))
+    # 브라우저 하나에서 동시에 검색할 page 수
+    POOL_SIZE = int(os.getenv("CRAWLER_POOL_SIZE", "4"))
+    # 호스트별 초당 페이지 이동(검색 / 페이지네이션) 수 상한
+    RATE_PER_SECOND = float(os.getenv("CRAWLER_RATE_PER_SECOND", "2"))
     
     def __init__(self, headless: bool = True):
         self.headless = headless
@@ -24,25 +70,75 @@ class NaverMapCrawler:
     async def search_rehearsal_rooms(self, query: str = "합주실") -> List[Dict[str, str]]:
         """
         특정 키워드로 합주실을 검색하고 결과 목록을 반환합니다.
-        Uses sync_playwright in a separate thread to avoid Windows asyncio issues.
+        Runs Playwright in a separate thread to avoid Windows asyncio issues.
+        """
+        results = await self.search_many([query], pool_size=1)
+        return results[query]
+
+    async def search_many(self, queries: List[str], pool_size: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        여러 검색어를 브라우저 하나에서 병렬로 검색합니다.
+
+        Args:
+            queries: 검색어 목록
+            pool_size: 동시에 검색할 page 수 (기본 POOL_SIZE)
+
+        Returns:
+            검색어별 결과 목록 (실패한 검색어는 그때까지 수집한 결과 또는 빈 목록)
         """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._search_sync, query)
+        return await loop.run_in_executor(self._executor, self._run_pool_sync, list(queries), pool_size or self.POOL_SIZE)
 
-    def _search_sync(self, query: str) -> List[Dict[str, str]]:
-        """Synchronous search implementation."""
-        results = {}
-        
-        with sync_playwright() as p:
-            # Use channel='chrome' for more realistic browser fingerprint
-            browser = p.chromium.launch(
+    def _run_pool_sync(self, queries: List[str], pool_size: int) -> Dict[str, List[Dict]]:
+        """전용 이벤트 루프에서 브라우저 풀 실행 (executor 스레드)"""
+        return asyncio.run(self._run_pool(queries, pool_size))
+
+    async def _run_pool(self, queries: List[str], pool_size: int) -> Dict[str, List[Dict]]:
+        """Chromium을 한 번 띄우고 pool_size개 워커가 검색어를 나누어 검색합니다."""
+        results: Dict[str, List[Dict]] = {query: [] for query in queries}
+        pending: asyncio.Queue = asyncio.Queue()
+        for query in queries:
+            pending.put_nowait(query)
+        # 토큰 버킷의 Lock은 이벤트 루프에 묶이므로 실행마다 새로 생성
+        buckets: Dict[str, TokenBucket] = {}
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
                 headless=self.headless,
                 args=[
                     '--disable-blink-features=AutomationControlled',
                     '--no-sandbox',
                 ]
             )
-            context = browser.new_context(
+
+            async def worker():
+                while not pending.empty():
+                    query = pending.get_nowait()
+                    results[query] = await self._search_in_browser(browser, query, buckets)
+
+            try:
+                await asyncio.gather(*(worker() for _ in range(min(pool_size, len(queries)))))
+            finally:
+                await browser.close()
+
+        return results
+
+    async def _throttle(self, buckets: Dict[str, TokenBucket], url: str):
+        """url 호스트의 토큰 버킷에서 토큰을 얻을 때까지 대기"""
+        host = httpx.URL(url).host
+        bucket = buckets.get(host)
+        if bucket is None:
+            bucket = buckets[host] = TokenBucket(self.RATE_PER_SECOND, burst=1)
+        await bucket.acquire()
+
+    async def _search_in_browser(self, browser, query: str, buckets: Dict[str, TokenBucket]) -> List[Dict[str, str]]:
+        """격리된 context/page 하나로 검색어 1개를 검색합니다."""
+        results = {}
+        context = None
+
+        try:
+            # context 생성 실패도 이 검색어의 실패로만 처리 (같은 브라우저의 다른 워커는 계속 진행)
+            context = await browser.new_context(
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 extra_http_headers={"Referer": "https://map.naver.com/"},
                 viewport={"width": 1920, "height": 1080},
@@ -50,48 +146,66 @@ class NaverMapCrawler:
                 timezone_id="Asia/Seoul"
             )
             # Override navigator.webdriver to avoid detection
-            context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            page = context.new_page()
-            
-            try:
-                # 1. 첫 페이지 이동
-                url = f"{self.BASE_URL}?query={query}&display=70"
-                logger.info(f"Searching: {query} -> {url}")
-                page.goto(url)
-                page.wait_for_load_state("networkidle")
-                page.wait_for_timeout(self.PAGE_WAIT_MS)  # Wait for JS initialization
-                
-                # 2. 첫 페이지 데이터 추출
-                initial_data = self._extract_apollo_state_sync(page)
-                self._merge_results(results, initial_data)
-                
-                # 3. 페이지네이션 처리 (최대 MAX_PAGES 페이지)
-                for i in range(2, self.MAX_PAGES + 1):
-                    next_btn = page.get_by_role("link", name=str(i), exact=True)
-                    
-                    if next_btn.is_visible():
-                        logger.info(f"Navigating to page {i}")
-                        next_btn.click()
-                        page.wait_for_timeout(1000)
-                        page.wait_for_load_state("networkidle")
-                        
-                        page_data = self._extract_apollo_state_sync(page)
-                        if not page_data:
-                            break
-                        self._merge_results(results, page_data)
-                    else:
+            await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            page = await context.new_page()
+
+            # 1. 첫 페이지 이동
+            url = f"{self.BASE_URL}?query={query}&display=70"
+            logger.info(f"Searching: {query} -> {url}")
+            await self._throttle(buckets, url)
+            await page.goto(url, wait_until="domcontentloaded")
+            place_keys = await self._wait_for_places(page, previous="")
+
+            # 2. 첫 페이지 데이터 추출
+            initial_data = await self._extract_apollo_state(page)
+            self._merge_results(results, initial_data)
+
+            # 3. 페이지네이션 처리 (최대 MAX_PAGES 페이지)
+            for i in range(2, self.MAX_PAGES + 1):
+                next_btn = page.get_by_role("link", name=str(i), exact=True)
+
+                if await next_btn.is_visible():
+                    logger.info(f"Navigating to page {i}")
+                    await self._throttle(buckets, page.url)
+                    await next_btn.click()
+                    next_keys = await self._wait_for_places(page, previous=place_keys)
+                    if not next_keys:
+                        logger.info(f"Page {i} did not load new places: {query}")
                         break
-                        
-            except Exception as e:
-                logger.error(f"Error crawling {query}: {e}")
-            finally:
-                browser.close()
-                
+                    place_keys = next_keys
+
+                    page_data = await self._extract_apollo_state(page)
+                    if not page_data:
+                        break
+                    self._merge_results(results, page_data)
+                else:
+                    break
+
+        except Exception as e:
+            logger.error(f"Error crawling {query}: {e}")
+        finally:
+            if context is not None:
+                await context.close()
+
         return list(results.values())
 
-    def _extract_apollo_state_sync(self, page) -> List[Dict]:
-        """window.__APOLLO_STATE__ 변수에서 PlaceSummary 데이터 추출 (Sync version)"""
-        return page.evaluate("""
+    async def _wait_for_places(self, page, previous: str) -> str:
+        """
+        Apollo 캐시에 previous와 다른 PlaceSummary 키 목록이 나타날 때까지 대기합니다.
+
+        Returns:
+            새 PlaceSummary 키 목록 (PAGE_WAIT_MS 안에 나타나지 않으면 빈 문자열)
+        """
+        try:
+            handle = await page.wait_for_function(_PLACES_READY_JS, arg=previous, timeout=self.PAGE_WAIT_MS)
+        except PlaywrightTimeoutError:
+            return ""
+        return await handle.json_value()
+
+    async def _extract_apollo_state(self, page) -> List[Dict]:
+        """window.__APOLLO_STATE__ 변수에서 PlaceSummary 데이터 추출"""
+        return await page.evaluate("""
             () => {
                 const state = window.__APOLLO_STATE__;
                 // Debug: Return useful message if state is missing
@@ -135,48 +249,22 @@ class NaverMapCrawler:
             if item["id"] not in target:
                 target[item["id"]] = item
 
-    async def crawl_all_regions(self) -> List[Dict]:
+    async def crawl_all_regions(self, pool_size: Optional[int] = None) -> List[Dict]:
         """
         Crawl nationwide regions (Seoul 25 districts + Major Metropolitan Cities).
-        Sequential execution for stability on Windows.
-        Returns list of collected business Item dicts (deduplicated).
+        All regions share one browser; pool_size pages search in parallel (default POOL_SIZE).
+        Returns list of collected business Item dicts (deduplicated, in region order).
         """
-        # Seoul 25 districts
-        seoul_districts = [
-            "강남구 합주실", "강동구 합주실", "강북구 합주실", "강서구 합주실", "관악구 합주실",
-            "광진구 합주실", "구로구 합주실", "금천구 합주실", "노원구 합주실", "도봉구 합주실",
-            "동대문구 합주실", "동작구 합주실", "마포구 합주실", "서대문구 합주실", "서초구 합주실",
-            "성동구 합주실", "성북구 합주실", "송파구 합주실", "양천구 합주실", "영등포구 합주실",
-            "용산구 합주실", "은평구 합주실", "종로구 합주실", "중구 합주실", "중랑구 합주실"
-        ]
-        
-        # Major Metropolitan Cities & Areas
-        major_cities = [
-            "부산 합주실", "대구 합주실", "인천 합주실", "광주 합주실", "대전 합주실", "울산 합주실",
-            "수원 합주실", "성남 합주실", "고양 합주실", "부천 합주실"
-        ]
-        
-        all_queries = seoul_districts + major_cities
-        logger.info(f"Starting sequential crawl for {len(all_queries)} regions...")
-        
+        all_queries = REGION_QUERIES
+        logger.info(f"Starting pooled crawl for {len(all_queries)} regions (pool_size={pool_size or self.POOL_SIZE})...")
+
+        region_results = await self.search_many(all_queries, pool_size=pool_size)
+
         all_results = {}
+        for query in all_queries:
+            logger.info(f"✅ Finished {query}: Found {len(region_results[query])} rooms")
+            self._merge_results(all_results, region_results[query])
 
-        for idx, query in enumerate(all_queries):
-            logger.info(f"[{idx+1}/{len(all_queries)}] Searching: {query}")
-            try:
-                region_results = await self.search_rehearsal_rooms(query)
-                logger.info(f"✅ Finished {query}: Found {len(region_results)} rooms")
-                
-                for item in region_results:
-                    if item["id"] not in all_results:
-                        all_results[item["id"]] = item
-                        
-                # Small delay between regions
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to crawl {query}: {e}")
-            
         logger.info(f"Total unique businesses found nationwide: {len(all_results)}")
         return list(all_results.values())
 
@@ -0,0 +1,138 @@
+import os
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from app.crawler.naver_map_crawler import REGION_QUERIES
+from app.utils.client_loader import load_client
+
+logger = logging.getLogger(__name__)
+
+class NaverPlaceSearch:
+    """
+    네이버 지도 장소 검색 GraphQL API를 직접 호출하여 합주실 Business ID를 수집합니다.
+
+    NaverMapCrawler와 같은 계약(search_rehearsal_rooms / crawl_all_regions)과
+    같은 결과 형식({id, name, category, address, roadAddress, x, y})을 제공합니다.
+
+    설계 결정:
+    - 브라우저 없이 pcmap 페이지가 __APOLLO_STATE__를 채울 때 호출하는 API(getPlacesList)를 그대로 호출
+    - 요청은 load_client(upstream="naver")를 거치므로 전역 HTTP 클라이언트 / 제한기 / 서킷 브레이커 공유
+    - id는 Apollo 추출과 같은 규칙 (bookingBusinessId 우선, 없으면 place id)
+
+    비즈니스 맥락:
+    - 수집 작업에서 Chromium 실행 / 메모리 비용 제거 (MAP_SEARCH_BACKEND=http)
+    - 응답 JSON을 저장해 두면 네트워크 없이 파싱 테스트 가능
+    """
+
+    GRAPHQL_URL = "https://pcmap-api.place.naver.com/graphql"
+    HEADERS = {
+        "Content-Type": "application/json",
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Referer": "https://pcmap.place.naver.com/",
+    }
+
+    # 한 페이지 결과 수 (브라우저 검색의 display=70과 동일)
+    DISPLAY = 70
+    MAX_PAGES = int(os.getenv("CRAWLER_MAX_PAGES", "5"))
+
+    QUERY = """
+    query getPlacesList($input: PlacesInput) {
+        businesses: places(input: $input) {
+            total
+            items {
+                id
+                name
+                category
+                address
+                roadAddress
+                x
+                y
+                bookingBusinessId
+            }
+        }
+    }
+    """
+
+    async def search_rehearsal_rooms(self, query: str = "합주실") -> List[Dict[str, str]]:
+        """
+        특정 키워드로 합주실을 검색하고 결과 목록을 반환합니다. (최대 MAX_PAGES 페이지)
+        """
+        results: Dict[str, Dict] = {}
+
+        try:
+            for page in range(self.MAX_PAGES):
+                start = page * self.DISPLAY + 1
+                logger.info(f"Searching: {query} (start={start})")
+                items, total = await self._fetch_page(query, start)
+                self._merge_results(results, items)
+
+                if len(items) < self.DISPLAY or start + self.DISPLAY > total:
+                    break
+        except Exception as e:
+            logger.error(f"Error searching {query}: {e}")
+
+        return list(results.values())
+
+    async def crawl_all_regions(self) -> List[Dict]:
+        """
+        Search nationwide regions (REGION_QUERIES) concurrently.
+        Request rate is bounded by the shared naver upstream limiter.
+        Returns list of collected business Item dicts (deduplicated, in region order).
+        """
+        logger.info(f"Starting HTTP search for {len(REGION_QUERIES)} regions...")
+        region_results = await asyncio.gather(*(self.search_rehearsal_rooms(query) for query in REGION_QUERIES))
+
+        all_results: Dict[str, Dict] = {}
+        for query, items in zip(REGION_QUERIES, region_results):
+            logger.info(f"✅ Finished {query}: Found {len(items)} rooms")
+            self._merge_results(all_results, items)
+
+        logger.info(f"Total unique businesses found nationwide: {len(all_results)}")
+        return list(all_results.values())
+
+    async def _fetch_page(self, query: str, start: int) -> Tuple[List[Dict], int]:
+        payload = {
+            "operationName": "getPlacesList",
+            "variables": {
+                "input": {
+                    "query": query,
+                    "start": start,
+                    "display": self.DISPLAY,
+                    "deviceType": "pcmap",
+                }
+            },
+            "query": self.QUERY,
+        }
+        response = await load_client(self.GRAPHQL_URL, upstream="naver", json=payload, headers=self.HEADERS)
+        return self.parse_places(response.json())
+
+    @staticmethod
+    def parse_places(data: Dict) -> Tuple[List[Dict], int]:
+        """
+        getPlacesList 응답에서 (장소 목록, 전체 결과 수)를 추출합니다.
+
+        Returns:
+            장소 dict 목록 ({id, name, category, address, roadAddress, x, y})과 total
+        """
+        businesses = ((data or {}).get("data") or {}).get("businesses") or {}
+        places = []
+        for item in businesses.get("items") or []:
+            place_id: Optional[str] = item.get("bookingBusinessId") or item.get("id")
+            if not place_id:
+                continue
+            places.append({
+                "id": place_id,
+                "name": item.get("name"),
+                "category": item.get("category"),
+                "address": item.get("address"),
+                "roadAddress": item.get("roadAddress"),
+                "x": item.get("x"),
+                "y": item.get("y"),
+            })
+        return places, businesses.get("total") or 0
+
+    def _merge_results(self, target: Dict, source: List[Dict]):
+        """중복 제거하며 결과 병합"""
+        for item in source:
+            if item["id"] not in target:
+                target[item["id"]] = item
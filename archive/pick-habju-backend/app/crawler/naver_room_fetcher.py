@@ -1,12 +1,20 @@
 import os
+import asyncio
 import httpx
 import logging
 from typing import Dict, List, Optional
+from app.utils.client_loader import get_global_client
 
 logger = logging.getLogger(__name__)
 
 class NaverRoomFetcher:
-    """네이버 예약 GraphQL API를 통해 합주실 상세 정보를 수집합니다."""
+    """네이버 예약 GraphQL API를 통해 합주실 상세 정보를 수집합니다.
+
+    설계 결정:
+    - 지점마다 새 AsyncClient를 열지 않고 수명이 긴 클라이언트 하나로 연결(HTTP/2, keep-alive) 재사용
+    - 사용할 클라이언트 우선순위: 생성자로 주입한 클라이언트 > 전역 클라이언트(set_global_client) > 자체 연결 풀
+    - 자체 연결 풀은 처음 요청할 때 만들고 aclose()로 닫음 (주입 / 전역 클라이언트는 닫지 않음)
+    """
     
     GRAPHQL_URL = "https://booking.naver.com/graphql"
     HEADERS = {
@@ -16,6 +24,37 @@ class NaverRoomFetcher:
     
     # Configurable timeout via environment variable
     REQUEST_TIMEOUT = float(os.getenv("FETCHER_TIMEOUT", "10.0"))
+    # 자체 연결 풀 한도 (전역 / 주입 클라이언트가 없을 때만 사용)
+    MAX_CONNECTIONS = int(os.getenv("FETCHER_MAX_CONNECTIONS", "20"))
+    MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("FETCHER_MAX_KEEPALIVE_CONNECTIONS", "10"))
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self._client = client
+        self._owns_client = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        shared = get_global_client()
+        if shared is not None:
+            return shared
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.REQUEST_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=self.MAX_CONNECTIONS,
+            ),
+            http2=True,
+        )
+        self._owns_client = True
+        return self._client
+
+    async def aclose(self):
+        """자체 연결 풀을 만들었으면 닫습니다."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
     
     async def fetch_full_info(self, business_id: str) -> Optional[Dict]:
         """
@@ -28,37 +67,37 @@ class NaverRoomFetcher:
                 "subway": {...}
             } or None if failed
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                # 1. 지점 정보 (Business)
-                business_info = await self._fetch_business(client, business_id)
-                if not business_info:
-                    logger.warning(f"Failed to fetch business info for {business_id}")
-                    return None
-                
-                # 2. 룸 목록 (BizItems)
-                rooms = await self._fetch_biz_items(client, business_id)
-                
-                # 3. 지하철 정보 (NearSubway) - 좌표가 있는 경우만
-                subway = None
-                coord = business_info.get("coordinates")
-                if coord:
-                    subway = await self._fetch_near_subway(
-                        client, 
-                        coord["latitude"], 
-                        coord["longitude"],
-                        business_info.get("placeId")
-                    )
-                
-                return {
-                    "business": business_info,
-                    "rooms": rooms,
-                    "subway": subway
-                }
-                
-            except Exception as e:
-                logger.error(f"Error fetching full info for {business_id}: {e}")
+        client = self._get_client()
+        try:
+            # 1. 지점 정보 (Business) + 2. 룸 목록 (BizItems) - 서로 독립적이므로 동시 요청
+            business_info, rooms = await asyncio.gather(
+                self._fetch_business(client, business_id),
+                self._fetch_biz_items(client, business_id),
+            )
+            if not business_info:
+                logger.warning(f"Failed to fetch business info for {business_id}")
                 return None
+            
+            # 3. 지하철 정보 (NearSubway) - 좌표가 있는 경우만 (지점 좌표가 필요하므로 1 이후)
+            subway = None
+            coord = business_info.get("coordinates")
+            if coord:
+                subway = await self._fetch_near_subway(
+                    client, 
+                    coord["latitude"], 
+                    coord["longitude"],
+                    business_info.get("placeId")
+                )
+            
+            return {
+                "business": business_info,
+                "rooms": rooms,
+                "subway": subway
+            }
+            
+        except Exception as e:
+            logger.error(f"Error fetching full info for {business_id}: {e}")
+            return None
 
     async def _fetch_business(self, client: httpx.AsyncClient, business_id: str) -> Optional[Dict]:
         query = """
@@ -192,5 +231,6 @@ if __name__ == "__main__":
         print(f"Room count: {len(info['rooms'])}")
         if info['subway']:
             print(f"Subway: {info['subway']['displayName']}")
+        await fetcher.aclose()
 
     asyncio.run(main())
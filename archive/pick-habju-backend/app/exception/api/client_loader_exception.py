@@ -5,3 +5,14 @@ class RequestFailedError(BaseCustomException):
     error_code = ErrorCode.API_REQUEST_FAILED
     message = "외부 API 호출에 실패했습니다."
     status_code = 503
+
+
+class CircuitOpenError(RequestFailedError):
+    """업스트림 서킷 브레이커가 열려 있어 호출을 보내지 않고 즉시 실패.
+
+    Rationale (의도):
+        - RequestFailedError를 상속하여 크롤러의 기존 실패 처리(예외 매핑, unknown 처리)를 그대로 사용합니다.
+    """
+    error_code = ErrorCode.API_CIRCUIT_OPEN
+    message = "외부 API가 일시적으로 차단되어 호출하지 않았습니다."
+    status_code = 503
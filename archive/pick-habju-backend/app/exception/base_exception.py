@@ -12,6 +12,7 @@ class ErrorCode(str, Enum):
     
     # 2. API: API 요청/통신 관련
     API_REQUEST_FAILED = "API-001"
+    API_CIRCUIT_OPEN = "API-002"        # 서킷 브레이커 차단
 
     # 3. CRAWLER: 크롤러 실행/파싱 관련
     CRAWLER_EXECUTION_FAILED = "CRAWLER-001"
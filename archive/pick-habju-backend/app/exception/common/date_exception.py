@@ -11,3 +11,9 @@ class PastDateNotAllowedError(BaseCustomException):
     error_code = "Date-002"
     message = "과거 날짜는 허용되지 않습니다."
     status_code = 400
+
+class InvalidDateRangeError(BaseCustomException):
+    """날짜 범위가 잘못되었거나 최대 조회 기간을 넘는 경우"""
+    error_code = "Date-003"
+    message = "조회 날짜 범위가 잘못되었습니다."
+    status_code = 400
@@ -7,6 +7,8 @@ from fastapi.responses import JSONResponse
 
 from app.api.available_room import router as available_router
 from app.api.favorites import router as favorites_router
+from app.api.room_catalog import router as room_catalog_router
+from app.api.monitoring import router as monitoring_router
 from app.api._dev.debug_envelope import router as demo_router
 from app.core.config import ALLOWED_ORIGINS
 from app.core.logging_config import setup_logging
@@ -18,6 +20,13 @@ import app.crawler  # Trigger crawler registration on startup.
 
 from contextlib import asynccontextmanager
 from app.utils.client_loader import set_global_client, close_global_client
+from app.utils.login import groove_session
+from app.utils.parse_executor import parse_executor
+from app.crawler.registry import registry
+from app.services.availability_service import AvailabilityService
+from app.services.availability_snapshot import SnapshotScheduler, availability_snapshots
+from app.utils.circuit_breaker import circuit_breakers
+from app.utils.room_loader import get_rooms_by_criteria
 
 from app.exception.envelope_handlers import (
     http_exception_handler,
@@ -38,9 +47,21 @@ ALLOWED_ORIGINS_SET = {
 async def lifespan(app: FastAPI):
     # 시작 시 클라이언트 설정
     await set_global_client()
+    # 예약 현황 스냅샷 백그라운드 갱신 (AVAILABILITY_SNAPSHOT_DAYS > 0일 때만, 배포당 워커 하나에서만)
+    # live 조회와 같은 크롤러 서킷 브레이커 / 응답 대기 한도를 거쳐 업스트림 조회
+    crawlers_map = registry.get_all_map()
+    snapshot_guard = AvailabilityService(crawlers_map, breakers=circuit_breakers, snapshots=availability_snapshots)
+    snapshot_scheduler = SnapshotScheduler(
+        crawlers_map, availability_snapshots, room_loader=lambda: get_rooms_by_criteria(capacity=0),
+        fetch=snapshot_guard.refresh_day_schedules,
+    )
+    snapshot_scheduler.start()
     yield
+    await snapshot_scheduler.stop()
     # 종료 시 클라이언트 정리
     await close_global_client()
+    await groove_session.aclose()
+    parse_executor.shutdown()
 
 app = FastAPI(
     title="Pick 합주 API",
@@ -92,6 +113,8 @@ def ping():
 # API 라우터 포함
 app.include_router(available_router)
 app.include_router(favorites_router)
+app.include_router(room_catalog_router)
+app.include_router(monitoring_router)
 
 if os.getenv("ENV") != "prod":
     app.include_router(demo_router)
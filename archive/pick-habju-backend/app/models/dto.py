@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import List, Dict, Union, Any, Optional
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_serializer
+from functools import cached_property
+from typing import List, Dict, Union, Any, Literal, Optional, Tuple
+from app.utils.slot_mask import availability_of, hourly_masks, on_the_hour, slot_bits, slot_states
 
 # Room Information DTO (DB Query Result)
 class RoomDetail(BaseModel):
@@ -56,6 +58,23 @@ class AvailabilityRequest(BaseModel):
     neLat: float = Field(..., description="North-East Latitude")
     neLng: float = Field(..., description="North-East Longitude")
 
+    # 조회 방식: live(요청 시점 업스트림 조회) / snapshot(백그라운드 스냅샷 우선, 없으면 실시간 조회)
+    mode: Literal["live", "snapshot"] = Field("live", description="Lookup mode (live / snapshot)")
+
+
+class FreeWindowRequest(BaseModel):
+    """Request for searching contiguous free windows over a date range"""
+    start_date: str = Field(..., description="First date to search (YYYY-MM-DD)")
+    end_date: str = Field(..., description="Last date to search (YYYY-MM-DD, inclusive)")
+    duration: int = Field(..., ge=1, le=24, description="Required contiguous hours")
+    capacity: int = Field(..., description="Number of users")
+
+    # 지도 영역 좌표 (필수)
+    swLat: float = Field(..., description="South-West Latitude")
+    swLng: float = Field(..., description="South-West Longitude")
+    neLat: float = Field(..., description="North-East Latitude")
+    neLng: float = Field(..., description="North-East Longitude")
+
 
 # Room Info (Response용 평탄화된 모델)
 class RoomInfo(BaseModel):
@@ -79,6 +98,94 @@ class RoomAvailability(BaseModel):
     room_detail: RoomDetail = Field(..., description="Room detail information")
     available: Union[bool, str] = Field(..., description="Availability status (true/false/unknown)")
     available_slots: Dict[str, Union[bool, str]] = Field(..., description="Availability by time slot")
+    checked_at: Optional[str] = Field(None, description="When this availability was fetched from upstream (ISO 8601, snapshot / recheck only)")
+
+    @model_serializer(mode="wrap")
+    def _omit_missing_checked_at(self, handler):
+        """checked_at은 snapshot / recheck 응답에만 포함 (live 응답 형식은 기존과 동일하게 유지)"""
+        data = handler(self)
+        if self.checked_at is None:
+            data.pop("checked_at", None)
+        return data
+
+# Full-day Schedule DTO (Internal Logic Use Only)
+class DaySchedule(BaseModel):
+    """하루 전체 시간대별 예약 현황 (Internal Use)
+
+    크롤러가 업스트림에서 받아온 하루치 일정을 정규화한 형태입니다.
+    hourly[h]는 h시 정각 슬롯의 상태이며, 잔여 재고(stock - booked)가 있으면 True,
+    없으면 False, 조회 불가(예약 가능 기간 밖 등)면 "unknown"입니다.
+    정각에 시작하지 않는 단위(예: 30분 단위 네이버 상품의 14:30)를 구분하는 크롤러는
+    sub_hourly["HH:MM"]에 따로 보관하고, 구분하지 않는 크롤러(드림, 그루브)는
+    sub_hourly=None으로 두어 14:30 같은 슬롯이 해당 시(14시)의 상태를 따르게 합니다.
+
+    Rationale:
+        같은 날짜에 대해 시작/종료 시간만 바꾼 재조회는 업스트림 호출 없이
+        저장된 DaySchedule에서 바로 답할 수 있도록 전체 시간대를 보존합니다.
+
+    설계 결정:
+        처음 사용할 때 hourly를 24비트 예약 가능 / unknown 마스크로 한 번 변환해 두고,
+        시간대 판정은 마스크 AND로 처리합니다. (hourly는 생성 후 변경하지 않음)
+        sub_hourly가 있는 일정에서 정각이 아닌 슬롯이 섞인 요청은 마스크를 쓰지 않고
+        슬롯별 정확 매칭으로 판정합니다.
+    """
+    room_detail: RoomDetail = Field(..., description="Room detail information")
+    date: str = Field(..., description="Schedule date (YYYY-MM-DD)")
+    hourly: List[Union[bool, str]] = Field(..., min_length=24, max_length=24, description="Availability by hour (index 0~23)")
+    sub_hourly: Optional[Dict[str, Union[bool, str]]] = Field(None, description="Availability of units not starting on the hour (HH:MM), None if the upstream only has hourly units")
+
+    @cached_property
+    def _masks(self) -> Tuple[int, int]:
+        return hourly_masks(self.hourly)
+
+    @property
+    def available_mask(self) -> int:
+        """예약 가능한 시간대 비트마스크 (bit h = h시 정각)"""
+        return self._masks[0]
+
+    @property
+    def unknown_mask(self) -> int:
+        """조회 불가(unknown) 시간대 비트마스크"""
+        return self._masks[1]
+
+    def slot_state(self, slot: str) -> Union[bool, str]:
+        """"HH:MM" 슬롯의 상태 반환 (업스트림에 없는 슬롯이면 False)"""
+        hour = int(slot[:2])
+        if not 0 <= hour < 24:
+            return False
+        if slot[3:5] == "00" or self.sub_hourly is None:
+            return self.hourly[hour]
+        # 정각이 아닌 슬롯은 정확히 같은 시작 시각의 단위만 인정
+        # (하루 전체가 unknown이면 해당 시각도 unknown)
+        default = "unknown" if self.hourly[hour] == "unknown" else False
+        return self.sub_hourly.get(slot, default)
+
+    def to_room_availability(self, hour_slots: List[str]) -> "RoomAvailability":
+        """요청된 시간대만 추출하여 RoomAvailability로 변환"""
+        if self.sub_hourly is not None and not on_the_hour(tuple(hour_slots)):
+            return self._to_room_availability_exact(hour_slots)
+        pairs, requested = slot_bits(tuple(hour_slots))
+        available_mask, unknown_mask = self._masks
+        return RoomAvailability(
+            room_detail=self.room_detail,
+            available=availability_of(available_mask, unknown_mask, requested),
+            available_slots=slot_states(available_mask, unknown_mask, pairs),
+        )
+
+    def _to_room_availability_exact(self, hour_slots: List[str]) -> "RoomAvailability":
+        """정각이 아닌 슬롯이 섞인 요청을 슬롯별 정확 매칭으로 변환"""
+        available_slots = {slot: self.slot_state(slot) for slot in hour_slots}
+        states = available_slots.values()
+        if any(state == "unknown" for state in states):
+            available = "unknown"
+        else:
+            available = all(state is True for state in states)
+        return RoomAvailability(room_detail=self.room_detail, available=available, available_slots=available_slots)
+
+    @classmethod
+    def unknown(cls, room_detail: RoomDetail, date: str) -> "DaySchedule":
+        """조회 불가 상태의 DaySchedule 생성"""
+        return cls(room_detail=room_detail, date=date, hourly=["unknown"] * 24)
 
 # Branch Summary Stat Model
 class BranchStats(BaseModel):
@@ -107,3 +214,86 @@ class AvailabilityResponse(BaseModel):
     branch_summary: Dict[str, BranchStats] = Field(default_factory=dict, description="Summary stats per branch for map markers")
 
 
+
+
+# Streaming Summary DTO
+class AvailabilityStreamSummary(BaseModel):
+    """스트리밍 조회(/stream)의 마지막 프레임
+
+    룸 결과는 앞선 room 프레임으로 이미 전달되었으므로 본문(results)은 포함하지 않습니다.
+    """
+    date: str = Field(..., description="Checked date")
+    start_hour: str = Field(..., description="Checked start time")
+    end_hour: str = Field(..., description="Checked end time")
+    hour_slots: List[str] = Field(default_factory=list, description="List of checked hour slots")
+    available_biz_item_ids: List[str] = Field(default_factory=list, description="List of available biz_item_ids")
+    branch_summary: Dict[str, BranchStats] = Field(default_factory=dict, description="Final summary stats per branch")
+    failed_count: int = Field(0, description="Number of rooms whose availability could not be checked")
+
+
+# Availability Delta DTO (변경분 구독용)
+class AvailabilityDelta(BaseModel):
+    """룸 하루 일정의 직전 조회 대비 변경분 (변경된 슬롯만 포함)"""
+    date: str = Field(..., description="Schedule date (YYYY-MM-DD)")
+    business_id: str = Field(..., description="Naver Booking Business ID")
+    biz_item_id: str = Field(..., description="Naver Booking Room ID")
+    booked: List[str] = Field(default_factory=list, description="Slots that became unavailable (HH:MM)")
+    freed: List[str] = Field(default_factory=list, description="Slots that became available (HH:MM)")
+    unknown: List[str] = Field(default_factory=list, description="Slots that became unknown (HH:MM)")
+    checked_at: Optional[str] = Field(None, description="When the new schedule was fetched (ISO 8601)")
+
+
+# Compact Availability DTO (compact 응답 모드)
+class CompactRoomAvailability(BaseModel):
+    """예약 가능 룸 1개의 compact 표현
+
+    룸 상세 정보(이미지, 인원, 가격 등)는 카탈로그 엔드포인트(/api/rooms/catalog)에서
+    biz_item_id로 조회합니다. 예약 가능 룸만 담기므로 요청 시간대가 모두 예약 가능하다는 뜻이며,
+    슬롯별 상태는 따로 보내지 않습니다.
+    """
+    biz_item_id: str = Field(..., description="Naver Booking Room ID (catalog key)")
+    checked_at: Optional[str] = Field(None, description="When this availability was fetched from upstream (ISO 8601, snapshot only)")
+
+
+class CompactAvailabilityResponse(BaseModel):
+    """compact=true 응답 (룸 상세 정보 제외, 예약 가능 룸의 biz_item_id만 포함)"""
+    date: str = Field(..., description="Checked date")
+    start_hour: str = Field(..., description="Checked start time")
+    end_hour: str = Field(..., description="Checked end time")
+    hour_slots: List[str] = Field(default_factory=list, description="List of checked hour slots")
+    rooms: List[CompactRoomAvailability] = Field(default_factory=list, description="Available rooms (biz_item_id only)")
+    branch_summary: Dict[str, BranchStats] = Field(default_factory=dict, description="Summary stats per branch for map markers")
+
+
+# Room Catalog DTO
+class RoomCatalogResponse(BaseModel):
+    """룸 카탈로그 전체 (compact 응답의 biz_item_id → 룸 상세 정보)"""
+    rooms: List[RoomDetail] = Field(default_factory=list, description="All rooms in the catalog")
+
+
+# Free Window Search DTO (빈 시간대 검색)
+class FreeWindow(BaseModel):
+    """연속으로 예약 가능한 최대 구간 1개
+
+    start_hour ~ end_hour는 예약 가능 여부 조회의 시작/종료 시간과 같은 의미입니다.
+    (end_hour 슬롯 포함, 예: 18:00 ~ 20:00 → 18, 19, 20시 3시간)
+    """
+    date: str = Field(..., description="Date (YYYY-MM-DD)")
+    start_hour: str = Field(..., description="First free slot (HH:MM)")
+    end_hour: str = Field(..., description="Last free slot (HH:MM, inclusive)")
+    hours: int = Field(..., description="Number of contiguous free hours")
+
+
+class RoomFreeWindows(BaseModel):
+    """룸 1개의 빈 시간대 목록 (날짜, 시작 시간 순)"""
+    room_detail: RoomDetail = Field(..., description="Room detail information")
+    windows: List[FreeWindow] = Field(default_factory=list, description="Free windows of at least `duration` hours")
+
+
+class FreeWindowSearchResponse(BaseModel):
+    """빈 시간대 검색 결과 (빈 시간대가 하나 이상인 룸만 포함)"""
+    start_date: str = Field(..., description="First searched date")
+    end_date: str = Field(..., description="Last searched date")
+    duration: int = Field(..., description="Required contiguous hours")
+    rooms: List[RoomFreeWindows] = Field(default_factory=list, description="Rooms with at least one free window")
+    failed_count: int = Field(0, description="Number of (room, date) schedules that could not be checked")
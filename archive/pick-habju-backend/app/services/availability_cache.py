@@ -0,0 +1,210 @@
+"""
+룸별 예약 현황 캐시 (TTL + Single-flight)
+
+AvailabilityService와 BaseCrawler.check_availability 사이에 위치하여
+(크롤러 타입, 룸, 날짜) 단위로 하루 전체의 시간대별 예약 현황을 짧게 캐싱합니다.
+
+주요 기능:
+- 하루 전체(00:00~23:00) 일정(DaySchedule)을 한 번에 조회하여 저장하고, 요청된 시간대만 잘라서 반환
+- 동일 키에 대한 동시 캐시 미스는 하나의 업스트림 호출로 병합 (Single-flight)
+- 에러 결과는 캐싱하지 않음 (다음 요청에서 즉시 재시도)
+- 업스트림에서 새로 받은 일정은 변경 구독(AvailabilityChangeFeed)에 전달하여 바뀐 칸을 발행
+  (캐시가 꺼져 있으면 하루 일정을 받지 않으므로 변경분도 발행하지 않음)
+
+비즈니스 맥락:
+- 지도 화면을 여러 사용자가 같은 날짜로 동시에 이동하면 같은 룸을 반복 조회하게 됨
+- 캐시 히트 시 응답 시간이 크롤러(Naver/Dream/Groove) 지연과 무관해짐
+"""
+
+from __future__ import annotations
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from app.crawler.base import BaseCrawler, RoomResult, DayResult
+from app.core.config import AVAILABILITY_CACHE_TTL_SECONDS
+from app.models.dto import DaySchedule, RoomDetail
+from app.services.availability_changes import AvailabilityChangeFeed, availability_changes, isoformat_epoch
+
+# (crawler_type, business_id, biz_item_id, date)
+CacheKey = Tuple[str, str, str, str]
+
+
+class AvailabilityCache:
+    """(크롤러, 룸, 날짜) 단위 예약 현황 캐시.
+
+    설계 결정:
+    - 저장 단위는 DaySchedule(하루 전체)이므로 같은 날짜라면 어떤 시간 범위 요청에도 재사용 가능
+    - 업스트림 호출은 별도 Task로 실행하여, 먼저 요청한 코루틴이 취소되어도
+      같은 키를 기다리는 다른 요청에는 영향을 주지 않음
+    - 결과 순서는 항상 target_rooms 순서를 따름 (BaseCrawler 계약과 동일)
+
+    Attributes:
+        ttl_seconds: 캐시 유효 시간(초). 0 이하이면 캐시 비활성화
+        max_entries: 저장 엔트리 수 상한 (넘으면 만료된 엔트리, 그래도 넘으면 가장 먼저 저장된 엔트리부터 제거)
+        feed: 새로 받은 일정을 전달할 변경 구독 관리자 (None이면 변경 감지 안 함)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = AVAILABILITY_CACHE_TTL_SECONDS,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        feed: Optional[AvailabilityChangeFeed] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.feed = feed
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: Dict[CacheKey, Tuple[float, DaySchedule]] = {}
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        # 실행 중인 조회 Task 참조 유지 (GC로 인한 조기 소멸 방지)
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def clear(self):
+        """저장된 모든 엔트리를 제거합니다. (진행 중인 요청은 유지)"""
+        self._entries.clear()
+
+    async def check_availability(
+        self,
+        crawler_type: str,
+        crawler: BaseCrawler,
+        date: str,
+        hour_slots: List[str],
+        target_rooms: List[RoomDetail],
+    ) -> List[RoomResult]:
+        """캐시를 거쳐 룸별 예약 가능 여부를 조회합니다.
+
+        Args:
+            crawler_type: 크롤러 타입 이름 (캐시 키에 포함)
+            crawler: 캐시 미스 시 호출할 크롤러
+            date: 조회 날짜 (YYYY-MM-DD)
+            hour_slots: 조회할 시간대 리스트 (예: ["18:00", "19:00"])
+            target_rooms: 조회할 방 정보 리스트
+
+        Returns:
+            target_rooms 순서와 동일한 RoomAvailability 또는 Exception 리스트
+        """
+        if not self.enabled:
+            return await crawler.check_availability(date, hour_slots, target_rooms)
+
+        day_results = await self.fetch_day_schedules(crawler_type, crawler, date, target_rooms)
+        return [self._slice(result, hour_slots) for result in day_results]
+
+    async def fetch_day_schedules(
+        self,
+        crawler_type: str,
+        crawler: BaseCrawler,
+        date: str,
+        target_rooms: List[RoomDetail],
+    ) -> List[DayResult]:
+        """캐시를 거쳐 룸별 하루 전체 일정을 조회합니다. (빈 시간대 검색 등 하루 단위 조회용)
+
+        Returns:
+            target_rooms 순서와 동일한 DaySchedule 또는 Exception 리스트
+        """
+        if not self.enabled:
+            return await crawler.fetch_day_schedules(date, target_rooms)
+
+        now = self._clock()
+        keys: List[CacheKey] = []
+        futures: Dict[CacheKey, asyncio.Future] = {}
+        day_results: Dict[CacheKey, DayResult] = {}
+        to_fetch: List[Tuple[CacheKey, RoomDetail]] = []
+
+        loop = asyncio.get_running_loop()
+        for room in target_rooms:
+            key = (crawler_type, room.business_id, room.biz_item_id, date)
+            keys.append(key)
+            if key in day_results or key in futures:
+                continue
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                day_results[key] = entry[1]
+                continue
+
+            future = self._inflight.get(key)
+            if future is None:
+                # 캐시 미스 + 진행 중인 요청 없음 → 이번 요청이 업스트림 호출을 담당
+                future = loop.create_future()
+                self._inflight[key] = future
+                to_fetch.append((key, room))
+            futures[key] = future
+
+        if to_fetch:
+            task = asyncio.create_task(self._fetch_and_store(crawler, date, to_fetch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        for key, future in futures.items():
+            day_results[key] = await asyncio.shield(future)
+
+        return [day_results[key] for key in keys]
+
+    async def _fetch_and_store(
+        self,
+        crawler: BaseCrawler,
+        date: str,
+        to_fetch: List[Tuple[CacheKey, RoomDetail]],
+    ):
+        """캐시 미스 룸들을 한 번에 조회하고 대기 중인 Future를 모두 완료합니다."""
+        rooms = [room for _, room in to_fetch]
+        try:
+            try:
+                results: List[DayResult] = await crawler.fetch_day_schedules(date, rooms)
+                if len(results) != len(rooms):
+                    raise RuntimeError(
+                        f"크롤러 응답 개수 불일치: 요청 {len(rooms)}개, 응답 {len(results)}개"
+                    )
+            except Exception as e:
+                results = [e] * len(rooms)
+
+            expires_at = self._clock() + self.ttl_seconds
+            checked_at = isoformat_epoch(time.time())
+            for (key, _), result in zip(to_fetch, results):
+                if isinstance(result, DaySchedule):
+                    # 다시 넣어 삽입 순서를 저장 시각(= 만료 시각) 순으로 유지
+                    self._entries.pop(key, None)
+                    self._entries[key] = (expires_at, result)
+                    if self.feed is not None:
+                        self.feed.observe(key[0], result, checked_at=checked_at)
+                self._resolve(key, result)
+        finally:
+            # Task 자체가 취소된 경우에도 대기 중인 요청이 영원히 멈추지 않도록 보장
+            for key, room in to_fetch:
+                self._resolve(key, RuntimeError(f"[{room.name}] 예약 현황 조회가 취소되었습니다."))
+
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+    def _resolve(self, key: CacheKey, result: DayResult):
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            # 에러도 값으로 전달 (크롤러 계약과 동일하게 Exception을 결과로 취급)
+            future.set_result(result)
+
+    def _evict(self):
+        """만료된 엔트리를 지우고, 그래도 max_entries를 넘으면 오래된 엔트리부터 제거합니다."""
+        now = self._clock()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        # TTL 안에 서로 다른 (룸, 날짜) 키가 몰려도 메모리가 상한을 넘지 않도록
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    @staticmethod
+    def _slice(result: DayResult, hour_slots: List[str]) -> RoomResult:
+        """하루 전체 결과에서 요청된 시간대만 추출합니다."""
+        if isinstance(result, Exception):
+            return result
+        return result.to_room_availability(hour_slots)
+
+
+# Global singleton instance
+availability_cache = AvailabilityCache(feed=availability_changes)
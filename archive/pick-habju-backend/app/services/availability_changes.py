@@ -0,0 +1,165 @@
+"""
+예약 현황 변경 감지 + 변경분(delta) 구독
+
+같은 룸/날짜의 하루 일정(DaySchedule)을 새로 받을 때마다 직전에 본 일정과 비교하여
+새로 예약된 슬롯 / 새로 비워진 슬롯 / 조회 불가로 바뀐 슬롯만 담은 AvailabilityDelta를 만들고,
+해당 날짜와 지도 영역을 구독 중인 클라이언트에게 전달합니다.
+
+설계 결정:
+- 비교 대상은 피드가 (크롤러, 룸, 날짜)별로 기억하는 직전 일정
+  업스트림에서 일정을 받는 곳(예약 현황 캐시의 실시간 조회, 스냅샷 스케줄러 갱신, recheck)이
+  모두 observe()로 전달하므로 스냅샷 스케줄러가 꺼져 있어도 실시간 조회만으로 변경분이 발행됨
+- 기억하는 일정 수는 max_tracked로 제한 (넘치면 가장 오래전에 본 일정부터 제거)
+- 처음 보는 룸/날짜는 비교 대상이 없으므로 delta를 만들지 않음 (클라이언트는 전체 조회로 초기 상태 확보)
+- 구독자별 큐는 크기 제한: 넘치면 쌓인 변경분을 버리고 RESYNC 표식을 넣어 전체 재조회를 요청
+  (느린 클라이언트 때문에 메모리가 늘어나지 않도록)
+- 단일 이벤트 루프에서만 사용하므로 별도 Lock 없이 구독자 목록을 갱신
+
+비즈니스 맥락:
+- 폴링 사이에 바뀌는 슬롯은 극히 일부이므로 전체 AvailabilityResponse를 다시 받는 대신 바뀐 칸만 전송
+"""
+
+from __future__ import annotations
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from app.models.dto import AvailabilityDelta, DaySchedule, RoomDetail
+from app.utils.slot_mask import FULL_DAY_SLOTS
+
+# 구독 큐가 넘쳤을 때 넣는 표식 (클라이언트에 전체 재조회 요청)
+RESYNC = "resync"
+
+QueueItem = Union[AvailabilityDelta, str]
+
+# (crawler_type, business_id, biz_item_id, date)
+ScheduleKey = Tuple[str, str, str, str]
+
+
+def isoformat_epoch(epoch_seconds: float) -> str:
+    """epoch 초를 로컬 시간대 ISO 8601 문자열로 변환 (응답 / delta의 checked_at 형식)"""
+    return datetime.fromtimestamp(epoch_seconds).astimezone().isoformat(timespec="seconds")
+
+
+def diff_day_schedules(
+    previous: DaySchedule, current: DaySchedule, checked_at: Optional[str] = None
+) -> Optional[AvailabilityDelta]:
+    """두 하루 일정의 차이를 delta로 반환합니다. (바뀐 슬롯이 없으면 None)"""
+    # 대부분의 갱신은 변경이 없으므로 마스크 비교로 먼저 걸러냄
+    changed = (previous.available_mask ^ current.available_mask) | (previous.unknown_mask ^ current.unknown_mask)
+    if not changed:
+        return None
+
+    booked: List[str] = []
+    freed: List[str] = []
+    unknown: List[str] = []
+
+    for hour in range(24):
+        bit = 1 << hour
+        if not changed & bit:
+            continue
+        slot = FULL_DAY_SLOTS[hour]
+        if current.available_mask & bit:
+            freed.append(slot)
+        elif current.unknown_mask & bit:
+            unknown.append(slot)
+        else:
+            booked.append(slot)
+
+    room = current.room_detail
+    return AvailabilityDelta(
+        date=current.date,
+        business_id=room.business_id,
+        biz_item_id=room.biz_item_id,
+        booked=booked,
+        freed=freed,
+        unknown=unknown,
+        checked_at=checked_at,
+    )
+
+
+class ChangeSubscription:
+    """날짜 + 지도 영역 단위 변경분 구독
+
+    Attributes:
+        queue: 전달 대기 중인 delta (또는 RESYNC 표식)
+    """
+
+    def __init__(self, date: str, swLat: float, swLng: float, neLat: float, neLng: float, max_queue: int):
+        self.date = date
+        self.bounds = (swLat, swLng, neLat, neLng)
+        self.queue: asyncio.Queue[QueueItem] = asyncio.Queue(maxsize=max_queue)
+
+    def matches(self, date: str, room: RoomDetail) -> bool:
+        if date != self.date or room.lat is None or room.lng is None:
+            return False
+        swLat, swLng, neLat, neLng = self.bounds
+        return swLat <= room.lat <= neLat and swLng <= room.lng <= neLng
+
+    def push(self, item: QueueItem):
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # 밀린 변경분을 버리고 전체 재조회 요청
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class AvailabilityChangeFeed:
+    """delta 발행 / 구독 관리
+
+    Attributes:
+        max_queue: 구독자별 대기 delta 수 한도
+        max_tracked: 비교용으로 기억하는 직전 일정 수 한도
+    """
+
+    def __init__(self, max_queue: int = 256, max_tracked: int = 10000):
+        self.max_queue = max_queue
+        self.max_tracked = max_tracked
+        self._subscriptions: Set[ChangeSubscription] = set()
+        self._last_seen: Dict[ScheduleKey, DaySchedule] = {}
+        self.published = 0
+
+    def subscribe(self, date: str, swLat: float, swLng: float, neLat: float, neLng: float) -> ChangeSubscription:
+        subscription = ChangeSubscription(date, swLat, swLng, neLat, neLng, self.max_queue)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription):
+        self._subscriptions.discard(subscription)
+
+    def observe(self, crawler_type: str, schedule: DaySchedule, checked_at: Optional[str] = None):
+        """업스트림에서 새로 받은 일정을 직전에 본 일정과 비교하여 바뀐 경우 delta를 발행합니다."""
+        room = schedule.room_detail
+        key = (crawler_type, room.business_id, room.biz_item_id, schedule.date)
+        # 다시 넣어 삽입 순서를 최근 관측 순으로 유지
+        previous = self._last_seen.pop(key, None)
+        self._last_seen[key] = schedule
+        if len(self._last_seen) > self.max_tracked:
+            del self._last_seen[next(iter(self._last_seen))]
+
+        if previous is None:
+            return
+        delta = diff_day_schedules(previous, schedule, checked_at=checked_at)
+        if delta is not None:
+            self.publish(delta, room)
+
+    def publish(self, delta: AvailabilityDelta, room: RoomDetail):
+        """room이 구독 날짜 / 영역에 포함되는 구독자에게 delta를 전달합니다."""
+        self.published += 1
+        for subscription in self._subscriptions:
+            if subscription.matches(delta.date, room):
+                subscription.push(delta)
+
+    def clear(self):
+        self._subscriptions.clear()
+        self._last_seen.clear()
+        self.published = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"subscribers": len(self._subscriptions), "published": self.published}
+
+
+# Global singleton instance
+availability_changes = AvailabilityChangeFeed()
@@ -22,18 +22,33 @@
 from __future__ import annotations
 import asyncio
 import logging
-from app.models.dto import AvailabilityRequest, AvailabilityResponse, RoomAvailability, BranchStats
+import time
+from app.models.dto import (
+    AvailabilityRequest, AvailabilityResponse, AvailabilityStreamSummary, RoomAvailability, RoomDetail, BranchStats,
+    DaySchedule, FreeWindow, FreeWindowRequest, FreeWindowSearchResponse, RoomFreeWindows,
+)
 from app.validate.request_validator import validate_availability_request, validate_map_coordinates
-from app.utils.room_router import filter_rooms_by_type
-from app.crawler.base import BaseCrawler
+from app.validate.date_validator import validate_date_range
+from app.validate.room_detail_validator import validate_room_detail_list
+from app.utils.room_router import filter_rooms_by_type, get_room_type
+from app.crawler.base import BaseCrawler, DayResult, RoomResult
+from app.services.availability_cache import AvailabilityCache
+from app.services.availability_snapshot import AvailabilitySnapshotStore, isoformat_epoch
+from app.core.config import AVAILABILITY_DEADLINE_SECONDS, FREE_WINDOW_MAX_DAYS
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from app.exception.api.client_loader_exception import CircuitOpenError
 from app.exception.base_exception import BaseCustomException, ErrorCode
-from typing import List, Dict
-from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple, TypeVar, Union
 from app.utils.room_loader import get_rooms_by_criteria
+from app.utils.slot_mask import FULL_DAY_SLOTS, free_windows, parse_clock
+from datetime import datetime
 from fastapi import HTTPException
 
 logger = logging.getLogger("app")
 
+R = TypeVar("R")
+
+
 class AvailabilityService:
     """합주실 예약 가능 여부 조회 서비스.
     
@@ -50,6 +65,12 @@ class AvailabilityService:
     - Dependency Injection을 통해 크롤러 주입 (테스트 용이성)
     - 비동기 병렬 처리로 응답 속도 최적화 (asyncio.gather 사용)
     - 에러를 Exception 객체로 반환하여 로깅 후 필터링
+    - 캐시가 주입되면 (크롤러, 룸, 날짜) 단위 캐시를 거쳐 크롤러 호출 (AvailabilityCache)
+    - 크롤러별 응답 대기 한도(deadline)를 넘기면 해당 룸은 "unknown" 처리
+      (가장 느린 업스트림이 아니라 한도가 전체 응답 시간의 상한이 됨)
+    - 서킷 브레이커가 열린 크롤러/호스트의 룸은 호출 없이 "unknown" 처리
+    - snapshot 모드에서는 백그라운드 스냅샷(AvailabilitySnapshotStore)을 먼저 사용하고,
+      스냅샷이 없거나 오래된 룸만 실시간 조회 (룸별 조회 시각 checked_at 포함)
     
     사용 예시:
         >>> crawlers_map = {"dream": DreamCrawler(), "groove": GrooveCrawler()}
@@ -58,16 +79,35 @@ class AvailabilityService:
     
     Attributes:
         crawlers_map: 크롤러 타입을 키로, BaseCrawler 인스턴스를 값으로 하는 딕셔너리
+        cache: 룸별 예약 현황 캐시 (None이면 항상 크롤러 직접 호출)
+        deadline_seconds: 크롤러별 응답 대기 한도(초)
+        breakers: 크롤러 단위 서킷 브레이커 저장소
+        snapshots: 예약 현황 스냅샷 저장소 (None이면 snapshot 모드도 실시간 조회)
     """
 
-    def __init__(self, crawlers_map: dict[str, BaseCrawler]):
+    def __init__(
+        self,
+        crawlers_map: dict[str, BaseCrawler],
+        cache: AvailabilityCache | None = None,
+        deadline_seconds: float = AVAILABILITY_DEADLINE_SECONDS,
+        breakers: CircuitBreakerRegistry | None = None,
+        snapshots: AvailabilitySnapshotStore | None = None,
+    ):
         """서비스 초기화.
         
         Args:
             crawlers_map: 크롤러 타입(키)과 BaseCrawler 인스턴스(값)의 매핑 딕셔너리
                          예: {"dream": DreamCrawler(), "groove": GrooveCrawler()}
+            cache: 크롤러 앞단에 둘 AvailabilityCache 인스턴스 (선택)
+            deadline_seconds: 크롤러별 응답 대기 한도(초). 0 이하이면 제한 없음
+            breakers: 크롤러 단위 서킷 브레이커 저장소 (None이면 차단하지 않음)
+            snapshots: 예약 현황 스냅샷 저장소 (조회 수요 기록 + snapshot 모드 조회)
         """
         self.crawlers_map = crawlers_map
+        self.cache = cache
+        self.deadline_seconds = deadline_seconds
+        self.breakers = breakers
+        self.snapshots = snapshots
 
     # 시작시간과 종료시간으로 시간 슬롯 리스트 생성
     def generate_time_slots(self, start_str: str, end_str: str) -> List[str]:
@@ -75,56 +115,25 @@ class AvailabilityService:
         start_hour와 end_hour 사이의 1시간 단위 슬롯 리스트를 생성합니다.
         예: 14:00 ~ 16:00 -> ["14:00", "15:00", "16:00"]
         """
-        start_time = datetime.strptime(start_str, "%H:%M")
-        end_time = datetime.strptime(end_str, "%H:%M")
-        
-        if start_time > end_time:
+        start = parse_clock(start_str)
+        end = parse_clock(end_str)
+
+        if start > end:
             raise ValueError("시작 시간이 종료 시간보다 같거나 늦을 수 없습니다.")
 
-        slots = []
-        current_time = start_time
         # 종료 시간 전까지만 슬롯 생성 (예: 14~16시면 14, 15, 16시 타임 예약 필요)
-        while current_time <= end_time:
-            slots.append(current_time.strftime("%H:%M"))
-            current_time += timedelta(hours=1)
-            
-        return slots
+        last_hour = end[0] if start[1] <= end[1] else end[0] - 1
+        if start[1] == 0:
+            return FULL_DAY_SLOTS[start[0]:last_hour + 1]
+        return [f"{hour:02d}:{start[1]:02d}" for hour in range(start[0], last_hour + 1)]
         
 
     async def check_availability(self, request: AvailabilityRequest) -> AvailabilityResponse:
         """Check room availability for a specific map area and criteria."""
 
-        # 1. 시간 범위(Range) -> 시간 슬롯 리스트(List) 변환
-        # 예: 14:00 ~ 16:00 -> ["14:00", "15:00", "16:00"]
-        try:
-            hour_slots = self.generate_time_slots(request.start_hour, request.end_hour)
-        except ValueError as e:
-            logger.error(f"Time slot generation error: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-        
-        # 1.5. 지도 좌표 유효성 검증 (필수)
-        validate_map_coordinates(request.swLat, request.swLng, request.neLat, request.neLng)
+        hour_slots, jobs = self._prepare_jobs(request)
 
-
-        # 2. 인원수 및 지도 범위에 맞는 룸 필터링 (DB)
-        target_rooms = get_rooms_by_criteria(
-            capacity=request.capacity,
-            swLat=request.swLat,
-            swLng=request.swLng,
-            neLat=request.neLat,
-            neLng=request.neLng
-        )
-
-        validate_availability_request(request.date, hour_slots, target_rooms)
-
-        # 3. 크롤러 작업 준비 및 실행
-        tasks = []
-        for crawler_type, crawler in self.crawlers_map.items():
-            filtered_rooms = filter_rooms_by_type(target_rooms, crawler_type)
-            if filtered_rooms:
-                tasks.append(crawler.check_availability(request.date, hour_slots, filtered_rooms))
-
-        if not tasks:
+        if not jobs:
             return AvailabilityResponse(
                 date=request.date,
                 start_hour=request.start_hour,
@@ -135,7 +144,7 @@ class AvailabilityService:
                 branch_summary={}
             )
 
-        results_of_lists = await asyncio.gather(*tasks)
+        results_of_lists = await asyncio.gather(*jobs)
         all_results = [item for sublist in results_of_lists for item in sublist]
 
         self._log_errors(all_results, request.date)
@@ -147,27 +156,10 @@ class AvailabilityService:
         branch_summary = {}
 
         for res in successful_results:
-            # 룸 정보 추출
-            room_detail = res.room_detail
-            
             # 예약 가능한 룸만 결과 리스트에 포함
             if res.available is True:
                 available_results.append(res)
-
-                # 지점 요약 정보 업데이트 (branch_summary) - 지도 기능용
-                bid = room_detail.business_id
-                if bid not in branch_summary:
-                    branch_summary[bid] = BranchStats(
-                        min_price=room_detail.pricePerHour,
-                        available_count=1,
-                        lat=room_detail.lat,
-                        lng=room_detail.lng
-                    )
-                else:
-                    stats = branch_summary[bid]
-                    stats.available_count += 1
-                    if room_detail.pricePerHour < stats.min_price:
-                        stats.min_price = room_detail.pricePerHour
+                self._add_to_branch_summary(branch_summary, res)
 
         return AvailabilityResponse(
             date=request.date,
@@ -179,7 +171,380 @@ class AvailabilityService:
             branch_summary=branch_summary
         )
 
+    async def stream_availability(
+        self, request: AvailabilityRequest
+    ) -> AsyncIterator[Tuple[str, Union[RoomAvailability, Dict[str, BranchStats], AvailabilityStreamSummary]]]:
+        """크롤러가 끝나는 순서대로 결과 프레임을 내보내는 스트리밍 조회.
+
+        요청 검증은 호출 시점에 즉시 수행하고(에러는 일반 응답과 동일하게 전파),
+        크롤러 실행은 반환된 비동기 이터레이터를 소비할 때 시작됩니다.
+
+        프레임 종류:
+        - ("room", RoomAvailability): 예약 가능한 룸 1개
+        - ("branch_summary", {business_id: BranchStats}): 이번 크롤러 결과로 바뀐 지점만 담은 delta
+        - ("summary", AvailabilityStreamSummary): 마지막 프레임 (전체 집계)
+
+        비즈니스 맥락:
+        - 가장 느린 업스트림(주로 로그인이 필요한 Groove)을 기다리지 않고 지도 마커를 점진적으로 표시
+        """
+        hour_slots, jobs = self._prepare_jobs(request)
+        return self._stream_frames(request, hour_slots, jobs)
+
+    async def _stream_frames(
+        self,
+        request: AvailabilityRequest,
+        hour_slots: List[str],
+        jobs: List[Awaitable[List[RoomResult]]],
+    ):
+        tasks = [asyncio.ensure_future(job) for job in jobs]
+        branch_summary: Dict[str, BranchStats] = {}
+        available_ids: List[str] = []
+        failed_count = 0
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                results = await next_done
+                self._log_errors(results, request.date)
+
+                changed = []
+                for res in results:
+                    if isinstance(res, Exception):
+                        failed_count += 1
+                        continue
+                    if res.available is True:
+                        available_ids.append(res.room_detail.biz_item_id)
+                        changed.append(self._add_to_branch_summary(branch_summary, res))
+                        yield "room", res
+
+                if changed:
+                    yield "branch_summary", {
+                        bid: branch_summary[bid].model_copy() for bid in dict.fromkeys(changed)
+                    }
+        finally:
+            # 클라이언트가 중간에 연결을 끊으면 남은 크롤러 작업 정리
+            for task in tasks:
+                task.cancel()
+
+        yield "summary", AvailabilityStreamSummary(
+            date=request.date,
+            start_hour=request.start_hour,
+            end_hour=request.end_hour,
+            hour_slots=hour_slots,
+            available_biz_item_ids=available_ids,
+            branch_summary=branch_summary,
+            failed_count=failed_count,
+        )
+
+    def _prepare_jobs(self, request: AvailabilityRequest) -> Tuple[List[str], List[Awaitable[List[RoomResult]]]]:
+        """요청 검증 + 대상 룸 조회 후 크롤러별 조회 작업(코루틴)을 만듭니다."""
+
+        # 1. 시간 범위(Range) -> 시간 슬롯 리스트(List) 변환
+        # 예: 14:00 ~ 16:00 -> ["14:00", "15:00", "16:00"]
+        try:
+            hour_slots = self.generate_time_slots(request.start_hour, request.end_hour)
+        except ValueError as e:
+            logger.error(f"Time slot generation error: {e}")
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # 1.5. 지도 좌표 유효성 검증 (필수)
+        validate_map_coordinates(request.swLat, request.swLng, request.neLat, request.neLng)
+
+
+        # 2. 인원수 및 지도 범위에 맞는 룸 필터링 (DB)
+        target_rooms = get_rooms_by_criteria(
+            capacity=request.capacity,
+            swLat=request.swLat,
+            swLng=request.swLng,
+            neLat=request.neLat,
+            neLng=request.neLng
+        )
+
+        validate_availability_request(request.date, hour_slots, target_rooms)
+
+        if self.snapshots is not None:
+            # 스냅샷 갱신 주기 조절용 (날짜, 지점)별 조회 수요 기록
+            self.snapshots.record_demand(request.date, target_rooms)
+        use_snapshot = request.mode == "snapshot" and self.snapshots is not None
+
+        # 3. 크롤러 작업 준비
+        jobs = []
+        for crawler_type, crawler in self.crawlers_map.items():
+            filtered_rooms = filter_rooms_by_type(target_rooms, crawler_type)
+            if not filtered_rooms:
+                continue
+            if use_snapshot:
+                jobs.append(self._run_from_snapshot(crawler_type, crawler, request.date, hour_slots, filtered_rooms))
+            else:
+                jobs.append(self._run_crawler(crawler_type, crawler, request.date, hour_slots, filtered_rooms))
+        return hour_slots, jobs
+
+    async def _run_from_snapshot(
+        self,
+        crawler_type: str,
+        crawler: BaseCrawler,
+        date: str,
+        hour_slots: List[str],
+        rooms: List[RoomDetail],
+    ) -> List[RoomResult]:
+        """스냅샷이 있는 룸은 스냅샷으로, 없거나 오래된 룸만 실시간 조회하여 rooms 순서대로 반환합니다."""
+        entries = self.snapshots.lookup(crawler_type, date, rooms)
+        missing = [room for room, entry in zip(rooms, entries) if entry is None]
+        live = iter(await self._run_crawler(crawler_type, crawler, date, hour_slots, missing) if missing else [])
+
+        results: List[RoomResult] = []
+        for entry in entries:
+            if entry is None:
+                results.append(next(live))
+                continue
+            fetched_at, schedule = entry
+            availability = schedule.to_room_availability(hour_slots)
+            availability.checked_at = isoformat_epoch(fetched_at)
+            results.append(availability)
+        return results
+
+    async def recheck_room(self, date: str, start_hour: str, end_hour: str, business_id: str, biz_item_id: str) -> RoomAvailability:
+        """룸 1개를 캐시 / 스냅샷 없이 업스트림에서 다시 조회합니다. (예약 직전 최종 확인용)
+
+        조회한 하루 일정은 스냅샷 저장소에도 반영하여 이후 snapshot 모드 조회가 최신 상태를 사용합니다.
+
+        Raises:
+            HTTPException(400): 시간 범위 오류
+            HTTPException(404): 해당 룸이 카탈로그에 없음
+            BaseCustomException: 조회 실패 (크롤러 예외 그대로 전파)
+        """
+        try:
+            hour_slots = self.generate_time_slots(start_hour, end_hour)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        room = next(
+            (r for r in get_rooms_by_criteria(capacity=0) if r.business_id == business_id and r.biz_item_id == biz_item_id),
+            None,
+        )
+        if room is None:
+            raise HTTPException(status_code=404, detail="해당 룸을 찾을 수 없습니다.")
+        validate_availability_request(date, hour_slots, [room])
+
+        crawler_type = get_room_type(business_id)
+        crawler = self.crawlers_map.get(crawler_type)
+        if crawler is None:
+            raise HTTPException(status_code=404, detail=f"{crawler_type} 크롤러가 등록되어 있지 않습니다.")
+
+        fetched_at = time.time()
+        result = (await crawler.fetch_day_schedules(date, [room]))[0]
+        if isinstance(result, Exception):
+            raise result
+
+        if self.snapshots is not None:
+            self.snapshots.put(crawler_type, result, fetched_at=fetched_at)
+        availability = result.to_room_availability(hour_slots)
+        availability.checked_at = isoformat_epoch(fetched_at)
+        return availability
+
+    async def find_free_windows(self, request: FreeWindowRequest) -> FreeWindowSearchResponse:
+        """날짜 범위 안에서 duration시간 이상 연속으로 예약 가능한 구간을 룸별로 모두 찾습니다.
+
+        (룸, 날짜)마다 하루 전체 일정을 한 번만 조회(캐시 경유)하고,
+        예약 가능 마스크에 슬라이딩 윈도우(shift AND)를 적용해 구간을 계산합니다.
+        오늘 날짜는 이미 지난 시간대를 제외합니다.
+
+        비즈니스 맥락:
+        - 날짜 / 시간대를 바꿔 가며 여러 번 조회하던 것을 서버 측 한 번의 검색으로 대체
+
+        Raises:
+            InvalidDateRangeError: 날짜 순서 오류 또는 FREE_WINDOW_MAX_DAYS 초과
+            HTTPException(400): 지도 좌표 오류
+        """
+        dates = validate_date_range(request.start_date, request.end_date, FREE_WINDOW_MAX_DAYS)
+        validate_map_coordinates(request.swLat, request.swLng, request.neLat, request.neLng)
+
+        target_rooms = get_rooms_by_criteria(
+            capacity=request.capacity,
+            swLat=request.swLat,
+            swLng=request.swLng,
+            neLat=request.neLat,
+            neLng=request.neLng
+        )
+        validate_room_detail_list(target_rooms)
+
+        jobs = []
+        job_keys: List[Tuple[str, List[RoomDetail]]] = []
+        for date in dates:
+            if self.snapshots is not None:
+                self.snapshots.record_demand(date, target_rooms)
+            for crawler_type, crawler in self.crawlers_map.items():
+                filtered_rooms = filter_rooms_by_type(target_rooms, crawler_type)
+                if not filtered_rooms:
+                    continue
+                jobs.append(self._run_day_schedules(crawler_type, crawler, date, filtered_rooms))
+                job_keys.append((date, filtered_rooms))
+
+        results_of_lists = await asyncio.gather(*jobs)
+
+        now = datetime.now()
+        today = now.date().isoformat()
+        # 현재 시각과 같거나 이전인 정시 슬롯은 지난 시간대로 간주 (시간 검증과 동일 기준)
+        past_mask = (1 << (now.hour + 1)) - 1
+
+        windows: Dict[Tuple[str, str], List[FreeWindow]] = {}
+        failed_count = 0
+        for (date, rooms), results in zip(job_keys, results_of_lists):
+            self._log_errors(results, date)
+            for room, result in zip(rooms, results):
+                if isinstance(result, Exception):
+                    failed_count += 1
+                    continue
+                mask = result.available_mask & ~past_mask if date == today else result.available_mask
+                for start, end in free_windows(mask, request.duration):
+                    windows.setdefault((room.business_id, room.biz_item_id), []).append(FreeWindow(
+                        date=date,
+                        start_hour=FULL_DAY_SLOTS[start],
+                        end_hour=FULL_DAY_SLOTS[end],
+                        hours=end - start + 1,
+                    ))
+
+        rooms_with_windows = []
+        for room in target_rooms:
+            room_windows = windows.get((room.business_id, room.biz_item_id))
+            if room_windows:
+                room_windows.sort(key=lambda w: (w.date, w.start_hour))
+                rooms_with_windows.append(RoomFreeWindows(room_detail=room, windows=room_windows))
+
+        return FreeWindowSearchResponse(
+            start_date=request.start_date,
+            end_date=request.end_date,
+            duration=request.duration,
+            rooms=rooms_with_windows,
+            failed_count=failed_count,
+        )
+
+    @staticmethod
+    def _add_to_branch_summary(branch_summary: Dict[str, BranchStats], res: RoomAvailability) -> str:
+        """예약 가능한 룸을 지점 요약 정보(branch_summary)에 반영하고 business_id를 반환 - 지도 기능용"""
+        room_detail = res.room_detail
+        bid = room_detail.business_id
+        if bid not in branch_summary:
+            branch_summary[bid] = BranchStats(
+                min_price=room_detail.pricePerHour,
+                available_count=1,
+                lat=room_detail.lat,
+                lng=room_detail.lng
+            )
+        else:
+            stats = branch_summary[bid]
+            stats.available_count += 1
+            if room_detail.pricePerHour < stats.min_price:
+                stats.min_price = room_detail.pricePerHour
+        return bid
+
+    async def _run_crawler(
+        self,
+        crawler_type: str,
+        crawler: BaseCrawler,
+        date: str,
+        hour_slots: List[str],
+        rooms: List[RoomDetail],
+    ) -> List[RoomResult]:
+        """크롤러 호출 (캐시가 있으면 캐시 경유) + 서킷 브레이커 + 응답 대기 한도(deadline) 적용.
+
+        - 크롤러 서킷이 열려 있으면 호출 없이 모든 룸을 "unknown"으로 응답
+        - deadline 안에 끝나지 않으면 해당 크롤러의 룸은 모두 "unknown"으로 응답
+          (캐시 경유 조회는 별도 Task로 계속 진행되어, 늦게 도착한 결과도 다음 요청에서 재사용)
+        - 호스트 서킷이 열려 호출되지 않은 룸(CircuitOpenError)도 "unknown"으로 변환
+        """
+        def call() -> Awaitable[List[RoomResult]]:
+            if self.cache is None:
+                return crawler.check_availability(date, hour_slots, rooms)
+            return self.cache.check_availability(crawler_type, crawler, date, hour_slots, rooms)
+
+        return await self._guarded_call(
+            crawler_type, date, rooms, call,
+            unknown=lambda room: DaySchedule.unknown(room, date).to_room_availability(hour_slots),
+        )
+
+    async def _run_day_schedules(
+        self,
+        crawler_type: str,
+        crawler: BaseCrawler,
+        date: str,
+        rooms: List[RoomDetail],
+    ) -> List[DayResult]:
+        """_run_crawler와 같은 보호 장치를 거쳐 룸별 하루 전체 일정을 조회합니다."""
+        def call() -> Awaitable[List[DayResult]]:
+            if self.cache is None:
+                return crawler.fetch_day_schedules(date, rooms)
+            return self.cache.fetch_day_schedules(crawler_type, crawler, date, rooms)
+
+        return await self._guarded_call(
+            crawler_type, date, rooms, call,
+            unknown=lambda room: DaySchedule.unknown(room, date),
+        )
+
+    async def refresh_day_schedules(
+        self,
+        crawler_type: str,
+        crawler: BaseCrawler,
+        date: str,
+        rooms: List[RoomDetail],
+    ) -> List[Optional[DayResult]]:
+        """스냅샷 갱신용 하루 일정 조회 (SnapshotScheduler의 fetch).
+
+        캐시 없이 업스트림에서 새로 받되 live 조회와 같은 크롤러 서킷 브레이커 / deadline을 적용합니다.
+        서킷 차단 / deadline 초과로 조회하지 못한 룸은 None으로 반환하여
+        unknown 일정이 기존 스냅샷을 덮어쓰지 않게 합니다.
+        """
+        return await self._guarded_call(
+            crawler_type, date, rooms, lambda: crawler.fetch_day_schedules(date, rooms),
+            unknown=lambda room: None,
+        )
+
+    async def _guarded_call(
+        self,
+        crawler_type: str,
+        date: str,
+        rooms: List[RoomDetail],
+        call: Callable[[], Awaitable[List[R]]],
+        unknown: Callable[[RoomDetail], R],
+    ) -> List[R]:
+        """서킷 브레이커 + deadline을 적용해 call()을 실행하고, 조회하지 못한 룸은 unknown(room)으로 채웁니다."""
+        breaker = self.breakers.for_crawler(crawler_type) if self.breakers is not None else None
+        if breaker is not None and not breaker.allow_request():
+            return [unknown(room) for room in rooms]
+
+        try:
+            if self.deadline_seconds <= 0:
+                results = await call()
+            else:
+                results = await asyncio.wait_for(call(), timeout=self.deadline_seconds)
+        except asyncio.TimeoutError:
+            logger.warning({
+                "timestamp": date,
+                "message": f"{crawler_type} 크롤러가 응답 대기 한도({self.deadline_seconds}초)를 넘겨 unknown으로 응답합니다.",
+                "room_count": len(rooms),
+            })
+            if breaker is not None:
+                breaker.record_failure()
+            return [unknown(room) for room in rooms]
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.record_abandoned()
+            raise
+
+        if breaker is not None:
+            # 호스트 서킷 차단(CircuitOpenError)은 실제 호출이 아니므로 판정에서 제외
+            attempted = [r for r in results if not isinstance(r, CircuitOpenError)]
+            # 모든 룸이 실패했을 때만 크롤러 장애로 간주 (일부 룸 실패는 룸 단위 문제)
+            if not attempted:
+                breaker.record_abandoned()
+            elif all(isinstance(r, Exception) for r in attempted):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
 
+        return [
+            unknown(room) if isinstance(result, CircuitOpenError) else result
+            for room, result in zip(rooms, results)
+        ]
 
     def _log_errors(self, results: list[RoomAvailability | Exception], date_context: str):
         """크롤링 결과에서 에러를 추출하여 로깅.
@@ -0,0 +1,313 @@
+"""
+예약 현황 스냅샷 (백그라운드 사전 조회)
+
+요청 시점에 업스트림을 조회하는 대신, 스케줄러가 앞으로 N일간 모든 룸의 하루 일정(DaySchedule)을
+주기적으로 미리 받아 스냅샷 저장소에 보관합니다. AvailabilityService는 "snapshot" 모드에서
+저장소를 먼저 읽어 업스트림 지연 없이 응답하고, 룸별 조회 시각(checked_at)을 함께 내려줍니다.
+
+갱신 주기:
+- 기본 주기(SNAPSHOT_REFRESH_SECONDS)에서 시작
+- 먼 날짜일수록 길게: 오늘로부터 SNAPSHOT_DISTANCE_DAYS일 멀어질 때마다 기본 주기만큼 추가
+- 최근 조회가 많은 (날짜, 지점)일수록 짧게: 감쇠하는 조회 수요(demand)로 나눔
+- 최소 주기(SNAPSHOT_MIN_REFRESH_SECONDS) 아래로는 줄이지 않음
+
+설계 결정:
+- 갱신 단위는 (날짜, 크롤러, 지점)이며 한 번의 갱신에서 같은 날짜 / 크롤러의 룸을 묶어
+  fetch_day_schedules로 조회 (네이버 배치, 그루브 한 페이지 파싱 등 크롤러 최적화를 그대로 활용)
+- 조회 실패한 룸은 기존 스냅샷을 유지 (오래되면 SNAPSHOT_MAX_AGE_SECONDS 기준으로 사용 중단)
+- 스냅샷이 없거나 오래된 룸은 서비스가 실시간 조회로 대체
+- 새로 저장하는 일정은 변경 구독(AvailabilityChangeFeed)에도 전달하여 직전에 본 일정과 바뀐 칸을 발행
+- 단일 이벤트 루프에서만 사용하므로 별도 Lock 없이 상태를 갱신
+- 업스트림 조회는 fetch(AvailabilityService.refresh_day_schedules)를 거쳐 live 조회와 같은
+  크롤러 서킷 브레이커 / 응답 대기 한도를 적용 (장애 중인 업스트림을 갱신 주기마다 두드리지 않음)
+- 스케줄러는 배포당 하나: 여러 워커로 실행하면 SNAPSHOT_SCHEDULER_LOCK_FILE 파일 잠금을 잡은 워커만 실행
+  (스냅샷 저장소는 프로세스 메모리이므로 나머지 워커의 snapshot 모드는 실시간 조회로 대체됨.
+  배포 스크립트는 --workers 1 기준)
+
+비즈니스 맥락:
+- 지도 이동마다 업스트림 3곳을 기다리지 않고 수 ms 안에 마커를 표시
+- 실제 예약 직전에는 recheck(실시간 재조회)로 최신 상태를 확인
+"""
+
+from __future__ import annotations
+import asyncio
+import fcntl
+import logging
+import math
+import time
+from datetime import date as date_type, datetime, timedelta
+from typing import Awaitable, Callable, Dict, IO, Iterable, List, Optional, Tuple
+
+from app.core.config import (
+    AVAILABILITY_SNAPSHOT_DAYS,
+    SNAPSHOT_DEMAND_HALF_LIFE_SECONDS,
+    SNAPSHOT_DISTANCE_DAYS,
+    SNAPSHOT_MAX_AGE_SECONDS,
+    SNAPSHOT_MIN_REFRESH_SECONDS,
+    SNAPSHOT_REFRESH_SECONDS,
+    SNAPSHOT_SCHEDULER_LOCK_FILE,
+)
+from app.crawler.base import BaseCrawler, DayResult
+from app.services.availability_changes import AvailabilityChangeFeed, availability_changes, isoformat_epoch
+from app.models.dto import DaySchedule, RoomDetail
+from app.utils.room_router import filter_rooms_by_type
+
+logger = logging.getLogger("app")
+
+# (crawler_type, business_id, biz_item_id, date)
+SnapshotKey = Tuple[str, str, str, str]
+# (fetched_at: epoch 초, 하루 일정)
+SnapshotEntry = Tuple[float, DaySchedule]
+# (crawler_type, crawler, date, rooms) -> rooms 순서의 결과 (조회하지 못한 룸은 None)
+DayScheduleFetcher = Callable[[str, BaseCrawler, str, List[RoomDetail]], Awaitable[List[Optional[DayResult]]]]
+
+
+class AvailabilitySnapshotStore:
+    """(크롤러, 룸, 날짜) 단위 하루 일정 스냅샷 + (날짜, 지점) 단위 조회 수요
+
+    Attributes:
+        max_age_seconds: 이 시간보다 오래된 스냅샷은 조회 시 없는 것으로 취급
+        demand_half_life_seconds: 조회 수요 감쇠 반감기(초)
+        feed: 변경분을 발행할 구독 관리자 (None이면 변경 감지 안 함)
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = SNAPSHOT_MAX_AGE_SECONDS,
+        demand_half_life_seconds: float = SNAPSHOT_DEMAND_HALF_LIFE_SECONDS,
+        clock: Callable[[], float] = time.time,
+        feed: Optional[AvailabilityChangeFeed] = None,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self.demand_half_life_seconds = demand_half_life_seconds
+        self._clock = clock
+        self.feed = feed
+        self._entries: Dict[SnapshotKey, SnapshotEntry] = {}
+        # (date, business_id) -> (마지막 갱신 시각, 감쇠 적용 전 수요 점수)
+        self._demand: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+    def put(self, crawler_type: str, schedule: DaySchedule, fetched_at: Optional[float] = None):
+        room = schedule.room_detail
+        key = (crawler_type, room.business_id, room.biz_item_id, schedule.date)
+        fetched_at = self._clock() if fetched_at is None else fetched_at
+
+        if self.feed is not None:
+            self.feed.observe(crawler_type, schedule, checked_at=isoformat_epoch(fetched_at))
+
+        self._entries[key] = (fetched_at, schedule)
+
+    def lookup(self, crawler_type: str, date: str, rooms: List[RoomDetail]) -> List[Optional[SnapshotEntry]]:
+        """rooms 순서대로 유효한 스냅샷(없거나 오래되었으면 None)을 반환합니다."""
+        oldest = self._clock() - self.max_age_seconds
+        results: List[Optional[SnapshotEntry]] = []
+        for room in rooms:
+            entry = self._entries.get((crawler_type, room.business_id, room.biz_item_id, date))
+            results.append(entry if entry is not None and entry[0] >= oldest else None)
+        return results
+
+    def record_demand(self, date: str, rooms: Iterable[RoomDetail]):
+        """조회 요청 1건을 (날짜, 지점)별 수요로 기록합니다."""
+        now = self._clock()
+        for business_id in {room.business_id for room in rooms}:
+            key = (date, business_id)
+            self._demand[key] = (now, self._decayed(key, now) + 1.0)
+
+    def demand(self, date: str, business_id: str) -> float:
+        """감쇠를 적용한 현재 수요 점수 (최근 조회 수의 근사값)"""
+        return self._decayed((date, business_id), self._clock())
+
+    def _decayed(self, key: Tuple[str, str], now: float) -> float:
+        entry = self._demand.get(key)
+        if entry is None:
+            return 0.0
+        updated_at, score = entry
+        if self.demand_half_life_seconds <= 0:
+            return score
+        return score * math.pow(0.5, (now - updated_at) / self.demand_half_life_seconds)
+
+    def prune(self, before_date: str):
+        """before_date 이전 날짜의 스냅샷 / 수요를 제거합니다."""
+        for key in [key for key in self._entries if key[3] < before_date]:
+            del self._entries[key]
+        for key in [key for key in self._demand if key[0] < before_date]:
+            del self._demand[key]
+
+    def clear(self):
+        self._entries.clear()
+        self._demand.clear()
+
+    def snapshot(self) -> Dict[str, object]:
+        now = self._clock()
+        ages = [now - fetched_at for fetched_at, _ in self._entries.values()]
+        return {
+            "entries": len(self._entries),
+            "dates": len({key[3] for key in self._entries}),
+            "oldest_age_seconds": round(max(ages), 1) if ages else None,
+        }
+
+
+class SnapshotScheduler:
+    """앞으로 days일간 모든 룸의 스냅샷을 주기적으로 갱신하는 백그라운드 작업
+
+    Attributes:
+        days: 오늘부터 사전 조회할 날짜 수 (0이면 비활성화)
+        base_interval: 기본 갱신 주기(초)
+        min_interval: 최소 갱신 주기(초)
+        distance_days: 이 일수만큼 멀어질 때마다 기본 주기만큼 갱신 주기 증가
+        tick_seconds: 갱신 대상 확인 주기(초)
+        lock_path: 스케줄러 실행 권한 파일 잠금 경로 (None이면 잠금 없이 실행)
+    """
+
+    def __init__(
+        self,
+        crawlers_map: Dict[str, BaseCrawler],
+        store: AvailabilitySnapshotStore,
+        room_loader: Callable[[], List[RoomDetail]],
+        days: int = AVAILABILITY_SNAPSHOT_DAYS,
+        base_interval: float = SNAPSHOT_REFRESH_SECONDS,
+        min_interval: float = SNAPSHOT_MIN_REFRESH_SECONDS,
+        distance_days: float = SNAPSHOT_DISTANCE_DAYS,
+        tick_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+        today: Callable[[], date_type] = lambda: datetime.now().date(),
+        fetch: Optional[DayScheduleFetcher] = None,
+        lock_path: Optional[str] = SNAPSHOT_SCHEDULER_LOCK_FILE or None,
+    ):
+        self.crawlers_map = crawlers_map
+        # 기본값은 크롤러 직접 호출 (운영에서는 AvailabilityService.refresh_day_schedules 주입)
+        self._fetch = fetch or (lambda crawler_type, crawler, date, rooms: crawler.fetch_day_schedules(date, rooms))
+        self.lock_path = lock_path
+        self._lock_file: Optional[IO] = None
+        self.store = store
+        self._room_loader = room_loader
+        self.days = days
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.distance_days = distance_days
+        self.tick_seconds = tick_seconds
+        self._clock = clock
+        self._today = today
+        # (date, crawler_type, business_id) -> 마지막 갱신 시각
+        self._last_refresh: Dict[Tuple[str, str, str], float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.days > 0
+
+    def refresh_interval(self, date: str, business_id: str) -> float:
+        """(날짜, 지점)의 갱신 주기(초): 먼 날짜는 길게, 수요가 많으면 짧게"""
+        days_ahead = max(0, (datetime.strptime(date, "%Y-%m-%d").date() - self._today()).days)
+        interval = self.base_interval * (1 + days_ahead / self.distance_days if self.distance_days > 0 else 1)
+        interval /= 1 + self.store.demand(date, business_id)
+        return max(self.min_interval, interval)
+
+    async def refresh_due(self) -> int:
+        """갱신 주기가 지난 (날짜, 크롤러, 지점)을 갱신하고 갱신한 룸 수를 반환합니다."""
+        today = self._today()
+        dates = [(today + timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(self.days)]
+        if not dates:
+            return 0
+        self.store.prune(dates[0])
+        for key in [key for key in self._last_refresh if key[0] < dates[0]]:
+            del self._last_refresh[key]
+
+        # 룸 카탈로그 조회는 동기 함수(인덱스 만료 시 DB 조회)이므로 스레드에서 실행
+        rooms = await asyncio.to_thread(self._room_loader)
+        refreshed = 0
+        for date in dates:
+            jobs = []
+            for crawler_type, crawler in self.crawlers_map.items():
+                due = self._due_rooms(date, crawler_type, filter_rooms_by_type(rooms, crawler_type))
+                if due:
+                    jobs.append(self._refresh(date, crawler_type, crawler, due))
+            # 같은 날짜의 크롤러들은 병렬, 날짜는 순차 (업스트림 요청 폭주 방지)
+            refreshed += sum(await asyncio.gather(*jobs))
+        return refreshed
+
+    def _due_rooms(self, date: str, crawler_type: str, rooms: List[RoomDetail]) -> List[RoomDetail]:
+        now = self._clock()
+        due_business_ids = {
+            business_id for business_id in {room.business_id for room in rooms}
+            if now - self._last_refresh.get((date, crawler_type, business_id), -math.inf)
+            >= self.refresh_interval(date, business_id)
+        }
+        return [room for room in rooms if room.business_id in due_business_ids]
+
+    async def _refresh(self, date: str, crawler_type: str, crawler: BaseCrawler, rooms: List[RoomDetail]) -> int:
+        started = self._clock()
+        try:
+            results = await self._fetch(crawler_type, crawler, date, rooms)
+        except Exception as e:
+            logger.warning({
+                "timestamp": date,
+                "message": f"{crawler_type} 스냅샷 갱신 실패, 기존 스냅샷을 유지합니다.",
+                "error_detail": str(e),
+            })
+            results = []
+
+        stored = 0
+        for result in results:
+            if isinstance(result, DaySchedule):
+                self.store.put(crawler_type, result, fetched_at=started)
+                stored += 1
+        # 실패한 지점도 다음 주기까지는 다시 시도하지 않음 (업스트림 장애 시 재시도 폭주 방지)
+        for business_id in {room.business_id for room in rooms}:
+            self._last_refresh[(date, crawler_type, business_id)] = started
+        return stored
+
+    async def run_forever(self):
+        while True:
+            try:
+                refreshed = await self.refresh_due()
+                if refreshed:
+                    logger.info({"message": "예약 현황 스냅샷 갱신", "room_count": refreshed})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error({"message": "예약 현황 스냅샷 갱신 중 오류", "error_detail": str(e)})
+            await asyncio.sleep(self.tick_seconds)
+
+    def start(self) -> bool:
+        """백그라운드 갱신 시작 (비활성화 상태, 이미 실행 중, 다른 워커가 실행 중이면 무시)
+
+        Returns:
+            이 프로세스에서 스케줄러가 실행 중인지 여부
+        """
+        if not self.enabled:
+            return False
+        if self._task is None:
+            if not self._acquire_lock():
+                logger.info({"message": "다른 워커가 예약 현황 스냅샷 스케줄러를 실행 중이므로 이 워커에서는 실행하지 않습니다."})
+                return False
+            self._task = asyncio.create_task(self.run_forever())
+        return True
+
+    def _acquire_lock(self) -> bool:
+        if self.lock_path is None:
+            return True
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        # 프로세스가 끝나거나 파일을 닫으면 잠금이 풀림
+        self._lock_file = lock_file
+        return True
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+# Global singleton instance
+availability_snapshots = AvailabilitySnapshotStore(feed=availability_changes)
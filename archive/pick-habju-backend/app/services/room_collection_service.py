@@ -1,31 +1,59 @@
+import os
+import time
 import logging
 import asyncio
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional
 from app.crawler.naver_map_crawler import NaverMapCrawler
+from app.crawler.naver_place_search import NaverPlaceSearch
 from app.crawler.naver_room_fetcher import NaverRoomFetcher
 from app.services.room_parser_service import RoomParserService
 from app.core.supabase_client import get_supabase_client
+from app.core.config import MAP_SEARCH_BACKEND
 
 logger = logging.getLogger(__name__)
 
+# 파이프라인 단계 종료 신호 (워커 수만큼 다음 단계 큐에 넣음)
+_DONE = object()
+
 class RoomCollectionService:
-    """Service for collecting and parsing rehearsal room data."""
+    """Service for collecting and parsing rehearsal room data.
+
+    여러 지점을 수집할 때는 단계별 asyncio 파이프라인을 사용합니다.
+    discover(지도 검색) → fetch(네이버 GraphQL) → parse(LLM) → persist(Supabase)
+
+    설계 결정:
+    - 단계 사이 큐는 QUEUE_SIZE로 제한 → LLM 단계가 밀리면 fetch 워커가 대기 (backpressure)
+    - LLM 동시 호출 수(MAX_CONCURRENT_BATCHES)는 parse 워커 전체가 공유
+    - 지점 단위 실패는 집계만 하고 다른 지점 수집은 계속 진행
+    """
     
     # Tunable parameters for concurrency
     BATCH_SIZE = 5           # Number of rooms per LLM batch call
     MAX_CONCURRENT_BATCHES = 3  # Number of parallel LLM calls
+
+    # Pipeline worker counts per stage / bounded queue size between stages
+    FETCH_WORKERS = int(os.getenv("COLLECT_FETCH_WORKERS", "4"))
+    PARSE_WORKERS = int(os.getenv("COLLECT_PARSE_WORKERS", "2"))
+    PERSIST_WORKERS = int(os.getenv("COLLECT_PERSIST_WORKERS", "1"))
+    QUEUE_SIZE = int(os.getenv("COLLECT_QUEUE_SIZE", "8"))
     
     # Capacity value indicating LLM parsing failure - flags for manual review
     # Rationale: 100명을 수용하는 합주실은 현실적으로 없으므로 수동 검토 필요 항목으로 식별 가능
     MANUAL_REVIEW_FLAG = 100
 
-    def __init__(self):
-        self.map_crawler = NaverMapCrawler()
+    def __init__(self, map_search_backend: str = MAP_SEARCH_BACKEND):
+        # 지도 검색 backend: "http"면 브라우저 없이 장소 검색 API 직접 호출, 그 외에는 Playwright 크롤러
+        self.map_crawler = NaverPlaceSearch() if map_search_backend == "http" else NaverMapCrawler()
         self.room_fetcher = NaverRoomFetcher()
         self.parser_service = RoomParserService()
         self.supabase = get_supabase_client()
+        self._llm_slots = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
 
-    async def collect_by_query(self, query: str) -> Dict[str, int]:
+    async def aclose(self):
+        """수집 중 사용한 HTTP 연결 풀을 정리합니다."""
+        await self.room_fetcher.aclose()
+
+    async def collect_by_query(self, query: str) -> Dict[str, float]:
         """
         Search and collect rooms by query keyword.
         
@@ -33,66 +61,37 @@ class RoomCollectionService:
             query: Search keyword (e.g., "Hongdae practice room")
             
         Returns:
-            Dict containing counts of successful and failed collections.
+            Collection report (success / failed counts and throughput).
         """
         logger.info(f"Starting collection for query: {query}")
-        
-        # 1. 지도 검색으로 ID 확보
-        search_results = await self.map_crawler.search_rehearsal_rooms(query)
-        logger.info(f"Found {len(search_results)} businesses for {query}")
-        
-        success_count = 0
-        failed_count = 0
-
-        for item in search_results:
-            business_id = item["id"]
-            try:
-                await self.collect_by_id(business_id)
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Failed to collect {business_id}: {e}")
-                failed_count += 1
-                
-        return {"success": success_count, "failed": failed_count}
 
-    async def collect_all_regions(self) -> Dict[str, int]:
+        async def discover() -> List[str]:
+            # 1. 지도 검색으로 ID 확보
+            search_results = await self.map_crawler.search_rehearsal_rooms(query)
+            logger.info(f"Found {len(search_results)} businesses for {query}")
+            return [item["id"] for item in search_results]
+
+        return await self._run_pipeline(discover)
+
+    async def collect_all_regions(self) -> Dict[str, float]:
         """
         Collect rooms from all major regions nationwide.
         """
         logger.info("Starting nationwide collection...")
-        
-        # 1. Crawl all regions
-        # Note: crawl_all_regions returns list of Item dicts, but search_rehearsal_rooms returns same structure.
-        # We assume crawl_all_regions returns a list of items similar to search results.
-        all_items = await self.map_crawler.crawl_all_regions()
-        logger.info(f"Total unique businesses found nationwide: {len(all_items)}")
-        
-        success_count = 0
-        failed_count = 0
-        
-        # 2. Process each found business
-        total_items = len(all_items)
-        for idx, item in enumerate(all_items):
-            business_id = item["id"]
-            try:
-                logger.info(f"Processing {idx+1}/{total_items}: {item['name']} ({business_id})")
-                await self.collect_by_id(business_id)
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Failed to collect {business_id}: {e}")
-                failed_count += 1
-                
-        return {"success": success_count, "failed": failed_count}
+
+        async def discover() -> List[str]:
+            all_items = await self.map_crawler.crawl_all_regions()
+            logger.info(f"Total unique businesses found nationwide: {len(all_items)}")
+            return [item["id"] for item in all_items]
+
+        return await self._run_pipeline(discover)
 
     async def collect_by_id(self, business_id: str):
         """Collect and save room information for a specific Business ID."""
         logger.info(f"Collecting business_id: {business_id}")
 
         # 1. Fetch Full Info
-        data = await self.room_fetcher.fetch_full_info(business_id)
-        if not data:
-            raise ValueError(f"No data found for business {business_id}")
-
+        data = await self._fetch(business_id)
         business = data["business"]
         rooms = data["rooms"]
         
@@ -101,6 +100,121 @@ class RoomCollectionService:
             return
 
         # 2. LLM Parsing (Batch with Concurrency)
+        parsed_results = await self._parse_rooms(rooms)
+
+        # 3. Save to DB (Branch -> Room(with images))
+        await self._save_to_db(business, rooms, parsed_results)
+        logger.info(f"Successfully saved business {business_id} with {len(rooms)} rooms")
+
+    async def _run_pipeline(self, discover: Callable[[], Awaitable[List[str]]]) -> Dict[str, float]:
+        """
+        discover → fetch → parse → persist 파이프라인으로 여러 지점을 수집합니다.
+
+        Args:
+            discover: 수집할 Business ID 목록을 반환하는 코루틴 함수
+
+        Returns:
+            Dict: {"success", "failed", "discovered", "elapsed_seconds", "businesses_per_minute"}
+
+        Raises:
+            discover에서 발생한 예외 (이미 큐에 들어간 지점의 수집을 마친 뒤 전파)
+        """
+        fetch_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        persist_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        report = {"success": 0, "failed": 0, "discovered": 0}
+        started = time.perf_counter()
+
+        def finish(business_id: str, error: Optional[Exception] = None):
+            if error is None:
+                report["success"] += 1
+            else:
+                logger.error(f"Failed to collect {business_id}: {error}")
+                report["failed"] += 1
+            done = report["success"] + report["failed"]
+            logger.info(f"Progress {done}/{report['discovered'] or '?'} (failed {report['failed']})")
+
+        async def discover_stage():
+            business_ids = await discover()
+            report["discovered"] = len(business_ids)
+            for business_id in business_ids:
+                await fetch_queue.put(business_id)
+
+        # 워커는 지점 단위로 모든 예외를 잡아 집계만 함
+        # (워커가 죽으면 _run_stage가 종료 신호를 먼저 보내고, 아직 살아 있는 형제 워커가
+        #  가득 찬 큐에 넣으려다 영원히 대기할 수 있음)
+        async def fetch_worker():
+            while (business_id := await fetch_queue.get()) is not _DONE:
+                try:
+                    data = await self._fetch(business_id)
+                    if not data["rooms"]:
+                        logger.warning(f"No rooms found for business {business_id}")
+                        finish(business_id)
+                        continue
+                except Exception as e:
+                    finish(business_id, e)
+                    continue
+                await parse_queue.put((business_id, data))
+
+        async def parse_worker():
+            while (job := await parse_queue.get()) is not _DONE:
+                business_id, data = job
+                try:
+                    parsed_results = await self._parse_rooms(data["rooms"])
+                except Exception as e:
+                    finish(business_id, e)
+                    continue
+                await persist_queue.put((business_id, data, parsed_results))
+
+        async def persist_worker():
+            while (job := await persist_queue.get()) is not _DONE:
+                business_id, data, parsed_results = job
+                try:
+                    await self._save_to_db(data["business"], data["rooms"], parsed_results)
+                    logger.info(f"Successfully saved business {business_id} with {len(data['rooms'])} rooms")
+                except Exception as e:
+                    finish(business_id, e)
+                    continue
+                finish(business_id)
+
+        results = await asyncio.gather(
+            self._run_stage([discover_stage()], fetch_queue, self.FETCH_WORKERS),
+            self._run_stage([fetch_worker() for _ in range(self.FETCH_WORKERS)], parse_queue, self.PARSE_WORKERS),
+            self._run_stage([parse_worker() for _ in range(self.PARSE_WORKERS)], persist_queue, self.PERSIST_WORKERS),
+            self._run_stage([persist_worker() for _ in range(self.PERSIST_WORKERS)]),
+            return_exceptions=True,
+        )
+
+        elapsed = time.perf_counter() - started
+        report["elapsed_seconds"] = round(elapsed, 2)
+        report["businesses_per_minute"] = round((report["success"] + report["failed"]) / elapsed * 60, 1) if elapsed else 0.0
+        logger.info(
+            f"Collection finished: {report['success']} saved, {report['failed']} failed "
+            f"of {report['discovered']} in {elapsed:.1f}s ({report['businesses_per_minute']}/min)"
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return report
+
+    @staticmethod
+    async def _run_stage(workers: List[Awaitable], downstream: Optional[asyncio.Queue] = None, downstream_workers: int = 0):
+        """단계 워커를 모두 실행하고, 끝나면(실패해도) 다음 단계 워커 수만큼 종료 신호를 보냅니다."""
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            if downstream is not None:
+                for _ in range(downstream_workers):
+                    await downstream.put(_DONE)
+
+    async def _fetch(self, business_id: str) -> Dict:
+        data = await self.room_fetcher.fetch_full_info(business_id)
+        if not data:
+            raise ValueError(f"No data found for business {business_id}")
+        return data
+
+    async def _parse_rooms(self, rooms: List[Dict]) -> Dict[str, Dict]:
         parse_items = []
         for room in rooms:
             parse_items.append({
@@ -110,14 +224,10 @@ class RoomCollectionService:
             })
         
         # Chunk items for parallel processing
-        parsed_results = await self._parse_with_concurrency(parse_items)
-
-        # 3. Save to DB (Branch -> Room(with images))
-        await self._save_to_db(business, rooms, parsed_results)
-        logger.info(f"Successfully saved business {business_id} with {len(rooms)} rooms")
+        return await self._parse_with_concurrency(parse_items)
 
     async def _parse_with_concurrency(self, items: List[Dict]) -> Dict[str, Dict]:
-        """Parse items in concurrent batches."""
+        """Parse items in concurrent batches (LLM slots are shared across pipeline workers)."""
         if not items:
             return {}
             
@@ -125,14 +235,11 @@ class RoomCollectionService:
         chunks = [items[i:i + self.BATCH_SIZE] for i in range(0, len(items), self.BATCH_SIZE)]
         logger.info(f"Splitting {len(items)} items into {len(chunks)} chunks (batch size: {self.BATCH_SIZE})")
         
-        # Semaphore for concurrency limit
-        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
-        
         async def parse_chunk(chunk: List[Dict]) -> Dict[str, Dict]:
-            async with semaphore:
+            async with self._llm_slots:
                 return await self.parser_service.parse_room_desc_batch(chunk)
         
-        # Run all chunks concurrently (limited by semaphore)
+        # Run all chunks concurrently (limited by shared semaphore)
         results = await asyncio.gather(*[parse_chunk(c) for c in chunks])
         
         # Merge results
@@ -142,7 +249,16 @@ class RoomCollectionService:
         return merged
 
     async def _save_to_db(self, business: Dict, rooms: List[Dict], parsed_results: Dict):
-        """Save collected/parsed data to Supabase."""
+        """Save collected/parsed data to Supabase.
+
+        Supabase 클라이언트 호출은 동기(blocking)이므로 워커 스레드에서 실행합니다.
+        (persist 단계가 저장하는 동안에도 fetch / parse 워커가 이벤트 루프에서 계속 진행)
+        """
+        # API 서버의 룸 카탈로그 인덱스는 별도 프로세스이므로 ROOM_INDEX_TTL_SECONDS 주기로 반영됨
+        await asyncio.to_thread(self._write_to_db, business, rooms, parsed_results)
+
+    def _write_to_db(self, business: Dict, rooms: List[Dict], parsed_results: Dict):
+        """Upsert branch and rooms (blocking Supabase calls)."""
         
         # 1. Save Branch
         coords = business.get("coordinates")
@@ -0,0 +1,132 @@
+"""
+서킷 브레이커 (크롤러 타입 / 업스트림 호스트 단위)
+
+업스트림이 장애 상태일 때 매 요청마다 연결 타임아웃 + 재시도를 기다리지 않도록,
+연속 실패가 임계값을 넘으면 일정 시간 동안 호출 자체를 차단(open)합니다.
+
+상태 전이:
+- CLOSED: 정상. 연속 실패 failure_threshold회 → OPEN
+- OPEN: 호출 차단. recovery_seconds 경과 → HALF_OPEN
+- HALF_OPEN: half_open_probes개의 시험 요청만 허용. 성공 → CLOSED / 실패 → 다시 OPEN
+
+설계 결정:
+- 키는 문자열로 통일: "crawler:<type>" (크롤러 단위), "host:<type>@<host>" (HTTP 호스트 단위)
+  - 호스트 단위는 client_loader에서 HTTP 호출 직전에 차단 (Naver, Dream)
+  - 크롤러 단위는 AvailabilityService에서 크롤러 호출 전체를 차단 (로그인 등 HTTP 외 실패 포함, Groove)
+- 차단된 룸은 에러가 아니라 "unknown"으로 응답 (지도 조회 전체는 정상 응답)
+- 단일 이벤트 루프에서만 사용하므로 별도 Lock 없이 상태를 갱신
+"""
+
+from __future__ import annotations
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_SECONDS, CIRCUIT_HALF_OPEN_PROBES
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커
+
+    Attributes:
+        name: 브레이커 키 (예: "crawler:dream")
+        state: 현재 상태 (closed / open / half_open)
+        consecutive_failures: 현재 연속 실패 횟수
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_seconds: float = CIRCUIT_RECOVERY_SECONDS,
+        half_open_probes: int = CIRCUIT_HALF_OPEN_PROBES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+
+    def allow_request(self) -> bool:
+        """호출을 보내도 되는지 판단합니다. (HALF_OPEN에서 허용되면 시험 요청으로 집계)"""
+        if self.state == OPEN:
+            if self._clock() - self._opened_at < self.recovery_seconds:
+                return False
+            self.state = HALF_OPEN
+            self._probes_in_flight = 0
+
+        if self.state == HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                return False
+            self._probes_in_flight += 1
+        return True
+
+    def record_success(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._probes_in_flight = 0
+
+    def record_abandoned(self):
+        """결과 없이 끝난 호출(취소 등)의 시험 요청 슬롯만 반납합니다."""
+        if self.state == HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = OPEN
+            self._opened_at = self._clock()
+            self._probes_in_flight = 0
+
+    def snapshot(self) -> Dict[str, object]:
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = round(max(0.0, self._opened_at + self.recovery_seconds - self._clock()), 2)
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_seconds": retry_in,
+        }
+
+
+class CircuitBreakerRegistry:
+    """키별 CircuitBreaker 저장소 (처음 조회 시 설정값으로 생성)"""
+
+    def __init__(self, factory: Callable[[str], CircuitBreaker] = CircuitBreaker):
+        self._factory = factory
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._factory(name)
+            self._breakers[name] = breaker
+        return breaker
+
+    def for_crawler(self, crawler_type: str) -> CircuitBreaker:
+        return self.get(f"crawler:{crawler_type}")
+
+    def for_host(self, upstream: str, url: str) -> CircuitBreaker:
+        return self.get(f"host:{upstream}@{httpx.URL(url).host}")
+
+    def clear(self):
+        self._breakers.clear()
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        return [breaker.snapshot() for breaker in self._breakers.values()]
+
+
+# Global singleton instance
+circuit_breakers = CircuitBreakerRegistry()
@@ -2,7 +2,11 @@ import httpx
 import asyncio
 import logging
 from datetime import datetime
-from app.exception.api.client_loader_exception import RequestFailedError
+from typing import Optional
+from app.exception.api.client_loader_exception import CircuitOpenError, RequestFailedError
+from app.utils.circuit_breaker import circuit_breakers
+from app.utils.request_coalescer import coalesce_key, request_coalescer
+from app.utils.upstream_limiter import AdaptiveLimiter, is_congestion_status, upstream_limiters
 
 # 전역 클라이언트 변수
 _shared_client: httpx.AsyncClient = None
@@ -27,6 +31,10 @@ async def set_global_client():
                 http2=True,
             )
 
+def get_global_client() -> Optional[httpx.AsyncClient]:
+    """전역 클라이언트 반환 (set_global_client 호출 전 / 종료 후에는 None)"""
+    return _shared_client
+
 async def close_global_client():
     """애플리케이션 종료 시 전역 클라이언트 리소스 해제.
     
@@ -38,7 +46,28 @@ async def close_global_client():
             await _shared_client.aclose()
             _shared_client = None
 
-async def _retry_request(client: httpx.AsyncClient, url: str, max_retries: int = 2, **kwargs):
+async def _post(client: httpx.AsyncClient, url: str, limiter: Optional[AdaptiveLimiter] = None, **kwargs):
+    """업스트림 제한기를 거쳐 POST 요청을 보냅니다.
+
+    제한기가 있으면 슬롯/토큰을 획득한 뒤 요청하고, 응답 상태(429/5xx/타임아웃)를
+    제한기의 한도 조절(AIMD)에 반영합니다.
+    """
+    if limiter is None:
+        return await client.post(url, **kwargs)
+
+    await limiter.acquire()
+    congested = None
+    try:
+        response = await client.post(url, **kwargs)
+        congested = is_congestion_status(response.status_code)
+        return response
+    except (httpx.TimeoutException, httpx.NetworkError):
+        congested = True
+        raise
+    finally:
+        await limiter.release(congested)
+
+async def _retry_request(client: httpx.AsyncClient, url: str, max_retries: int = 2, limiter: Optional[AdaptiveLimiter] = None, **kwargs):
     """재시도 로직을 분리한 헬퍼 함수.
     
     네트워크 오류나 5xx 서버 에러 발생 시 지수 백오프로 재시도합니다.
@@ -47,6 +76,7 @@ async def _retry_request(client: httpx.AsyncClient, url: str, max_retries: int =
         client: HTTP 클라이언트 인스턴스
         url: 요청 URL
         max_retries: 최대 재시도 횟수
+        limiter: 업스트림 제한기 (없으면 제한 없이 요청)
         **kwargs: POST 요청에 전달할 추가 파라미터
         
     Returns:
@@ -59,7 +89,7 @@ async def _retry_request(client: httpx.AsyncClient, url: str, max_retries: int =
         try:
             # 지수 백오프: 0.2초, 0.4초, 0.6초...
             await asyncio.sleep(0.2 * (attempt + 1))
-            response = await client.post(url, **kwargs)
+            response = await _post(client, url, limiter, **kwargs)
             response.raise_for_status()
             return response
         except Exception:
@@ -68,7 +98,7 @@ async def _retry_request(client: httpx.AsyncClient, url: str, max_retries: int =
             continue
     return None
 
-async def load_client(url: str, **kwargs):
+async def load_client(url: str, upstream: Optional[str] = None, coalesce: bool = False, **kwargs):
     """외부 API 호출을 위한 HTTP POST 요청 헬퍼.
     
     전역 클라이언트를 사용하여 연결 재사용을 최적화하며,
@@ -76,6 +106,10 @@ async def load_client(url: str, **kwargs):
     
     Args:
         url: 요청할 API 엔드포인트 URL
+        upstream: 업스트림 제한기 키 (크롤러 타입, 예: "naver").
+                  지정하면 (upstream, 호스트) 단위 동시 요청 수 / 속도 제한 + 서킷 브레이커 적용
+        coalesce: True면 같은 (URL, 본문, 헤더) 요청이 진행 중일 때 새로 보내지 않고 그 결과를 공유
+                  (조회처럼 부작용 없는 요청에만 사용)
         **kwargs: httpx.AsyncClient.post()에 전달할 추가 파라미터
                  (headers, json, data 등)
     
@@ -84,13 +118,32 @@ async def load_client(url: str, **kwargs):
         
     Raises:
         RequestFailedError: API 호출 실패 시 (4xx, 5xx, 네트워크 오류 등)
+        CircuitOpenError: 해당 호스트의 서킷 브레이커가 열려 있을 때 (호출하지 않음)
         
     Note:
         - 전역 클라이언트가 없으면 임시 클라이언트 생성 (안전장치)
         - 5xx, 네트워크 오류: 자동 재시도 (최대 2회)
         - 4xx: 즉시 실패 (재시도 없음)
+        - 재시도 요청도 같은 업스트림 제한기를 거침
+        - 재시도까지 실패(5xx, 네트워크 오류) 또는 429면 서킷 브레이커에 실패로 기록
+        - 합쳐진 요청은 제한기 / 서킷 브레이커를 한 번만 거치며, 실패도 모든 호출자에게 같은 예외로 전달
     """
+    if coalesce:
+        key = coalesce_key("POST", url, **kwargs)
+        return await request_coalescer.run(key, lambda: _load(url, upstream, **kwargs))
+    return await _load(url, upstream, **kwargs)
+
+async def _load(url: str, upstream: Optional[str] = None, **kwargs):
+    """load_client의 실제 요청 처리 (서킷 브레이커 → 제한기 → 요청 / 재시도)"""
     logger = logging.getLogger("app")
+    limiter = upstream_limiters.get(upstream, url) if upstream else None
+    breaker = circuit_breakers.for_host(upstream, url) if upstream else None
+
+    if breaker is not None and not breaker.allow_request():
+        raise CircuitOpenError(f"[{breaker.name}] 서킷 브레이커가 열려 있어 호출하지 않았습니다.")
+
+    # 서킷 브레이커에 기록할 결과 (True: 업스트림 정상, False: 장애, None: 판단 불가 - 취소 등)
+    healthy = None
     
     # 1. 사용할 클라이언트 결정 (전역 vs 임시)
     client = _shared_client
@@ -105,14 +158,20 @@ async def load_client(url: str, **kwargs):
 
     try:
         try:
-            response = await client.post(url, **kwargs)
+            response = await _post(client, url, limiter, **kwargs)
             response.raise_for_status()
+            healthy = True
             return response
         except httpx.HTTPStatusError as e:
             status = e.response.status_code if e.response is not None else None
             # 5xx는 일시 장애 가능성 → 재시도
             if status is not None and status >= 500:
-                return await _retry_request(client, url, **kwargs)
+                response = await _retry_request(client, url, limiter=limiter, **kwargs)
+                healthy = True
+                return response
+
+            # 429 외의 4xx는 요청 자체의 문제이므로 업스트림은 정상으로 간주
+            healthy = status != 429
             
             # 4xx 등 기타 에러는 즉시 로깅 후 실패
             logger.error({
@@ -127,9 +186,13 @@ async def load_client(url: str, **kwargs):
             
         except (httpx.ConnectError, httpx.ReadTimeout, httpx.WriteError, httpx.NetworkError) as e:
             # 네트워크/타임아웃류는 재시도
-            return await _retry_request(client, url, **kwargs)
+            response = await _retry_request(client, url, limiter=limiter, **kwargs)
+            healthy = True
+            return response
             
     except Exception as e:
+        if healthy is None:
+            healthy = False
         # 재시도 실패 또는 기타 예외 발생 시 최종 로깅 (이미 로깅된 4xx 제외)
         if not isinstance(e, RequestFailedError):
             logger.error({
@@ -146,3 +209,10 @@ async def load_client(url: str, **kwargs):
         # 2. 임시로 생성했던 클라이언트라면 닫아주기 (전역은 닫으면 안 됨!)
         if should_close:
             await client.aclose()
+        if breaker is not None:
+            if healthy is True:
+                breaker.record_success()
+            elif healthy is False:
+                breaker.record_failure()
+            else:
+                breaker.record_abandoned()
@@ -0,0 +1,102 @@
+"""
+헤지 요청(Hedged Request) 유틸리티
+
+응답이 최근 지연 시간 분포의 상위 백분위수(예: p95)를 넘길 때까지 오지 않으면
+같은 요청을 한 번 더 보내고, 먼저 성공한 응답을 사용합니다.
+
+설계 결정:
+- 헤지 기준 지연은 고정값 대신 최근 성공 응답 지연(LatencyTracker)에서 계산
+  → 업스트림이 전반적으로 느려지면 기준도 함께 올라가 중복 요청이 폭증하지 않음
+- 표본이 충분히 쌓이기 전(min_samples 미만)에는 헤징하지 않음
+- 먼저 끝난 요청이 실패하면 나머지 요청의 결과를 기다림 (둘 다 실패 시 첫 에러 전파)
+
+비즈니스 맥락:
+- 네이버 API는 대부분 빠르게 응답하지만 일부 요청이 수 초씩 지연되어 전체 응답 시간의 꼬리를 결정함
+- 조회 API는 부작용이 없으므로(idempotent) 중복 요청이 안전함
+"""
+
+from __future__ import annotations
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """최근 성공 응답 지연 시간(초)을 보관하고 헤지 기준 지연을 계산합니다.
+
+    Attributes:
+        percentile: 헤지 기준 백분위수 (0~1). 0 이하이면 헤징 비활성화
+        min_samples: 헤징을 시작하기 위한 최소 표본 수
+        min_delay: 헤지 기준 지연의 하한 (초)
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.clock = clock
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 기준 지연(초). 헤징하지 않을 상황이면 None"""
+        if self.percentile <= 0 or len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_delay, ordered[index])
+
+
+async def hedged_call(factory: Callable[[], Awaitable[T]], tracker: LatencyTracker) -> T:
+    """factory()를 호출하되, 기준 지연을 넘기면 한 번 더 호출하여 먼저 성공한 결과를 반환합니다.
+
+    Args:
+        factory: 호출할 때마다 새 요청 코루틴을 만드는 함수
+        tracker: 지연 시간 기록 / 헤지 기준 계산기
+
+    Returns:
+        먼저 성공한 요청의 결과
+
+    Raises:
+        모든 요청이 실패하면 먼저 실패한 요청의 예외
+    """
+    started = tracker.clock()
+    delay = tracker.hedge_delay()
+
+    if delay is None:
+        result = await factory()
+        tracker.record(tracker.clock() - started)
+        return result
+
+    pending = {asyncio.ensure_future(factory())}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if not done:
+            # 기준 지연 초과 → 헤지 요청 추가
+            pending.add(asyncio.ensure_future(factory()))
+
+        errors = []
+        while True:
+            for task in done:
+                if task.exception() is None:
+                    tracker.record(tracker.clock() - started)
+                    return task.result()
+                errors.append(task.exception())
+            if not pending:
+                raise errors[0]
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
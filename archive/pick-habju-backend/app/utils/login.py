@@ -1,5 +1,8 @@
+import asyncio
+import time
 import httpx
-from app.core.config import GROOVE_BASE_URL, LOGIN_ID, LOGIN_PW, GROOVE_LOGIN_URL
+from typing import Awaitable, Callable, Optional
+from app.core.config import GROOVE_BASE_URL, LOGIN_ID, LOGIN_PW, GROOVE_LOGIN_URL, GROOVE_SESSION_TTL_SECONDS
 from app.exception.crawler.groove_exception import GrooveCredentialError, GrooveLoginError
 
 
@@ -22,3 +25,164 @@ class LoginManager:
             raise GrooveLoginError(
                 f"Login failed with status code {response.status_code}"
             )
+
+
+# 로그인 폼에만 있는 표시 (폼 action + 비밀번호 입력 필드). 로그인 페이지 링크만 있는 일반 페이지는 제외
+_LOGIN_FORM_MARKERS = ("login_exec.asp", "login_pw")
+
+
+class _SessionClient:
+    """로그인된 클라이언트 + 사용 중인 요청 수.
+
+    재로그인으로 교체(retire)된 뒤에도 진행 중인 요청이 끝날 때까지는 닫지 않습니다.
+    """
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.in_flight = 0
+        self._retired = False
+        self._closed = False
+
+    async def release(self):
+        self.in_flight -= 1
+        await self._close_if_idle()
+
+    async def retire(self):
+        self._retired = True
+        await self._close_if_idle()
+
+    async def _close_if_idle(self):
+        if self._retired and self.in_flight == 0 and not self._closed:
+            self._closed = True
+            await self.client.aclose()
+
+
+class GrooveSessionManager:
+    """로그인된 그루브 세션(클라이언트 + 쿠키)을 요청 간에 재사용하는 매니저.
+
+    매 요청마다 새 클라이언트 생성(TLS 핸드셰이크) + 로그인 POST를 하던 방식 대신,
+    인증된 클라이언트를 유지하다가 세션 만료가 감지되면 그때 다시 로그인합니다.
+
+    설계 결정:
+    - 재로그인은 asyncio.Lock으로 직렬화하고 세션 세대(generation)를 비교하여,
+      동시에 만료를 감지한 여러 코루틴 중 하나만 실제로 로그인하도록 보장
+    - 새 클라이언트로 로그인을 마친 뒤 교체하고, 이전 클라이언트는 Lock 밖에서
+      진행 중인 요청이 모두 끝난 뒤에 닫음 (세션 교체 시점의 동시 요청이 실패하지 않도록)
+    - 서버 측 세션 만료 시간을 알 수 없으므로 max_age_seconds가 지나면 선제적으로 재로그인
+    - 재로그인 직후에도 만료 응답이면 GrooveLoginError 발생 (무한 재시도 방지)
+
+    Attributes:
+        max_age_seconds: 로그인 후 세션을 재사용할 최대 시간(초)
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], httpx.AsyncClient] = None,
+        max_age_seconds: float = GROOVE_SESSION_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._client_factory = client_factory or (
+            lambda: httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=5.0))
+        )
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._session: Optional[_SessionClient] = None
+        self._logged_in_at: Optional[float] = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    async def request(
+        self, send: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """로그인된 세션으로 요청을 보냅니다. 세션 만료 시 한 번 재로그인 후 재요청합니다.
+
+        Args:
+            send: 인증된 클라이언트를 받아 요청을 수행하는 코루틴 함수
+
+        Returns:
+            httpx.Response: 인증된 상태의 응답
+
+        Raises:
+            GrooveCredentialError: 자격 증명 환경변수 누락
+            GrooveLoginError: 로그인 실패 또는 재로그인 후에도 세션 만료 응답
+        """
+        session, generation = await self._ensure_session()
+        response = await self._send(session, send)
+        if not self._is_session_expired(response):
+            return response
+
+        session, _ = await self._relogin(stale_generation=generation)
+        response = await self._send(session, send)
+        if self._is_session_expired(response):
+            raise GrooveLoginError("재로그인 후에도 그루브 세션이 유효하지 않습니다.")
+        return response
+
+    async def aclose(self):
+        """유지 중인 클라이언트를 정리합니다. (애플리케이션 종료 시 호출, 진행 중인 요청은 끝난 뒤 닫힘)"""
+        async with self._lock:
+            session, self._session = self._session, None
+            self._logged_in_at = None
+        if session is not None:
+            await session.retire()
+
+    @staticmethod
+    async def _send(session: _SessionClient, send: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]) -> httpx.Response:
+        """세션을 획득한 상태(in_flight 증가 후)로 요청하고, 끝나면 반납"""
+        try:
+            return await send(session.client)
+        finally:
+            await session.release()
+
+    async def _ensure_session(self):
+        if self._is_fresh():
+            # await 없이 바로 획득하므로 확인과 획득 사이에 세션이 교체되지 않음
+            self._session.in_flight += 1
+            return self._session, self._generation
+        return await self._relogin(stale_generation=self._generation)
+
+    async def _relogin(self, stale_generation: int):
+        retired = None
+        async with self._lock:
+            # 대기하는 동안 다른 코루틴이 이미 재로그인했다면 그 세션을 사용
+            if self._generation != stale_generation and self._is_fresh():
+                self._session.in_flight += 1
+                return self._session, self._generation
+
+            client = self._client_factory()
+            try:
+                await LoginManager.login(client)
+            except Exception:
+                await client.aclose()
+                raise
+
+            retired, self._session = self._session, _SessionClient(client)
+            self._logged_in_at = self._clock()
+            self._generation += 1
+            self._session.in_flight += 1
+            session, generation = self._session, self._generation
+
+        # 이전 클라이언트는 Lock 밖에서, 진행 중인 요청이 모두 끝난 뒤 닫힘
+        if retired is not None:
+            await retired.retire()
+        return session, generation
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._session is not None
+            and self._logged_in_at is not None
+            and self._clock() - self._logged_in_at < self.max_age_seconds
+        )
+
+    @staticmethod
+    def _is_session_expired(response: httpx.Response) -> bool:
+        """세션 만료 응답(인증 오류, 로그인 페이지로 리다이렉트, 로그인 폼)인지 판별"""
+        if response.status_code in (401, 403):
+            return True
+        if response.is_redirect:
+            return "login" in response.headers.get("location", "").lower()
+        text = response.text
+        return all(marker in text for marker in _LOGIN_FORM_MARKERS)
+
+
+# Global singleton instance
+groove_session = GrooveSessionManager()
@@ -0,0 +1,149 @@
+"""
+크롤러 응답 파싱 실행기 (이벤트 루프 밖에서 CPU 작업 처리)
+
+크롤러는 받은 원본 페이로드(HTML 문자열 등)와 모듈 수준 파싱 함수를 넘기고,
+실행기는 페이로드 크기에 따라 실행 위치를 정합니다.
+- 작은 페이로드: 이벤트 루프에서 바로 실행 (프로세스 간 전달 비용이 파싱 비용보다 큼)
+- 큰 페이로드: 프로세스 풀에서 실행 (파싱 동안 같은 워커의 다른 요청이 멈추지 않음)
+
+설계 결정:
+- 프로세스 풀은 처음 필요할 때 생성하고, 앱 종료 시 shutdown()으로 정리
+- fork 대신 spawn으로 워커 생성 (이벤트 루프 / HTTP 연결을 가진 프로세스를 복제하지 않기 위함)
+- 풀 워커가 죽으면(BrokenProcessPool) 풀을 폐기하고 해당 작업은 인라인으로 처리
+- 파싱 함수는 프로세스 간 전달이 가능하도록 모듈 수준 함수여야 함
+- 단일 이벤트 루프에서만 사용하므로 별도 Lock 없이 지표를 갱신
+
+비즈니스 맥락:
+- 지도 조회가 동시에 몰리면 큰 예약 테이블 파싱이 같은 uvicorn 워커의 다른 요청 응답을 지연시킴
+"""
+
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, TypeVar
+
+from app.core.config import PARSE_INLINE_THRESHOLD_BYTES, PARSE_POOL_WORKERS
+
+T = TypeVar("T")
+
+
+class _ParseStats:
+    """실행 위치별 파싱 횟수 / 소요 시간 집계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        avg = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": round(avg * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+def _default_pool_factory(max_workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class ParseExecutor:
+    """페이로드 크기에 따라 인라인 / 프로세스 풀에서 파싱 함수를 실행합니다.
+
+    Attributes:
+        max_workers: 프로세스 풀 워커 수. 0 이하이면 항상 인라인 실행
+        inline_threshold_bytes: 이 크기(문자 수) 미만의 페이로드는 인라인 실행
+        queue_depth: 풀에 제출되어 아직 끝나지 않은 작업 수
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PARSE_POOL_WORKERS,
+        inline_threshold_bytes: int = PARSE_INLINE_THRESHOLD_BYTES,
+        pool_factory: Callable[[int], Executor] = _default_pool_factory,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.max_workers = max_workers
+        self.inline_threshold_bytes = inline_threshold_bytes
+        self._pool_factory = pool_factory
+        self._clock = clock
+        self._pool: Optional[Executor] = None
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.fallbacks = 0
+        self._inline = _ParseStats()
+        self._pooled = _ParseStats()
+
+    def _use_pool(self, payload) -> bool:
+        return self.max_workers > 0 and len(payload) >= self.inline_threshold_bytes
+
+    async def run(self, func: Callable[..., T], payload, *args) -> T:
+        """func(payload, *args)를 실행하고 결과를 반환합니다.
+
+        Args:
+            func: 모듈 수준 파싱 함수 (프로세스 풀 실행 시 pickle 가능해야 함)
+            payload: 파싱할 원본 데이터 (len()으로 실행 위치 결정)
+            *args: func에 함께 넘길 추가 인자
+        """
+        if not self._use_pool(payload):
+            return self._run_inline(func, payload, *args)
+
+        if self._pool is None:
+            self._pool = self._pool_factory(self.max_workers)
+
+        started = self._clock()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._pool, func, payload, *args)
+        except BrokenProcessPool:
+            # 워커 비정상 종료 → 다음 요청에서 풀을 새로 만들고 이번 작업은 인라인 처리
+            self._discard_pool()
+            self.fallbacks += 1
+            return self._run_inline(func, payload, *args)
+        finally:
+            self.queue_depth -= 1
+
+        self._pooled.record(self._clock() - started)
+        return result
+
+    def _run_inline(self, func: Callable[..., T], payload, *args) -> T:
+        started = self._clock()
+        result = func(payload, *args)
+        self._inline.record(self._clock() - started)
+        return result
+
+    def _discard_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def shutdown(self):
+        """프로세스 풀 종료 (앱 종료 시 호출)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "workers": self.max_workers,
+            "inline_threshold_bytes": self.inline_threshold_bytes,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "fallbacks": self.fallbacks,
+            "inline": self._inline.snapshot(),
+            "pool": self._pooled.snapshot(),
+        }
+
+
+# Global singleton instance
+parse_executor = ParseExecutor()
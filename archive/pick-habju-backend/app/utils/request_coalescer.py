@@ -0,0 +1,123 @@
+"""
+동일한 업스트림 요청 합치기 (Request Coalescing)
+
+같은 (메서드, URL, 본문) 요청이 이미 진행 중이면 새로 보내지 않고 진행 중인 요청의 결과를 함께 받습니다.
+
+설계 결정:
+- 키는 메서드 + URL + 정규화한 본문/헤더의 SHA-256 (json은 키 정렬, form data는 항목 정렬)
+- 결과를 보관하지 않음: 요청이 끝나는 즉시 키를 제거하므로 TTL 캐시처럼 오래된 응답을 돌려주지 않음
+- 호출자별 취소 안전성: 한 호출자가 취소되어도 공유 요청은 계속 진행(asyncio.shield),
+  기다리는 호출자가 모두 취소되었을 때만 공유 요청을 취소
+- 단일 이벤트 루프에서만 사용하므로 별도 Lock 없이 진행 중 요청 맵을 갱신
+
+비즈니스 맥락:
+- 여러 사용자가 같은 지역(예: 홍대)과 날짜를 동시에 조회하면 같은 룸 일정 요청이 업스트림으로 중복 전송됨
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Mapping, TypeVar
+
+T = TypeVar("T")
+
+
+def _canonical(value: Any) -> Any:
+    """본문/헤더를 순서와 무관한 비교 가능한 형태로 변환합니다."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "surrogateescape")
+    if isinstance(value, Mapping):
+        return sorted((str(k), _canonical(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def coalesce_key(method: str, url: str, **kwargs) -> str:
+    """요청 합치기 키 계산 (load_client / httpx.AsyncClient.post와 같은 인자를 받음)
+
+    헤더 이름은 대소문자를 구분하지 않으므로 소문자로 맞춘 뒤 비교합니다.
+    """
+    headers = kwargs.get("headers") or {}
+    parts = {
+        "method": method.upper(),
+        "url": str(url),
+        "params": _canonical(kwargs.get("params")),
+        "headers": _canonical({str(k).lower(): v for k, v in dict(headers).items()}),
+        "json": json.dumps(kwargs.get("json"), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str),
+        "data": _canonical(kwargs.get("data")),
+        "content": _canonical(kwargs.get("content")),
+    }
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _InflightCall:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """키별로 진행 중인 요청 하나를 공유합니다.
+
+    Attributes:
+        leaders: 실제로 요청을 보낸 호출 수
+        joined: 진행 중인 요청에 합류한(요청을 보내지 않은) 호출 수
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, _InflightCall] = {}
+        self.leaders = 0
+        self.joined = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """key로 진행 중인 요청이 있으면 그 결과를, 없으면 factory()를 실행한 결과를 반환합니다.
+
+        Args:
+            key: coalesce_key()로 계산한 요청 키
+            factory: 실제 요청 코루틴을 만드는 함수 (진행 중 요청이 없을 때만 호출)
+        """
+        call = self._inflight.get(key)
+        if call is None:
+            call = _InflightCall(asyncio.ensure_future(factory()))
+            self._inflight[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.leaders += 1
+        else:
+            self.joined += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.task.cancelled():
+                raise
+            # 이 호출자만 취소됨 → 마지막 대기자였다면 공유 요청도 취소
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+                self._forget(key, call)
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: str, call: _InflightCall):
+        if self._inflight.get(key) is call:
+            del self._inflight[key]
+
+    def clear(self):
+        self._inflight.clear()
+        self.leaders = 0
+        self.joined = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "joined": self.joined,
+        }
+
+
+# Global singleton instance
+request_coalescer = RequestCoalescer()
@@ -0,0 +1,183 @@
+"""
+룸 카탈로그 공간 인덱스
+
+지점 좌표(branch.lat/lng)를 격자(Grid)로 나누어 룸을 버킷에 담고,
+각 버킷 안에서는 최대 수용 인원(maxCapacity) 내림차순으로 정렬해 둡니다.
+지도 영역 + 인원수 조회를 DB 왕복 없이 메모리에서 처리하기 위한 모듈입니다.
+
+비즈니스 맥락:
+- 룸 카탈로그는 수백~수천 건 규모이고 scripts/collect_rooms.py 실행 시에만 변경됨
+- 예약 가능 여부 조회마다 Supabase 범위 쿼리 + Pydantic 검증을 반복할 필요가 없음
+"""
+
+from __future__ import annotations
+import bisect
+import logging
+import math
+import time
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.models.dto import RoomDetail
+
+logger = logging.getLogger("app")
+
+# 격자 한 칸의 크기(도). 0.01도 ≈ 위도 1.1km
+DEFAULT_CELL_SIZE_DEG = 0.01
+
+Cell = Tuple[int, int]
+
+
+class _CapacityBucket:
+    """maxCapacity 내림차순으로 정렬된 룸 목록 (인원 조건은 이분 탐색으로 prefix 선택)"""
+
+    __slots__ = ("rooms", "_neg_capacities")
+
+    def __init__(self, rooms: List[Tuple[int, RoomDetail]]):
+        # (카탈로그 순번, 룸) 튜플을 수용 인원 내림차순으로 정렬
+        self.rooms = sorted(rooms, key=lambda item: -item[1].maxCapacity)
+        self._neg_capacities = [-room.maxCapacity for _, room in self.rooms]
+
+    def at_least(self, capacity: int) -> List[Tuple[int, RoomDetail]]:
+        """maxCapacity >= capacity 인 룸만 반환"""
+        end = bisect.bisect_right(self._neg_capacities, -capacity)
+        return self.rooms[:end]
+
+
+class RoomSpatialIndex:
+    """지점 좌표 기반 격자 인덱스.
+
+    설계 결정:
+    - 룸 수가 적고 좌표가 도시 단위로 몰려 있으므로 R-tree 대신 단순 격자 사용
+    - 조회 영역의 격자 수가 실제 점유된 격자 수보다 많으면 점유 격자만 순회
+      (전국 단위 영역 조회 시에도 비용이 카탈로그 크기에 비례)
+    - 결과는 카탈로그 적재 순서를 유지 (DB 조회 결과와 동일한 순서)
+
+    Attributes:
+        cell_size: 격자 한 칸의 크기(도)
+        size: 인덱싱된 전체 룸 수
+        rooms: 적재 순서 그대로의 룸 카탈로그 전체 (카탈로그 엔드포인트용, 수정 금지)
+    """
+
+    def __init__(self, rooms: List[RoomDetail], cell_size: float = DEFAULT_CELL_SIZE_DEG):
+        self.cell_size = cell_size
+        self.size = len(rooms)
+        self.rooms = list(rooms)
+
+        indexed = list(enumerate(rooms))
+        cells: Dict[Cell, List[Tuple[int, RoomDetail]]] = {}
+        for item in indexed:
+            room = item[1]
+            if room.lat is None or room.lng is None:
+                continue
+            cells.setdefault(self._cell_of(room.lat, room.lng), []).append(item)
+
+        self._all = _CapacityBucket(indexed)
+        self._cells: Dict[Cell, _CapacityBucket] = {
+            cell: _CapacityBucket(items) for cell, items in cells.items()
+        }
+
+    def _cell_of(self, lat: float, lng: float) -> Cell:
+        return (math.floor(lat / self.cell_size), math.floor(lng / self.cell_size))
+
+    def query(
+        self,
+        capacity: int,
+        swLat: Optional[float] = None,
+        swLng: Optional[float] = None,
+        neLat: Optional[float] = None,
+        neLng: Optional[float] = None,
+    ) -> List[RoomDetail]:
+        """인원수(capacity 이상) + 지도 영역 조건에 맞는 룸 조회.
+
+        좌표가 하나라도 없으면 영역 필터 없이 인원수 조건만 적용합니다.
+        (좌표가 없는 룸은 영역 조회 결과에 포함되지 않음)
+        """
+        if any(v is None for v in [swLat, swLng, neLat, neLng]):
+            return [room for _, room in sorted(self._all.at_least(capacity), key=lambda item: item[0])]
+
+        min_cell = self._cell_of(swLat, swLng)
+        max_cell = self._cell_of(neLat, neLng)
+        span = (max_cell[0] - min_cell[0] + 1) * (max_cell[1] - min_cell[1] + 1)
+
+        if span <= 0:
+            return []
+
+        if span > len(self._cells):
+            buckets = [
+                bucket for (x, y), bucket in self._cells.items()
+                if min_cell[0] <= x <= max_cell[0] and min_cell[1] <= y <= max_cell[1]
+            ]
+        else:
+            buckets = [
+                self._cells[(x, y)]
+                for x in range(min_cell[0], max_cell[0] + 1)
+                for y in range(min_cell[1], max_cell[1] + 1)
+                if (x, y) in self._cells
+            ]
+
+        matched = [
+            item
+            for bucket in buckets
+            for item in bucket.at_least(capacity)
+            if swLat <= item[1].lat <= neLat and swLng <= item[1].lng <= neLng
+        ]
+        matched.sort(key=lambda item: item[0])
+        return [room for _, room in matched]
+
+
+class RoomIndexManager:
+    """룸 카탈로그 인덱스의 적재/갱신을 담당.
+
+    - TTL이 지나면 다음 조회 시점에 카탈로그를 다시 읽어 인덱스를 재구성 (주기적 갱신)
+    - invalidate() 호출 시 다음 조회에서 즉시 재구성 (같은 프로세스 안에서 카탈로그를 바꾼 경우)
+    - 룸 수집(scripts/collect_rooms.py)은 별도 프로세스에서 실행되므로 새로 수집한 룸은 TTL 주기로만 반영
+    - 재구성 실패 시 기존 인덱스가 있으면 계속 사용 (Graceful Degradation)
+
+    Attributes:
+        ttl_seconds: 인덱스 유효 시간(초)
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], List[RoomDetail]],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._index: Optional[RoomSpatialIndex] = None
+        self._loaded_at = 0.0
+        self._lock = Lock()
+
+    def invalidate(self):
+        """다음 조회 시 카탈로그를 다시 읽도록 표시합니다."""
+        with self._lock:
+            self._loaded_at = -math.inf
+
+    def get_index(self) -> RoomSpatialIndex:
+        """유효한 인덱스 반환 (필요 시 재구성)"""
+        index = self._index
+        if index is not None and self._clock() - self._loaded_at < self.ttl_seconds:
+            return index
+
+        with self._lock:
+            # Lock 획득 사이에 다른 스레드가 이미 갱신했는지 재확인
+            if self._index is not None and self._clock() - self._loaded_at < self.ttl_seconds:
+                return self._index
+            try:
+                rooms = self._loader()
+            except Exception as e:
+                if self._index is None:
+                    raise
+                logger.warning({
+                    "message": "룸 카탈로그 갱신 실패, 기존 인덱스를 계속 사용합니다.",
+                    "error_detail": str(e),
+                })
+                self._loaded_at = self._clock()
+                return self._index
+
+            self._index = RoomSpatialIndex(rooms)
+            self._loaded_at = self._clock()
+            return self._index
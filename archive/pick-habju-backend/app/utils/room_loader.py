@@ -1,13 +1,17 @@
 from app.core.supabase_client import supabase
-from app.core.config import SUPABASE_TABLE
-from typing import List, Optional
+from app.core.config import SUPABASE_TABLE, ROOM_INDEX_TTL_SECONDS
+from typing import List, Optional, Tuple
 from app.exception.api.room_loader_exception import RoomLoaderFailedError
 from app.models.dto import RoomDetail
+from app.utils.room_index import RoomIndexManager
 from postgrest.exceptions import APIError
 from pydantic import ValidationError
 
-# NOTE: API 레벨에서는 좌표가 필수(Mandatory)이지만, 기존 유닛 테스트 코드들과의 
-# 하위 호환성을 위해 내부 유틸리티 함수에서는 Optional로 유지합니다. 
+# 카탈로그 전체 적재 시 한 번에 조회할 행 수 (Supabase 응답 행 수 제한 max_rows 기본값 1000 이하)
+ROOM_PAGE_SIZE = 1000
+
+# NOTE: API 레벨에서는 좌표가 필수(Mandatory)이지만, 기존 유닛 테스트 코드들과의
+# 하위 호환성을 위해 내부 유틸리티 함수에서는 Optional로 유지합니다.
 # 추후 모든 테스트 코드에 Dummy 좌표를 적용한 뒤 필수값으로 리팩토링 예정입니다.
 def get_rooms_by_criteria(
     capacity: int,
@@ -18,9 +22,58 @@ def get_rooms_by_criteria(
 ) -> List[RoomDetail]:
 
     """
-    Supabase에서 capacity 이상인 룸만 조회합니다.
+    capacity 이상인 룸만 조회합니다.
     좌표가 주어지면 해당 범위 내의 룸만 필터링합니다.
+
+    룸 카탈로그 전체를 메모리 공간 인덱스(RoomSpatialIndex)로 유지하고 조회하므로
+    요청마다 DB 왕복이 발생하지 않습니다. (ROOM_INDEX_TTL_SECONDS 주기로 갱신,
+    0이면 기존처럼 매 요청 Supabase 범위 쿼리 수행)
+    """
+    if ROOM_INDEX_TTL_SECONDS <= 0:
+        return _query_rooms(capacity, swLat, swLng, neLat, neLng)
+
+    index = room_index_manager.get_index()
+    return index.query(capacity, swLat, swLng, neLat, neLng)
+
+
+def get_room_catalog() -> List[RoomDetail]:
+    """
+    룸 카탈로그 전체를 조회합니다. (카탈로그 엔드포인트용)
+
+    get_rooms_by_criteria와 같은 인덱스에서 읽으므로 두 응답의 룸 정보가 항상 일치합니다.
+    인덱스가 갱신되기 전까지는 같은 리스트 객체를 반환합니다.
+    """
+    if ROOM_INDEX_TTL_SECONDS <= 0:
+        return load_all_rooms()
+
+    return room_index_manager.get_index().rooms
+
+
+def load_all_rooms() -> List[RoomDetail]:
+    """Supabase에서 룸 카탈로그 전체를 조회합니다. (인덱스 적재용)
+
+    응답 행 수 제한에 카탈로그가 잘리지 않도록 ROOM_PAGE_SIZE 단위로 나누어 조회하고,
+    요청한 행 수보다 적게 돌아온 페이지를 마지막 페이지로 봅니다.
     """
+    rooms: List[RoomDetail] = []
+    offset = 0
+    while True:
+        page = _query_rooms(capacity=0, page=(offset, offset + ROOM_PAGE_SIZE - 1))
+        rooms.extend(page)
+        if len(page) < ROOM_PAGE_SIZE:
+            return rooms
+        offset += ROOM_PAGE_SIZE
+
+
+def _query_rooms(
+    capacity: int,
+    swLat: Optional[float] = None,
+    swLng: Optional[float] = None,
+    neLat: Optional[float] = None,
+    neLng: Optional[float] = None,
+    page: Optional[Tuple[int, int]] = None
+) -> List[RoomDetail]:
+    """Supabase 범위 쿼리로 룸을 직접 조회합니다. (page: 조회할 행 범위 (시작, 끝) - 양끝 포함)"""
     try:
         # 기본 쿼리: 인원수 조건 & Branch 정보 Join
         query = supabase.table("room").select("*, branch!inner(name, lat, lng)").gte("max_capacity", capacity)
@@ -35,6 +88,10 @@ def get_rooms_by_criteria(
                 .lte("branch.lng", neLng)
             )
 
+        # 페이지 단위 조회 시 페이지 경계가 흔들리지 않도록 고정 정렬
+        if page is not None:
+            query = query.order("biz_item_id").range(*page)
+
         response = query.execute()
 
         target_rooms = []
@@ -43,11 +100,11 @@ def get_rooms_by_criteria(
             if "branch" in row and isinstance(row["branch"], dict):
                 row["lat"] = row["branch"].get("lat")
                 row["lng"] = row["branch"].get("lng")
-            
+
             # image_urls가 None인 경우 빈 리스트로 변환 (DTO 요구사항 준수)
             if row.get("image_urls") is None:
                 row["image_urls"] = []
-                
+
             target_rooms.append(RoomDetail.model_validate(row))
         return target_rooms
 
@@ -57,3 +114,7 @@ def get_rooms_by_criteria(
         raise RoomLoaderFailedError(f"데이터 형식 오류: {str(e)}")
     except Exception as e:
         raise RoomLoaderFailedError(f"알 수 없는 오류: {str(e)}")
+
+
+# Global singleton instance
+room_index_manager = RoomIndexManager(loader=load_all_rooms, ttl_seconds=ROOM_INDEX_TTL_SECONDS)
@@ -0,0 +1,125 @@
+"""
+시간대 슬롯 비트마스크 변환
+
+하루 24개 정시 슬롯을 정수 하나의 비트(bit h = h시 정각 슬롯)로 표현합니다.
+예: 18:00, 19:00 예약 가능 → (1 << 18) | (1 << 19) = 786432
+
+설계 결정:
+- 룸 하루 일정은 예약 가능 마스크 + 조회 불가(unknown) 마스크 두 개로 표현
+  ("요청 시간대가 모두 예약 가능"은 (available & requested) == requested 한 번으로 판정)
+- 하루 범위(0~23시) 밖의 슬롯은 OUT_OF_DAY_BIT로 표시 → 어떤 일정에도 없으므로 항상 예약 불가
+- "HH:MM" 문자열 dict(available_slots)는 응답을 만들 때만 slot_states로 변환
+
+비즈니스 맥락:
+- 요청마다 수백 개 룸의 시간대 판정을 반복하므로 dict 생성 / 문자열 비교 대신 정수 연산 사용
+- 빈 시간대 검색: "N시간 연속 예약 가능"한 시작 시각을 window_starts 한 번으로 계산
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Union
+
+SlotState = Union[bool, str]
+
+HOURS_PER_DAY = 24
+# 하루 범위 밖 슬롯 표시용 비트 (예약 가능 / unknown 마스크에는 절대 설정되지 않음)
+OUT_OF_DAY_BIT = 1 << HOURS_PER_DAY
+
+# 하루 전체 시간 슬롯 ("00:00" ~ "23:00")
+FULL_DAY_SLOTS: List[str] = [f"{hour:02d}:00" for hour in range(HOURS_PER_DAY)]
+
+
+# "H:M" ~ "HH:MM" (datetime.strptime의 "%H:%M"과 같은 범위)
+_CLOCK_RE = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+
+def parse_clock(value: str) -> Tuple[int, int]:
+    """"HH:MM" 문자열을 (시, 분)으로 변환 (형식 / 범위 오류는 ValueError)"""
+    match = _CLOCK_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour >= HOURS_PER_DAY or minute >= 60:
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    return hour, minute
+
+
+def slot_hour(slot: str) -> int:
+    """"HH:MM" 슬롯의 시(hour) 반환"""
+    return int(slot[:2])
+
+
+def hour_bit(hour: int) -> int:
+    """시(hour)에 해당하는 비트 (하루 범위 밖이면 OUT_OF_DAY_BIT)"""
+    return 1 << hour if 0 <= hour < HOURS_PER_DAY else OUT_OF_DAY_BIT
+
+
+def hourly_masks(hourly: Sequence[SlotState]) -> Tuple[int, int]:
+    """하루 일정(hourly[h])을 (예약 가능 마스크, unknown 마스크)로 변환"""
+    available = unknown = 0
+    for hour, state in enumerate(hourly):
+        if state is True:
+            available |= 1 << hour
+        elif state == "unknown":
+            unknown |= 1 << hour
+    return available, unknown
+
+
+@lru_cache(maxsize=256)
+def slot_bits(hour_slots: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, int], ...], int]:
+    """요청 시간대의 (슬롯, 비트) 목록과 전체 요청 마스크 (요청마다 같은 시간대가 반복되므로 캐시)"""
+    pairs = tuple((slot, hour_bit(slot_hour(slot))) for slot in hour_slots)
+    requested = 0
+    for _, bit in pairs:
+        requested |= bit
+    return pairs, requested
+
+
+@lru_cache(maxsize=256)
+def on_the_hour(hour_slots: Tuple[str, ...]) -> bool:
+    """요청 시간대가 모두 정각(HH:00) 슬롯인지 (마스크는 정각 슬롯만 표현)"""
+    return all(slot[3:5] == "00" for slot in hour_slots)
+
+
+def availability_of(available: int, unknown: int, requested: int) -> SlotState:
+    """요청 마스크 전체에 대한 예약 가능 여부 (하나라도 unknown이면 "unknown")"""
+    if unknown & requested:
+        return "unknown"
+    return available & requested == requested
+
+
+def slot_states(available: int, unknown: int, pairs: Sequence[Tuple[str, int]]) -> Dict[str, SlotState]:
+    """마스크를 기존 응답 형식의 슬롯별 상태 dict로 변환"""
+    return {
+        slot: True if available & bit else ("unknown" if unknown & bit else False)
+        for slot, bit in pairs
+    }
+
+
+def window_starts(mask: int, hours: int) -> int:
+    """hours시간 연속으로 비트가 설정된 구간의 시작 시각 마스크 (슬라이딩 윈도우를 shift AND로 계산)"""
+    starts = mask
+    for offset in range(1, hours):
+        starts &= mask >> offset
+    return starts
+
+
+def free_windows(mask: int, hours: int) -> List[Tuple[int, int]]:
+    """hours시간 이상 연속 예약 가능한 최대 구간 목록 [(시작 시, 마지막 슬롯 시)]
+
+    예: 18~21시 예약 가능, hours=2 → [(18, 21)]
+    """
+    starts = window_starts(mask, hours)
+    windows: List[Tuple[int, int]] = []
+    hour = 0
+    while starts >> hour:
+        if not starts >> hour & 1:
+            hour += 1
+            continue
+        # 구간의 첫 시작점이므로 연속 구간 끝까지 확장 (구간 안의 나머지 시작점은 건너뜀)
+        end = hour + hours - 1
+        while mask >> (end + 1) & 1:
+            end += 1
+        windows.append((hour, end))
+        hour = end + 1
+    return windows
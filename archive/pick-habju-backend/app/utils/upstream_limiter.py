@@ -0,0 +1,207 @@
+"""
+업스트림(외부 예약 사이트)별 동시 요청 수 / 요청 속도 제한기
+
+크롤러는 대상 룸마다 asyncio.gather로 요청을 동시에 보내므로, 지도 영역이 넓으면
+수백 개의 요청이 한꺼번에 같은 호스트로 나가게 됩니다. 이 모듈은 (크롤러 타입, 호스트)
+단위로 동시 요청 수와 초당 요청 수를 제한하고, 업스트림 응답에 따라 한도를 자동 조절합니다.
+
+설계 결정:
+- 동시 요청 수는 AIMD(Additive Increase / Multiplicative Decrease) 방식으로 조절
+  - 성공 응답: 한도를 1/limit 만큼 증가 (한 주기에 약 +1)
+  - 429 / 5xx / 네트워크 타임아웃: 한도와 요청 속도를 절반으로 감소
+- 한 번의 과부하로 이미 나가 있던 요청들이 연달아 실패해도 한도가 0까지 떨어지지 않도록
+  감소 후 cooldown_seconds 동안은 추가 감소를 하지 않음
+- 4xx(429 제외)는 요청 자체의 문제이므로 한도 조절에 반영하지 않음
+
+비즈니스 맥락:
+- 업스트림의 Rate Limit에 걸리면 이후 요청이 모두 실패하고 재시도가 겹쳐 상황이 악화됨
+- 한도 안에서 대기시키면 넓은 영역 조회는 조금 느려지지만 결과는 정상적으로 반환됨
+"""
+
+from __future__ import annotations
+import asyncio
+import math
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import UPSTREAM_LIMITS
+
+
+def is_congestion_status(status_code: int) -> Optional[bool]:
+    """응답 상태 코드를 혼잡 신호로 분류합니다.
+
+    Returns:
+        True: 혼잡(429, 5xx) / False: 정상 / None: 한도 조절과 무관(기타 4xx)
+    """
+    if status_code == 429 or status_code >= 500:
+        return True
+    if status_code < 400:
+        return False
+    return None
+
+
+class TokenBucket:
+    """초당 rate개의 토큰을 채우는 토큰 버킷 (최대 burst개 저장)
+
+    rate가 0 이하이면 속도 제한을 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        # 대기 순서 보장 (먼저 기다린 요청이 먼저 토큰을 가져감)
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                self._refill()
+                # 부동소수점 오차로 토큰이 1에 아주 조금 못 미쳐 대기가 반복되는 것을 방지
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return
+                await self._sleep((1 - self._tokens) / self.rate)
+
+
+class AdaptiveLimiter:
+    """AIMD로 한도를 조절하는 동시 요청 수 제한기 + 토큰 버킷
+
+    Attributes:
+        name: 식별용 이름 (예: "naver@booking.naver.com")
+        max_concurrency: 동시 요청 수 상한 (설정값)
+        limit: 현재 적용 중인 동시 요청 수 한도
+        max_rate: 초당 요청 수 상한 (설정값)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        rate_per_second: float,
+        min_concurrency: int = 1,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.limit = float(max_concurrency)
+        self.max_rate = rate_per_second
+        self.min_rate = min(min_rate, rate_per_second) if rate_per_second > 0 else 0
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.bucket = TokenBucket(rate_per_second, burst=max(1.0, rate_per_second), clock=clock, sleep=sleep)
+        self._clock = clock
+        self._in_flight = 0
+        self._last_decrease = -math.inf
+        self._cond = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self):
+        """동시 요청 슬롯과 토큰을 획득할 때까지 대기합니다."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            await self.release(None)
+            raise
+
+    async def release(self, congested: Optional[bool]):
+        """슬롯을 반납하고 응답 결과를 한도 조절에 반영합니다.
+
+        Args:
+            congested: True(혼잡 신호) / False(정상 응답) / None(반영하지 않음)
+        """
+        async with self._cond:
+            self._in_flight -= 1
+            if congested is True:
+                self._decrease()
+            elif congested is False:
+                self._increase()
+            self._cond.notify_all()
+
+    def _increase(self):
+        self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+        if self.bucket.rate > 0:
+            self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate / (10 * self.max_concurrency))
+
+    def _decrease(self):
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+        if self.bucket.rate > 0:
+            self.bucket.rate = max(self.min_rate, self.bucket.rate * self.decrease_factor)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "limit": round(self.limit, 2),
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "rate_per_second": round(self.bucket.rate, 2),
+        }
+
+
+class UpstreamLimiterRegistry:
+    """(크롤러 타입, 호스트) 단위 AdaptiveLimiter 저장소
+
+    설정(UPSTREAM_LIMITS)에 없는 크롤러 타입은 제한하지 않습니다.
+    """
+
+    def __init__(self, settings: Dict[str, Tuple[int, float]] = UPSTREAM_LIMITS):
+        self._settings = settings
+        self._limiters: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+
+    def get(self, upstream: str, url: str) -> Optional[AdaptiveLimiter]:
+        setting = self._settings.get(upstream)
+        if setting is None:
+            return None
+
+        host = httpx.URL(url).host
+        key = (upstream, host)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            max_concurrency, rate_per_second = setting
+            limiter = AdaptiveLimiter(f"{upstream}@{host}", max_concurrency, rate_per_second)
+            self._limiters[key] = limiter
+        return limiter
+
+    def clear(self):
+        """생성된 제한기를 모두 제거합니다. (다음 요청 시 설정값으로 다시 생성)"""
+        self._limiters.clear()
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        return [limiter.snapshot() for limiter in self._limiters.values()]
+
+
+# Global singleton instance
+upstream_limiters = UpstreamLimiterRegistry()
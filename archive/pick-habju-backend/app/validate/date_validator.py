@@ -1,6 +1,7 @@
 import re
-from datetime import datetime, date as dt_date
-from app.exception.common.date_exception import InvalidDateFormatError, PastDateNotAllowedError
+from datetime import datetime, timedelta, date as dt_date
+from typing import List
+from app.exception.common.date_exception import InvalidDateFormatError, InvalidDateRangeError, PastDateNotAllowedError
 
 DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
 
@@ -20,3 +21,16 @@ def validate_date(date: str):
     """날짜 전체 검증(형식 + 과거여부)"""
     validate_date_format(date)
     validate_date_not_past(date)
+
+def validate_date_range(start_date: str, end_date: str, max_days: int) -> List[str]:
+    """날짜 범위 검증(각 날짜 검증 + 순서 + 최대 일수) 후 범위 안의 날짜 목록(YYYY-MM-DD) 반환"""
+    validate_date(start_date)
+    validate_date(end_date)
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    if end < start:
+        raise InvalidDateRangeError(f"종료 날짜가 시작 날짜보다 빠릅니다: {start_date} ~ {end_date}")
+    days = (end - start).days + 1
+    if days > max_days:
+        raise InvalidDateRangeError(f"한 번에 최대 {max_days}일까지 조회할 수 있습니다: {start_date} ~ {end_date}")
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
@@ -8,6 +8,7 @@ import os
 sys.path.append(os.getcwd())
 
 from app.services.room_collection_service import RoomCollectionService
+from app.utils.client_loader import set_global_client, close_global_client
 from dotenv import load_dotenv
 
 # Logging configuration
@@ -33,6 +34,8 @@ async def main():
     load_dotenv()
 
     service = RoomCollectionService()
+    # 지도 검색(MAP_SEARCH_BACKEND=http) / 상세 정보 수집 요청이 연결을 재사용하도록 전역 HTTP 클라이언트 사용
+    await set_global_client()
 
     try:
         if args.id:
@@ -53,6 +56,9 @@ async def main():
     except Exception as e:
         logger.error(f"Collection failed: {e}")
         sys.exit(1)
+    finally:
+        await service.aclose()
+        await close_global_client()
 
 if __name__ == "__main__":
     # if sys.platform.startswith('win'):
@@ -4,7 +4,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 from app.main import app
 from app.crawler.base import BaseCrawler, RoomResult
-from app.models.dto import RoomAvailability, RoomDetail
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.core.response import ApiResponse
+from app.models.dto import AvailabilityResponse, RoomAvailability, RoomDetail
 from app.api.dependencies import get_crawlers_map
 
 client = TestClient(app)
@@ -98,9 +101,16 @@ def test_get_availability_api():
         assert "available_biz_item_ids" in result
         # MockCrawler는 항상 True를 반환하므로 결과가 있어야 함
         assert len(result["results"]) == 2
+        # live 응답에는 checked_at 필드가 없음 (snapshot / recheck 전용)
+        assert all("checked_at" not in room for room in result["results"])
         # branch_summary가 있어야 함 (지도 기능 확장)
         assert "branch_summary" in result
 
+        # 응답 바이트는 기본 경로(response_model 검증 + jsonable_encoder + JSONResponse)와 동일
+        legacy = JSONResponse(jsonable_encoder(ApiResponse[AvailabilityResponse].model_validate(data)))
+        assert response.content == legacy.body
+        assert response.headers["content-type"] == "application/json"
+
 
 
 def test_preflight_request():
@@ -114,3 +114,34 @@ async def test_map_search_success(
         called_arg = mock_method.call_args[1]['request']
         assert isinstance(called_arg, AvailabilityRequest)
         assert called_arg.neLat == 37.6
+
+
+@pytest.mark.asyncio
+async def test_map_search_compact_mode(
+    async_client: AsyncClient,
+    mock_availability_response_factory,
+    mock_room_info_factory,
+    future_date
+):
+    """
+    compact=true 요청 시 룸 상세 정보 없이 예약 가능 룸의 biz_item_id만 반환되어야 한다.
+    """
+    room_avail = mock_room_info_factory(name="Compact Room", biz_item_id="777")  # 12:00, 13:00 예약 가능
+    mock_response = mock_availability_response_factory(results=[room_avail])
+
+    with patch("app.services.availability_service.AvailabilityService.check_availability", new_callable=AsyncMock) as mock_method:
+        mock_method.return_value = mock_response
+        params = {
+            "date": future_date, "capacity": 5, "start_hour": "12:00", "end_hour": "14:00",
+            "swLat": 37.4, "neLat": 37.6, "swLng": 126.9, "neLng": 127.1,
+        }
+
+        full = await async_client.get("/api/rooms/availability", params=params)
+        compact = await async_client.get("/api/rooms/availability", params={**params, "compact": "true"})
+
+    assert compact.status_code == 200
+    data = compact.json()["result"]
+    assert data["rooms"] == [{"biz_item_id": "777", "checked_at": None}]
+    assert data["branch_summary"] == full.json()["result"]["branch_summary"]
+    assert "results" not in data
+    assert len(compact.content) < len(full.content)
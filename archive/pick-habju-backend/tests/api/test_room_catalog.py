@@ -0,0 +1,77 @@
+# tests/api/test_room_catalog.py
+"""
+룸 카탈로그 엔드포인트 (/api/rooms/catalog) 테스트
+
+테스트 대상:
+- 예약 가능 여부 조회와 같은 룸 인덱스의 카탈로그 반환
+- ETag / Cache-Control 헤더, If-None-Match 일치 시 304
+- 카탈로그가 바뀌면 ETag도 변경
+
+실행: pytest tests/api/test_room_catalog.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.api.room_catalog import room_catalog_encoder
+from app.utils.room_index import RoomIndexManager
+from app.utils.room_loader import get_rooms_by_criteria
+
+URL = "/api/rooms/catalog"
+
+
+@pytest.fixture
+def catalogue(mock_room_detail_factory):
+    return [
+        mock_room_detail_factory(name="블랙룸", business_id="1001", biz_item_id="a1", lat=37.55, lng=126.92),
+        mock_room_detail_factory(name="화이트룸", business_id="1001", biz_item_id="a2", lat=37.55, lng=126.92, maxCapacity=4),
+    ]
+
+
+@pytest.fixture
+def index_manager(catalogue):
+    manager = RoomIndexManager(loader=lambda: list(catalogue), ttl_seconds=300)
+    room_catalog_encoder.clear()
+    with patch("app.utils.room_loader.room_index_manager", manager), \
+         patch("app.utils.room_loader.ROOM_INDEX_TTL_SECONDS", 300):
+        yield manager
+    room_catalog_encoder.clear()
+
+
+@pytest.mark.asyncio
+async def test_catalog_serves_same_rooms_as_availability_index(async_client, index_manager, catalogue):
+    response = await async_client.get(URL)
+
+    assert response.status_code == 200
+    rooms = response.json()["result"]["rooms"]
+    assert [r["biz_item_id"] for r in rooms] == ["a1", "a2"]
+    assert rooms[0]["image_urls"] == catalogue[0].imageUrls
+    # 예약 가능 여부 조회도 같은 인덱스에서 읽음
+    assert get_rooms_by_criteria(1, 37.5, 126.9, 37.6, 127.0)[0] is index_manager.get_index().rooms[0]
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "public, max-age=300"
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304(async_client, index_manager):
+    etag = (await async_client.get(URL)).headers["etag"]
+
+    not_modified = await async_client.get(URL, headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_when_catalog_reloads(async_client, index_manager, catalogue, mock_room_detail_factory):
+    etag = (await async_client.get(URL)).headers["etag"]
+
+    catalogue.append(mock_room_detail_factory(name="새 룸", biz_item_id="a3"))
+    index_manager.invalidate()
+    response = await async_client.get(URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()["result"]["rooms"]) == 3
@@ -0,0 +1,324 @@
+"""
+예약 가능 여부 조회 핫패스 오프라인 벤치마크 하네스
+
+녹화된 업스트림 응답(네이버 GraphQL JSON, 드림 ajax.calendar.time.php 응답, 그루브 예약 테이블 HTML)을
+httpx.MockTransport로 재생하여, 네트워크 없이 AvailabilityService.check_availability를
+처음부터 끝까지(크롤러 요청 → 파싱 → 집계) 실행하고 다음 지표를 측정합니다.
+
+- 처리량: 초당 처리 요청 수 / 초당 처리 룸 수
+- 지연 시간: 요청별 p50 / p95 / p99
+- 메모리: 요청 1회 처리 중 최대 추가 할당량(tracemalloc peak)과 할당 블록 수
+- 이벤트 루프 지연: 측정 중 5ms 주기 타이머가 늦게 깨어난 최대 시간 (파싱 등 동기 작업이 루프를 막은 정도)
+
+실행 (pick-habju-backend 디렉토리, SUPABASE_URL/SUPABASE_KEY 환경변수 필요):
+    python -m tests.benchmark.harness --rooms 10 100 1000 --concurrency 4 --iterations 20
+    pytest -m benchmark tests/benchmark -s
+
+설계 결정:
+- 캐시 / 응답 대기 한도 / 서킷 브레이커 / 업스트림 제한기 / 헤징은 끄고 측정
+  (크롤러 파싱과 집계 자체의 비용을 보기 위함, 업스트림 지연은 --latency-ms로 별도 모사)
+- 모든 룸은 18:00~19:00이 비어 있도록 녹화 응답을 구성하여, 결과 개수로 정확성도 함께 검증
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import httpx
+
+from app.crawler.dream_checker import DreamCrawler
+from app.crawler.groove_checker import GrooveCrawler
+from app.crawler.naver_checker import NaverCrawler
+from app.models.dto import AvailabilityRequest, RoomDetail
+from app.services.availability_service import AvailabilityService
+from app.utils.circuit_breaker import CircuitBreakerRegistry
+from app.utils.hedging import LatencyTracker
+from app.utils.login import GrooveSessionManager
+from app.utils.request_coalescer import RequestCoalescer
+from app.utils.upstream_limiter import UpstreamLimiterRegistry
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+GROOVE_BASE_URL = "https://groove.bench"
+DREAM_HOST = httpx.URL(DreamCrawler._URL).host
+
+LOOP_LAG_PROBE_INTERVAL = 0.005
+
+ROW_START = "<!--ROOM_ROW_START-->"
+ROW_END = "<!--ROOM_ROW_END-->"
+
+
+class PassThroughCoalescer(RequestCoalescer):
+    """요청을 합치지 않는 RequestCoalescer (동시 요청 겹침에 따라 업스트림 호출 수 / 지연이 달라지지 않도록)"""
+
+    async def run(self, key, factory):
+        self.leaders += 1
+        return await factory()
+
+
+def make_rooms(count: int) -> List[RoomDetail]:
+    """벤치마크용 룸 카탈로그 (그루브 10%, 드림 10%, 나머지 네이버 지점당 8개)"""
+    rooms = []
+    for i in range(count):
+        if i % 10 == 0:
+            business_id = "sadang"
+        elif i % 10 == 1:
+            business_id = "dream_sadang"
+        else:
+            business_id = str(1000 + i // 8)
+        rooms.append(RoomDetail(
+            name=f"벤치룸{i}",
+            branch=f"벤치지점{business_id}",
+            business_id=business_id,
+            biz_item_id=str(100000 + i),
+            imageUrls=[],
+            maxCapacity=10,
+            recommendCapacity=5,
+            pricePerHour=10000 + (i % 7) * 1000,
+            canReserveOneHour=True,
+            requiresCallOnSameDay=False,
+            lat=37.5 + (i % 100) * 0.001,
+            lng=127.0 + (i // 100) * 0.001,
+        ))
+    return rooms
+
+
+class RecordedUpstreams:
+    """녹화된 응답을 재생하는 가짜 업스트림 (요청 수 집계 포함)"""
+
+    def __init__(self, rooms: List[RoomDetail], latency: float = 0.0):
+        self.latency = latency
+        self.requests: Dict[str, int] = {"naver": 0, "dream": 0, "groove": 0}
+
+        self.naver_schedule = json.loads((FIXTURES_DIR / "naver_schedule.json").read_text())["data"]["schedule"]
+        self.dream_payload = (FIXTURES_DIR / "dream_calendar_time.json").read_bytes()
+
+        page = (FIXTURES_DIR / "groove_reserve_table.html").read_text()
+        head, rest = page.split(ROW_START)
+        row, tail = rest.split(ROW_END)
+        groove_rows = [row.replace("__ROOM__", r.biz_item_id) for r in rooms if r.business_id == "sadang"]
+        self.groove_page = (head + "".join(groove_rows) + tail).encode("utf-8")
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        host = request.url.host
+        if host == "booking.naver.com":
+            self.requests["naver"] += 1
+            variables = json.loads(request.content)["variables"]
+            if "scheduleParams" in variables:
+                data = {"schedule": self.naver_schedule}
+            else:
+                data = {f"s{name[1:]}": self.naver_schedule for name in variables}
+            return httpx.Response(200, json={"data": data})
+
+        if host == DREAM_HOST:
+            self.requests["dream"] += 1
+            return httpx.Response(200, content=self.dream_payload, headers={"content-type": "application/json"})
+
+        if host == httpx.URL(GROOVE_BASE_URL).host:
+            self.requests["groove"] += 1
+            if request.url.path.endswith("login_exec.asp"):
+                return httpx.Response(200, headers={"set-cookie": "ASPSESSIONID=bench; path=/"})
+            return httpx.Response(200, content=self.groove_page, headers={"content-type": "text/html"})
+
+        return httpx.Response(404)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+@dataclass
+class BenchmarkResult:
+    room_count: int
+    concurrency: int
+    latencies: List[float]
+    wall_seconds: float
+    peak_alloc_bytes: int
+    alloc_blocks: int
+    upstream_requests: Dict[str, int]
+    available_counts: List[int] = field(default_factory=list)
+    max_loop_lag: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 요청 수"""
+        return len(self.latencies) / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def rooms_per_second(self) -> float:
+        return self.throughput * self.room_count
+
+    def percentile(self, p: float) -> float:
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(p * (len(ordered) - 1))))
+        return ordered[index]
+
+    def report(self) -> str:
+        return (
+            f"rooms={self.room_count:>5} conc={self.concurrency:>3} "
+            f"req/s={self.throughput:8.1f} rooms/s={self.rooms_per_second:10.1f} "
+            f"p50={self.percentile(0.5) * 1000:8.2f}ms p95={self.percentile(0.95) * 1000:8.2f}ms "
+            f"p99={self.percentile(0.99) * 1000:8.2f}ms mean={statistics.mean(self.latencies) * 1000:8.2f}ms "
+            f"loop_lag_max={self.max_loop_lag * 1000:8.2f}ms "
+            f"peak_alloc={self.peak_alloc_bytes / 1024:9.1f}KiB blocks={self.alloc_blocks:>7} "
+            f"upstream={self.upstream_requests}"
+        )
+
+
+def _benchmark_request() -> AvailabilityRequest:
+    return AvailabilityRequest(
+        date=(datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"),
+        capacity=1,
+        start_hour="18:00",
+        end_hour="19:00",
+        swLat=30.0, swLng=120.0, neLat=45.0, neLng=140.0,
+    )
+
+
+def _patched_environment(stack: ExitStack, rooms: List[RoomDetail], upstreams: RecordedUpstreams) -> httpx.AsyncClient:
+    """외부 의존성(DB, 네트워크, 보호 장치)을 녹화 응답 기반으로 교체합니다."""
+    client = upstreams.client()
+    patches = [
+        patch("app.services.availability_service.get_rooms_by_criteria", lambda **_: rooms),
+        patch("app.utils.client_loader._shared_client", client),
+        patch("app.utils.client_loader.upstream_limiters", UpstreamLimiterRegistry({})),
+        patch("app.utils.client_loader.circuit_breakers", CircuitBreakerRegistry()),
+        patch("app.utils.client_loader.request_coalescer", PassThroughCoalescer()),
+        patch("app.crawler.naver_checker.request_coalescer", PassThroughCoalescer()),
+        patch("app.crawler.naver_checker.naver_latency", LatencyTracker(percentile=0)),
+        patch("app.crawler.groove_checker.GROOVE_RESERVE_URL", f"{GROOVE_BASE_URL}/reservation/reserve_table_view.asp"),
+        patch("app.crawler.groove_checker.groove_session", GrooveSessionManager(client_factory=upstreams.client)),
+        patch("app.utils.login.GROOVE_BASE_URL", GROOVE_BASE_URL),
+        patch("app.utils.login.LOGIN_ID", "bench"),
+        patch("app.utils.login.LOGIN_PW", "bench"),
+    ]
+    for p in patches:
+        stack.enter_context(p)
+    return client
+
+
+async def run_availability_benchmark(
+    room_count: int,
+    concurrency: int = 1,
+    iterations: int = 10,
+    upstream_latency: float = 0.0,
+    trace_allocations: bool = True,
+) -> BenchmarkResult:
+    """AvailabilityService.check_availability를 녹화 응답으로 반복 실행하여 지표를 수집합니다.
+
+    Args:
+        room_count: 조회 대상 룸 수
+        concurrency: 동시에 처리할 요청 수
+        iterations: 측정할 총 요청 수
+        upstream_latency: 업스트림 응답마다 추가할 지연(초)
+        trace_allocations: 요청 1회를 추가로 실행하여 메모리 할당량 측정 (tracemalloc으로 수 배 느려짐)
+    """
+    rooms = make_rooms(room_count)
+    upstreams = RecordedUpstreams(rooms, latency=upstream_latency)
+    service = AvailabilityService(
+        {"naver": NaverCrawler(), "dream": DreamCrawler(), "groove": GrooveCrawler()},
+        cache=None,
+        deadline_seconds=0,
+    )
+    request = _benchmark_request()
+
+    with ExitStack() as stack:
+        client = _patched_environment(stack, rooms, upstreams)
+        try:
+            # 워밍업 (그루브 로그인, 임포트 지연 등 1회성 비용 제외)
+            await service.check_availability(request)
+            upstreams.requests = {key: 0 for key in upstreams.requests}
+
+            latencies: List[float] = []
+            available_counts: List[int] = []
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one():
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await service.check_availability(request)
+                    latencies.append(time.perf_counter() - started)
+                    available_counts.append(len(response.available_biz_item_ids))
+
+            max_loop_lag = 0.0
+
+            async def lag_probe():
+                nonlocal max_loop_lag
+                while True:
+                    expected = time.perf_counter() + LOOP_LAG_PROBE_INTERVAL
+                    await asyncio.sleep(LOOP_LAG_PROBE_INTERVAL)
+                    max_loop_lag = max(max_loop_lag, time.perf_counter() - expected)
+
+            probe = asyncio.create_task(lag_probe())
+            wall_started = time.perf_counter()
+            try:
+                await asyncio.gather(*(one() for _ in range(iterations)))
+            finally:
+                probe.cancel()
+            wall_seconds = time.perf_counter() - wall_started
+            upstream_requests = {key: count // iterations for key, count in upstreams.requests.items()}
+
+            # 메모리: 요청 1회 처리 중 최대 추가 할당량
+            peak_alloc_bytes = alloc_blocks = 0
+            if trace_allocations:
+                tracemalloc.start()
+                try:
+                    baseline = tracemalloc.take_snapshot()
+                    tracemalloc.reset_peak()
+                    start_current, _ = tracemalloc.get_traced_memory()
+                    await service.check_availability(request)
+                    _, peak = tracemalloc.get_traced_memory()
+                    after = tracemalloc.take_snapshot()
+                finally:
+                    tracemalloc.stop()
+                peak_alloc_bytes = max(0, peak - start_current)
+                alloc_blocks = sum(
+                    max(0, stat.count_diff) for stat in after.compare_to(baseline, "filename")
+                )
+        finally:
+            await client.aclose()
+
+    return BenchmarkResult(
+        room_count=room_count,
+        concurrency=concurrency,
+        latencies=latencies,
+        wall_seconds=wall_seconds,
+        peak_alloc_bytes=peak_alloc_bytes,
+        alloc_blocks=alloc_blocks,
+        upstream_requests=upstream_requests,
+        available_counts=available_counts,
+        max_loop_lag=max_loop_lag,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 가능 여부 조회 오프라인 벤치마크")
+    parser.add_argument("--rooms", type=int, nargs="+", default=[10, 100, 1000], help="룸 수 목록")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4], help="동시 요청 수 목록")
+    parser.add_argument("--iterations", type=int, default=20, help="측정 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="업스트림 응답 지연(ms)")
+    parser.add_argument("--no-alloc", action="store_true", help="메모리 할당량 측정 생략")
+    args = parser.parse_args()
+
+    for room_count in args.rooms:
+        for concurrency in args.concurrency:
+            result = asyncio.run(run_availability_benchmark(
+                room_count, concurrency, args.iterations, args.latency_ms / 1000,
+                trace_allocations=not args.no_alloc,
+            ))
+            print(result.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# tests/benchmark/test_availability_benchmark.py
+"""
+예약 가능 여부 조회 핫패스 벤치마크 (녹화 응답 재생, 네트워크 불필요)
+
+기본 테스트 실행에서는 제외되며(-m "not benchmark"), 아래처럼 명시적으로 실행합니다.
+    pytest -m benchmark tests/benchmark -s
+
+결과(처리량, 지연 p50/p95/p99, 할당량)는 표준 출력으로 출력되며,
+모든 룸이 예약 가능하도록 구성된 녹화 응답을 사용하므로 결과 개수로 정확성도 검증합니다.
+"""
+
+import pytest
+
+from tests.benchmark.harness import run_availability_benchmark
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("room_count, iterations", [(10, 20), (100, 10), (1000, 3)])
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_availability_hot_path(room_count, iterations, concurrency):
+    result = await run_availability_benchmark(room_count, concurrency=concurrency, iterations=iterations)
+
+    print("\n" + result.report())
+
+    assert result.available_counts == [room_count] * iterations
+    # 네이버는 지점(business_id) 단위 배치 요청
+    assert result.upstream_requests["naver"] < room_count
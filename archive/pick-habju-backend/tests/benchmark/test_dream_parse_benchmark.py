@@ -0,0 +1,56 @@
+# tests/benchmark/test_dream_parse_benchmark.py
+"""
+드림 캘린더 파싱 벤치마크 (녹화 응답 기준)
+
+시간대마다 soup.find로 문서 전체를 탐색하던 기존 방식과
+label 태그를 한 번만 훑는 parse_day_hourly를 같은 응답으로 비교합니다.
+
+실행: pytest -m benchmark tests/benchmark/test_dream_parse_benchmark.py -s
+"""
+
+import html
+import json
+import time
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.crawler.dream_checker import parse_day_hourly
+
+FIXTURE = Path(__file__).parent / "fixtures" / "dream_calendar_time.json"
+
+
+def _soup_parse_day_hourly(items_html: str, hours) -> dict:
+    """기존 방식: BeautifulSoup 트리 생성 후 시간대마다 soup.find"""
+    soup = BeautifulSoup(items_html, "lxml")
+    result = {}
+    for hour in hours:
+        label = soup.find("label", title=lambda t: t and f"{hour:02d}시00분" in t)
+        result[hour] = bool(label) and "active" in label.get("class", [])
+    return result
+
+
+def _per_call_ms(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("slot_count", [1, 4, 24])
+def test_dream_parse_single_pass_vs_soup(slot_count):
+    items_html = html.unescape(json.loads(FIXTURE.read_text())["items"])
+    hours = list(range(18, 18 + slot_count)) if slot_count < 6 else list(range(24))
+    iterations = 200
+
+    soup_ms = _per_call_ms(lambda: _soup_parse_day_hourly(items_html, hours), iterations)
+    single_pass_ms = _per_call_ms(lambda: parse_day_hourly(items_html), iterations)
+
+    print(f"\nslots={slot_count:>2} soup.find={soup_ms:7.3f}ms single_pass={single_pass_ms:7.3f}ms "
+          f"speedup={soup_ms / single_pass_ms:6.1f}x")
+
+    hourly = parse_day_hourly(items_html)
+    assert {hour: hourly[hour] for hour in hours} == _soup_parse_day_hourly(items_html, hours)
+    assert single_pass_ms < soup_ms
@@ -0,0 +1,96 @@
+# tests/benchmark/test_fetcher_connection_benchmark.py
+"""
+NaverRoomFetcher 연결 재사용 벤치마크 (가짜 transport, 네트워크 불필요)
+
+transport 하나를 연결 하나로 보고, 첫 요청에서 연결 수립(TCP + TLS 핸드셰이크) 지연을 모사합니다.
+- per_business: 지점마다 새 AsyncClient (기존 구현, 지점마다 핸드셰이크)
+- pooled: 수명이 긴 클라이언트 하나를 주입하여 모든 지점이 연결 재사용
+
+실행: pytest -m benchmark tests/benchmark/test_fetcher_connection_benchmark.py -s
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.crawler.naver_room_fetcher import NaverRoomFetcher
+
+BUSINESS_COUNT = 100
+CONCURRENCY = 10
+HANDSHAKE_SECONDS = 0.03
+REQUEST_SECONDS = 0.002
+
+
+class HandshakeTransport(httpx.AsyncBaseTransport):
+    """첫 요청에서 연결 수립 지연을 한 번 모사하고, 이후 요청은 요청 지연만 발생"""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+        self._connected = None
+
+    async def _connect(self):
+        if self._connected is None:
+            self._connected = asyncio.ensure_future(asyncio.sleep(HANDSHAKE_SECONDS))
+            self.stats["handshakes"] += 1
+        await asyncio.shield(self._connected)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._connect()
+        await asyncio.sleep(REQUEST_SECONDS)
+        self.stats["requests"] += 1
+        body = await request.aread()
+        if b'"business"' in body:
+            data = {"business": {"businessId": "1001", "coordinates": [127.0, 37.5], "placeId": "p1"}}
+        elif b'"bizItems"' in body:
+            data = {"bizItems": [{"bizItemId": "r1", "name": "A룸"}]}
+        else:
+            data = {"nearSubway": {"displayName": "사당역"}}
+        return httpx.Response(200, json={"data": data}, request=request)
+
+
+async def _collect(fetch_one, business_ids):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def run(business_id):
+        async with semaphore:
+            return await fetch_one(business_id)
+
+    return await asyncio.gather(*(run(business_id) for business_id in business_ids))
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_connections():
+    business_ids = [str(1000 + i) for i in range(BUSINESS_COUNT)]
+
+    per_business_stats = {"handshakes": 0, "requests": 0}
+
+    async def per_business(business_id):
+        async with httpx.AsyncClient(transport=HandshakeTransport(per_business_stats)) as client:
+            return await NaverRoomFetcher(client=client).fetch_full_info(business_id)
+
+    started = time.perf_counter()
+    per_business_results = await _collect(per_business, business_ids)
+    per_business_ms = (time.perf_counter() - started) * 1000
+
+    pooled_stats = {"handshakes": 0, "requests": 0}
+    client = httpx.AsyncClient(transport=HandshakeTransport(pooled_stats))
+    fetcher = NaverRoomFetcher(client=client)
+
+    started = time.perf_counter()
+    pooled_results = await _collect(fetcher.fetch_full_info, business_ids)
+    pooled_ms = (time.perf_counter() - started) * 1000
+    await client.aclose()
+
+    print(f"\nbusinesses={BUSINESS_COUNT} concurrency={CONCURRENCY} handshake={HANDSHAKE_SECONDS * 1000:.0f}ms")
+    print(f"  per_business  {per_business_ms:8.1f}ms  handshakes={per_business_stats['handshakes']}")
+    print(f"  pooled        {pooled_ms:8.1f}ms  handshakes={pooled_stats['handshakes']}  speedup={per_business_ms / pooled_ms:4.1f}x")
+
+    assert pooled_results == per_business_results
+    assert all(result["subway"] == {"displayName": "사당역"} for result in pooled_results)
+    assert per_business_stats["requests"] == pooled_stats["requests"] == BUSINESS_COUNT * 3
+    assert per_business_stats["handshakes"] == BUSINESS_COUNT
+    assert pooled_stats["handshakes"] == 1
+    assert pooled_ms < per_business_ms
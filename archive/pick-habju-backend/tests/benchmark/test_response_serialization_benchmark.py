@@ -0,0 +1,130 @@
+# tests/benchmark/test_response_serialization_benchmark.py
+"""
+예약 가능 여부 응답(ApiResponse[AvailabilityResponse]) 직렬화 벤치마크 (500개 룸)
+
+같은 응답을 세 가지 경로로 직렬화하여 비교합니다.
+- fastapi_default: 모델을 반환하고 response_model로 직렬화 (설치된 FastAPI 버전의 기본 경로)
+- dict_encoder: 모델 → dict → response_model 재검증 → jsonable_encoder → json.dumps
+  (requirements의 fastapi~=0.110 기본 경로와 같은 단계)
+- envelope: EnvelopeJSONResponse (pydantic-core to_json 한 번)
+
+실행: pytest -m benchmark tests/benchmark/test_response_serialization_benchmark.py -s
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.response import ApiResponse, EnvelopeJSONResponse
+from app.models.dto import AvailabilityResponse, BranchStats, RoomAvailability, RoomDetail
+
+ROOM_COUNT = 500
+HOUR_SLOTS = ["18:00", "19:00", "20:00", "21:00"]
+
+
+def _availability_response(room_count: int) -> AvailabilityResponse:
+    results = []
+    for i in range(room_count):
+        room = RoomDetail(
+            name=f"합주실 {i}번 룸", branch=f"지점 {i % 60}", business_id=str(100000 + i % 60), biz_item_id=str(i),
+            imageUrls=[f"https://images.example.com/rooms/{i}/{k}.jpg" for k in range(3)],
+            maxCapacity=10, recommendCapacity=6, baseCapacity=4, extraCharge=3000,
+            lat=37.5 + i * 1e-4, lng=126.9 + i * 1e-4,
+            pricePerHour=15000 + (i % 5) * 1000, canReserveOneHour=True, requiresCallOnSameDay=i % 7 == 0,
+        )
+        slots = {slot: (i + h) % 3 != 0 for h, slot in enumerate(HOUR_SLOTS)}
+        results.append(RoomAvailability(room_detail=room, available=all(slots.values()), available_slots=slots))
+
+    summary = {
+        room.room_detail.business_id: BranchStats(min_price=15000, available_count=3, lat=room.room_detail.lat, lng=room.room_detail.lng)
+        for room in results
+    }
+    return AvailabilityResponse(
+        date="2030-05-01", start_hour=HOUR_SLOTS[0], end_hour=HOUR_SLOTS[-1], hour_slots=HOUR_SLOTS,
+        available_biz_item_ids=[r.room_detail.biz_item_id for r in results if r.available is True],
+        results=results, branch_summary=summary,
+    )
+
+
+def _benchmark_app(result: AvailabilityResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=ApiResponse[AvailabilityResponse])
+    async def default():
+        return ApiResponse.success(result=result)
+
+    @app.get("/envelope", response_model=ApiResponse[AvailabilityResponse])
+    async def envelope():
+        return EnvelopeJSONResponse(ApiResponse[AvailabilityResponse].success(result=result))
+
+    return app
+
+
+async def _asgi_get(app: FastAPI, path: str) -> bytes:
+    """HTTP 서버 없이 ASGI 앱을 직접 호출하여 응답 본문을 반환"""
+    body = []
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "headers": [], "root_path": "", "scheme": "http", "server": ("bench", 80), "http_version": "1.1",
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+def _dict_encoder_render(envelope: ApiResponse) -> bytes:
+    field_type = ApiResponse[AvailabilityResponse]
+    validated = field_type.model_validate(envelope.model_dump(by_alias=True))
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def _best_ms(func, iterations: int, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter() - started) / iterations * 1000)
+    return best
+
+
+@pytest.mark.benchmark
+def test_envelope_serialization_500_rooms():
+    result = _availability_response(ROOM_COUNT)
+    envelope = ApiResponse[AvailabilityResponse].success(result=result)
+    app = _benchmark_app(result)
+    loop = asyncio.new_event_loop()
+    iterations = 30
+
+    try:
+        default_body = loop.run_until_complete(_asgi_get(app, "/default"))
+        envelope_body = loop.run_until_complete(_asgi_get(app, "/envelope"))
+
+        default_ms = _best_ms(lambda: loop.run_until_complete(_asgi_get(app, "/default")), iterations)
+        envelope_ms = _best_ms(lambda: loop.run_until_complete(_asgi_get(app, "/envelope")), iterations)
+    finally:
+        loop.close()
+
+    dict_encoder_body = _dict_encoder_render(envelope)
+    dict_encoder_ms = _best_ms(lambda: _dict_encoder_render(envelope), iterations)
+    render_ms = _best_ms(lambda: EnvelopeJSONResponse(envelope), iterations)
+
+    print(f"\nrooms={ROOM_COUNT} bytes={len(envelope_body)}")
+    print(f"  fastapi_default (asgi)  {default_ms:7.3f}ms")
+    print(f"  envelope        (asgi)  {envelope_ms:7.3f}ms")
+    print(f"  dict_encoder  (render)  {dict_encoder_ms:7.3f}ms")
+    print(f"  envelope      (render)  {render_ms:7.3f}ms  speedup={dict_encoder_ms / render_ms:5.1f}x")
+
+    assert envelope_body == default_body == dict_encoder_body
+    assert render_ms < dict_encoder_ms
@@ -2,9 +2,46 @@ import pytest
 from app.models.dto import RoomDetail, RoomAvailability, BranchStats, AvailabilityResponse
 from httpx import AsyncClient, ASGITransport
 from app.main import app
+from app.services.availability_cache import availability_cache
+from app.utils.upstream_limiter import upstream_limiters
+from app.utils.circuit_breaker import circuit_breakers
+from app.utils.request_coalescer import request_coalescer
+from app.services.availability_snapshot import availability_snapshots
+from app.services.availability_changes import availability_changes
 
 import pytest_asyncio
 
+@pytest.fixture(autouse=True)
+def clear_availability_cache():
+    """ 테스트 간 전역 예약 현황 캐시 / 업스트림 제한기 / 서킷 브레이커 / 요청 합치기 / 스냅샷 / 변경 구독 상태 공유 방지 """
+    availability_cache.clear()
+    upstream_limiters.clear()
+    circuit_breakers.clear()
+    request_coalescer.clear()
+    availability_snapshots.clear()
+    availability_changes.clear()
+    yield
+    availability_cache.clear()
+    upstream_limiters.clear()
+    circuit_breakers.clear()
+    request_coalescer.clear()
+    availability_snapshots.clear()
+    availability_changes.clear()
+
+class FakeClock:
+    """ 테스트에서 직접 시각을 옮기는 가짜 시계 (clock 인자로 주입, now를 바꿔 시간 경과 표현) """
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def fake_clock():
+    """ 0초에서 시작하는 FakeClock Fixture """
+    return FakeClock()
+
 @pytest_asyncio.fixture
 async def async_client():
     """ FastAPI 앱을 위한 AsyncClient Fixture """
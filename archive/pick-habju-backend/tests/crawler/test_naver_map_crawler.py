@@ -4,12 +4,19 @@ NaverMapCrawler 단위 테스트
 
 테스트 대상:
 - _merge_results: 중복 제거하며 결과 병합
+- 브라우저 풀: Chromium 1회 실행, 검색어별 격리 context, 동시 page 수 제한, 호스트별 속도 제한
+- 페이지 준비 감지: 고정 대기 없이 새 PlaceSummary 키가 나타나면 바로 추출, 나타나지 않으면 페이지네이션 중단
 
 실행: pytest tests/crawler/test_naver_map_crawler.py -v
 """
 
+import asyncio
+from unittest.mock import patch
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 import pytest
-from app.crawler.naver_map_crawler import NaverMapCrawler
+from app.crawler.naver_map_crawler import REGION_QUERIES, NaverMapCrawler
 
 
 class TestMergeResults:
@@ -98,11 +105,228 @@ class TestRegionList:
     
     def test_region_count(self, crawler):
         """서울 25개 구 + 광역시 10개 = 35개 지역"""
-        # crawl_all_regions 메서드 내부의 all_queries 확인
-        # (직접 접근이 어려우므로 코드 리뷰 차원에서만 확인)
-        # 현재 구현에서는 35개 지역이 정의됨
-        seoul_count = 25
-        major_cities_count = 10
-        expected_total = seoul_count + major_cities_count
-        
-        assert expected_total == 35
+        assert len(REGION_QUERIES) == 35
+        assert len(set(REGION_QUERIES)) == 35
+
+
+class FakeLocator:
+    def __init__(self, page, number):
+        self.page = page
+        self.number = number
+
+    async def is_visible(self):
+        return self.number <= self.page.browser.pages
+
+    async def click(self):
+        self.page.current = self.number
+
+
+class FakeHandle:
+    def __init__(self, value):
+        self.value = value
+
+    async def json_value(self):
+        return self.value
+
+
+class FakePage:
+    """browser.pages개의 결과 페이지가 있고, 페이지마다 PlaceSummary 키 목록이 다른 가짜 page"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.url = ""
+        self.current = 1
+
+    def _query(self):
+        return self.url.split("query=")[1].split("&")[0]
+
+    async def goto(self, url, wait_until=None):
+        self.url = url
+        self.browser.gotos.append(url)
+        self.browser.active += 1
+        self.browser.max_active = max(self.browser.max_active, self.browser.active)
+        await asyncio.sleep(0.01)
+        self.browser.active -= 1
+        if "실패" in url:
+            raise RuntimeError("navigation failed")
+
+    async def wait_for_function(self, expression, arg=None, timeout=None):
+        self.browser.waits.append(timeout)
+        keys = f"PlaceSummary:{self._query()}-{self.current}"
+        if self.current in self.browser.stale_pages or keys == arg:
+            raise PlaywrightTimeoutError("Timeout exceeded")
+        return FakeHandle(keys)
+
+    async def evaluate(self, script):
+        query = self._query()
+        places = [{"id": f"{query}-{page}", "name": query} for page in range(1, self.current + 1)]
+        return places + [{"id": "shared", "name": query}]
+
+    def get_by_role(self, role, name, exact):
+        return FakeLocator(self, int(name))
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def add_init_script(self, script):
+        pass
+
+    async def new_page(self):
+        return FakePage(self.browser)
+
+    async def close(self):
+        self.browser.closed_contexts += 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.pages = 1
+        self.stale_pages = set()
+        self.waits = []
+        self.gotos = []
+        self.active = 0
+        self.max_active = 0
+        self.contexts = 0
+        self.closed_contexts = 0
+        self.failing_contexts = set()
+        self.closed = False
+
+    async def new_context(self, **kwargs):
+        self.contexts += 1
+        if self.contexts in self.failing_contexts:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.launches = 0
+        self.browser = FakeBrowser()
+        self.chromium = self
+
+    async def launch(self, **kwargs):
+        self.launches += 1
+        return self.browser
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestBrowserPool:
+    """브라우저 풀 모드 테스트 (Playwright는 가짜 객체로 대체)"""
+
+    @pytest.fixture
+    def playwright(self):
+        fake = FakePlaywright()
+        with patch("app.crawler.naver_map_crawler.async_playwright", return_value=fake):
+            yield fake
+
+    @pytest.fixture
+    def crawler(self):
+        crawler = NaverMapCrawler(headless=True)
+        crawler.RATE_PER_SECOND = 0  # 속도 제한 없음
+        return crawler
+
+    @pytest.mark.asyncio
+    async def test_single_browser_bounded_parallel_pages(self, playwright, crawler):
+        queries = [f"지역{i} 합주실" for i in range(10)]
+
+        results = await crawler.search_many(queries, pool_size=3)
+
+        assert playwright.launches == 1
+        assert playwright.browser.closed
+        assert playwright.browser.contexts == playwright.browser.closed_contexts == 10
+        assert playwright.browser.max_active == 3
+        assert list(results) == queries
+        assert results["지역0 합주실"][0]["id"] == "지역0 합주실-1"
+
+    @pytest.mark.asyncio
+    async def test_failed_query_does_not_stop_other_workers(self, playwright, crawler):
+        results = await crawler.search_many(["실패 합주실", "홍대 합주실"], pool_size=2)
+
+        assert results["실패 합주실"] == []
+        assert len(results["홍대 합주실"]) == 2
+        assert playwright.browser.closed_contexts == 2
+
+    @pytest.mark.asyncio
+    async def test_context_creation_failure_does_not_stop_other_workers(self, playwright, crawler):
+        playwright.browser.failing_contexts = {1}
+        queries = [f"지역{i} 합주실" for i in range(4)]
+
+        results = await crawler.search_many(queries, pool_size=2)
+
+        assert list(results) == queries
+        assert sum(1 for items in results.values() if not items) == 1
+        assert sum(1 for items in results.values() if items) == 3
+        assert playwright.browser.closed_contexts == 3  # 생성되지 않은 context는 닫지 않음
+        assert playwright.browser.closed
+
+    @pytest.mark.asyncio
+    async def test_crawl_all_regions_deduplicates_in_region_order(self, playwright, crawler):
+        items = await crawler.crawl_all_regions(pool_size=4)
+
+        assert playwright.launches == 1
+        assert len(playwright.browser.gotos) == 35
+        assert items[0]["id"] == "강남구 합주실-1"
+        assert [item["id"] for item in items].count("shared") == 1
+        assert len(items) == 36
+
+    @pytest.mark.asyncio
+    async def test_navigation_is_rate_limited_per_host(self, playwright, crawler):
+        crawler.RATE_PER_SECOND = 50  # 버스트 1 → 두 번째 이동부터 20ms 간격
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await crawler.search_many([f"지역{i} 합주실" for i in range(5)], pool_size=5)
+
+        assert loop.time() - started >= 4 / 50 * 0.9
+
+
+class TestPageReadiness:
+    """검색 결과 준비 감지 테스트"""
+
+    @pytest.fixture
+    def playwright(self):
+        fake = FakePlaywright()
+        with patch("app.crawler.naver_map_crawler.async_playwright", return_value=fake):
+            yield fake
+
+    @pytest.fixture
+    def crawler(self):
+        crawler = NaverMapCrawler(headless=True)
+        crawler.RATE_PER_SECOND = 0
+        return crawler
+
+    @pytest.mark.asyncio
+    async def test_paginates_as_soon_as_new_places_appear(self, playwright, crawler):
+        playwright.browser.pages = 3
+
+        results = await crawler.search_rehearsal_rooms("홍대 합주실")
+
+        assert [item["id"] for item in results] == ["홍대 합주실-1", "shared", "홍대 합주실-2", "홍대 합주실-3"]
+        assert playwright.browser.waits == [crawler.PAGE_WAIT_MS] * 3
+
+    @pytest.mark.asyncio
+    async def test_stops_paginating_when_next_page_never_loads(self, playwright, crawler):
+        playwright.browser.pages = 3
+        playwright.browser.stale_pages = {2}
+
+        results = await crawler.search_rehearsal_rooms("홍대 합주실")
+
+        assert [item["id"] for item in results] == ["홍대 합주실-1", "shared"]
+
+    @pytest.mark.asyncio
+    async def test_first_page_timeout_still_extracts_current_state(self, playwright, crawler):
+        playwright.browser.stale_pages = {1}
+
+        results = await crawler.search_rehearsal_rooms("홍대 합주실")
+
+        assert [item["id"] for item in results] == ["홍대 합주실-1", "shared"]
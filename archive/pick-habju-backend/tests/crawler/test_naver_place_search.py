@@ -0,0 +1,103 @@
+# tests/crawler/test_naver_place_search.py
+"""
+NaverPlaceSearch (HTTP 지도 검색 backend) 단위 테스트
+
+테스트 대상:
+- 저장된 getPlacesList 응답 파싱: NaverMapCrawler와 같은 결과 형식, bookingBusinessId 우선
+- 페이지네이션: total / 페이지 결과 수 기준으로 종료
+- 요청 실패 시 그때까지 수집한 결과 반환
+- RoomCollectionService의 backend 선택
+
+실행: pytest tests/crawler/test_naver_place_search.py -v
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.crawler.naver_map_crawler import REGION_QUERIES
+from app.crawler.naver_place_search import NaverPlaceSearch
+from app.exception.api.client_loader_exception import RequestFailedError
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _payload(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def _response(data: dict) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+
+@pytest.fixture
+def search():
+    search = NaverPlaceSearch()
+    search.DISPLAY = 2
+    return search
+
+
+def test_parse_places_matches_browser_result_format():
+    places, total = NaverPlaceSearch.parse_places(_payload("naver_place_list_page1.json"))
+
+    assert total == 3
+    assert places[0] == {
+        "id": "1001", "name": "사당 합주실 A", "category": "연습실",
+        "address": "서울 동작구 사당동 1-1", "roadAddress": "서울 동작구 동작대로 1",
+        "x": "126.9812345", "y": "37.4765432",
+    }
+    # 예약 연동이 없는 장소는 place id 사용
+    assert places[1]["id"] == "1234567891"
+    assert NaverPlaceSearch.parse_places({"data": None}) == ([], 0)
+
+
+@pytest.mark.asyncio
+async def test_search_paginates_until_total(search):
+    pages = [_payload("naver_place_list_page1.json"), _payload("naver_place_list_page2.json")]
+    calls = []
+
+    async def fake_load_client(url, upstream=None, **kwargs):
+        calls.append((upstream, kwargs["json"]["variables"]["input"]["start"]))
+        return _response(pages[len(calls) - 1])
+
+    with patch("app.crawler.naver_place_search.load_client", side_effect=fake_load_client):
+        results = await search.search_rehearsal_rooms("사당 합주실")
+
+    assert calls == [("naver", 1), ("naver", 3)]
+    assert [r["id"] for r in results] == ["1001", "1234567891", "1003"]
+
+
+@pytest.mark.asyncio
+async def test_search_returns_partial_results_on_failure(search):
+    responses = [_response(_payload("naver_place_list_page1.json")), RequestFailedError("외부 API 호출에 실패했습니다.")]
+
+    with patch("app.crawler.naver_place_search.load_client", side_effect=responses):
+        results = await search.search_rehearsal_rooms("사당 합주실")
+
+    assert [r["id"] for r in results] == ["1001", "1234567891"]
+
+
+@pytest.mark.asyncio
+async def test_crawl_all_regions_deduplicates(search):
+    async def fake_load_client(url, upstream=None, **kwargs):
+        return _response(_payload("naver_place_list_page2.json"))
+
+    with patch("app.crawler.naver_place_search.load_client", side_effect=fake_load_client) as load:
+        results = await search.crawl_all_regions()
+
+    assert load.call_count == len(REGION_QUERIES)
+    assert [r["id"] for r in results] == ["1003"]
+
+
+def test_collection_service_selects_backend_by_config():
+    with patch('app.services.room_collection_service.NaverRoomFetcher'), \
+         patch('app.services.room_collection_service.RoomParserService'), \
+         patch('app.services.room_collection_service.get_supabase_client'):
+        from app.services.room_collection_service import RoomCollectionService
+        assert isinstance(RoomCollectionService(map_search_backend="http").map_crawler, NaverPlaceSearch)
+        with patch('app.services.room_collection_service.NaverMapCrawler') as browser:
+            assert RoomCollectionService(map_search_backend="browser").map_crawler is browser.return_value
@@ -0,0 +1,95 @@
+# tests/crawler/test_naver_room_fetcher.py
+"""
+NaverRoomFetcher 단위 테스트
+
+테스트 대상:
+- fetch_full_info: 지점 정보 / 룸 목록 동시 요청, 지하철 정보는 지점 좌표 확보 후 요청
+- 클라이언트 선택: 주입 클라이언트 > 전역 클라이언트 > 자체 연결 풀(HTTP/2), 자체 풀만 aclose로 종료
+
+실행: pytest tests/crawler/test_naver_room_fetcher.py -v
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.crawler.naver_room_fetcher import NaverRoomFetcher
+
+
+@pytest.mark.asyncio
+async def test_fetch_full_info_requests_independent_queries_concurrently():
+    fetcher = NaverRoomFetcher()
+    events = []
+
+    async def fetch_business(client, business_id):
+        events.append("business:start")
+        await asyncio.sleep(0.01)
+        events.append("business:end")
+        return {"businessId": business_id, "coordinates": {"latitude": 37.5, "longitude": 127.0}, "placeId": "p1"}
+
+    async def fetch_biz_items(client, business_id):
+        events.append("bizItems:start")
+        await asyncio.sleep(0.01)
+        events.append("bizItems:end")
+        return [{"bizItemId": "r1"}]
+
+    async def fetch_near_subway(client, lat, lng, place_id):
+        events.append("subway")
+        return {"name": "사당역"}
+
+    with patch.object(fetcher, "_fetch_business", side_effect=fetch_business), \
+         patch.object(fetcher, "_fetch_biz_items", side_effect=fetch_biz_items), \
+         patch.object(fetcher, "_fetch_near_subway", side_effect=fetch_near_subway):
+        result = await fetcher.fetch_full_info("1001")
+
+    assert events[:2] == ["business:start", "bizItems:start"]
+    assert events[-1] == "subway"
+    assert result["rooms"] == [{"bizItemId": "r1"}]
+    assert result["subway"] == {"name": "사당역"}
+
+
+def _graphql_transport(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        operation = request.content
+        requests.append(operation)
+        if b'"business"' in operation:
+            return httpx.Response(200, json={"data": {"business": {"businessId": "1001", "coordinates": None}}})
+        return httpx.Response(200, json={"data": {"bizItems": [{"bizItemId": "r1"}]}})
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_reused_and_not_closed():
+    requests = []
+    client = httpx.AsyncClient(transport=_graphql_transport(requests))
+    fetcher = NaverRoomFetcher(client=client)
+
+    for _ in range(3):
+        result = await fetcher.fetch_full_info("1001")
+        assert result["rooms"] == [{"bizItemId": "r1"}]
+    await fetcher.aclose()
+
+    assert len(requests) == 6  # 지점 3회 x (business + bizItems), 좌표 없음 → 지하철 요청 없음
+    assert not client.is_closed
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_uses_global_client_then_own_http2_pool():
+    shared = httpx.AsyncClient()
+    fetcher = NaverRoomFetcher()
+
+    with patch("app.crawler.naver_room_fetcher.get_global_client", return_value=shared):
+        assert fetcher._get_client() is shared
+    await fetcher.aclose()
+    assert not shared.is_closed
+    await shared.aclose()
+
+    with patch("app.crawler.naver_room_fetcher.get_global_client", return_value=None):
+        own = fetcher._get_client()
+        assert fetcher._get_client() is own
+    assert own._transport._pool._http2
+    await fetcher.aclose()
+    assert own.is_closed
@@ -4,6 +4,7 @@ RoomCollectionService 통합 테스트
 
 테스트 대상:
 - collect_by_id: Fetch → Parse → Save 전체 흐름
+- collect_by_query: 검색 결과를 파이프라인으로 수집, 성공 / 실패 집계
 
 실행: pytest tests/integration/test_room_collection_flow.py -v
 """
@@ -165,7 +166,7 @@ class TestCollectByIdFlow:
 
 
 class TestCollectByQueryFlow:
-    """collect_by_query 통합 테스트"""
+    """collect_by_query 통합 테스트 (discover → fetch → parse → persist 파이프라인)"""
     
     @pytest.fixture
     def mock_crawler(self):
@@ -176,9 +177,22 @@ class TestCollectByQueryFlow:
             {"id": "biz2", "name": "합주실B"}
         ])
         return mock
+
+    @pytest.fixture
+    def mock_fetcher(self):
+        """business_id마다 룸 1개를 반환하는 NaverRoomFetcher Mock"""
+        async def fetch_full_info(business_id):
+            return {
+                "business": {"businessId": business_id, "businessDisplayName": business_id},
+                "rooms": [{"bizItemId": f"{business_id}-room", "name": "A룸", "desc": "최대 6인"}],
+            }
+
+        mock = MagicMock()
+        mock.fetch_full_info = AsyncMock(side_effect=fetch_full_info)
+        return mock
     
     @pytest.fixture
-    def service(self, mock_crawler):
+    def service(self, mock_crawler, mock_fetcher):
         """통합 테스트용 서비스 인스턴스"""
         with patch('app.services.room_collection_service.NaverMapCrawler', return_value=mock_crawler), \
              patch('app.services.room_collection_service.NaverRoomFetcher'), \
@@ -187,38 +201,44 @@ class TestCollectByQueryFlow:
             from app.services.room_collection_service import RoomCollectionService
             svc = RoomCollectionService()
             svc.map_crawler = mock_crawler
-            # collect_by_id를 Mock으로 대체
-            svc.collect_by_id = AsyncMock()
+            svc.room_fetcher = mock_fetcher
+            svc.parser_service.parse_room_desc_batch = AsyncMock(return_value={})
+            svc.supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
             return svc
     
     # ============== IT05: Query 검색 후 각 ID 수집 ==============
     @pytest.mark.asyncio
-    async def test_collect_by_query_calls_collect_by_id(self, service, mock_crawler):
-        """검색 결과 각 ID에 대해 collect_by_id 호출"""
+    async def test_collect_by_query_collects_each_business(self, service, mock_crawler, mock_fetcher):
+        """검색 결과 각 ID를 파이프라인으로 수집"""
         result = await service.collect_by_query("홍대 합주실")
         
         # Crawler가 검색 호출됨
         mock_crawler.search_rehearsal_rooms.assert_called_once_with("홍대 합주실")
         
-        # 각 결과에 대해 collect_by_id 호출됨
-        assert service.collect_by_id.call_count == 2
-        service.collect_by_id.assert_any_call("biz1")
-        service.collect_by_id.assert_any_call("biz2")
+        # 각 결과에 대해 fetch → parse → save
+        assert mock_fetcher.fetch_full_info.call_count == 2
+        mock_fetcher.fetch_full_info.assert_any_call("biz1")
+        mock_fetcher.fetch_full_info.assert_any_call("biz2")
+        assert service.parser_service.parse_room_desc_batch.call_count == 2
         
         # 성공 카운트 확인
         assert result["success"] == 2
         assert result["failed"] == 0
+        assert result["discovered"] == 2
     
     # ============== IT06: 일부 실패 시 카운트 ==============
     @pytest.mark.asyncio
-    async def test_collect_by_query_partial_failure(self, service, mock_crawler):
+    async def test_collect_by_query_partial_failure(self, service, mock_fetcher):
         """일부 수집 실패 시 카운트 검증"""
-        # biz2 수집 시 예외 발생
+        # biz2 수집 시 데이터 없음
+        fetch = mock_fetcher.fetch_full_info.side_effect
+
         async def side_effect(bid):
             if bid == "biz2":
-                raise Exception("수집 실패")
+                return None
+            return await fetch(bid)
         
-        service.collect_by_id.side_effect = side_effect
+        mock_fetcher.fetch_full_info.side_effect = side_effect
         
         result = await service.collect_by_query("홍대 합주실")
         
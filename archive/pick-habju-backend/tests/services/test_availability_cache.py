@@ -0,0 +1,170 @@
+# tests/services/test_availability_cache.py
+"""
+AvailabilityCache 단위 테스트
+
+테스트 대상:
+- TTL 내 재요청 시 캐시 히트 (업스트림 호출 없음)
+- TTL 만료 후 재조회
+- 동시 캐시 미스 병합 (Single-flight)
+- 에러 결과 미캐싱
+- 하루 전체 결과에서 요청 시간대 추출
+
+실행: pytest tests/services/test_availability_cache.py -v
+"""
+
+import asyncio
+import pytest
+from typing import List
+
+from app.crawler.base import BaseCrawler, RoomResult, FULL_DAY_SLOTS
+from app.models.dto import RoomAvailability, RoomDetail
+from app.services.availability_cache import AvailabilityCache
+
+
+class CountingCrawler(BaseCrawler):
+    """호출 횟수를 기록하고 18시만 예약 불가로 응답하는 Mock 크롤러"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls: List[List[str]] = []
+        self.delay = delay
+        self.fail = fail
+
+    async def check_availability(self, date: str, hour_slots: List[str], target_rooms: List[RoomDetail]) -> List[RoomResult]:
+        self.calls.append([room.biz_item_id for room in target_rooms])
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            return [RuntimeError("upstream down") for _ in target_rooms]
+        return [
+            RoomAvailability(
+                room_detail=room,
+                available=False,
+                available_slots={slot: slot != "18:00" for slot in hour_slots},
+            )
+            for room in target_rooms
+        ]
+
+
+@pytest.fixture
+def rooms(mock_room_detail_factory):
+    return [
+        mock_room_detail_factory(name="A룸", biz_item_id="1"),
+        mock_room_detail_factory(name="B룸", biz_item_id="2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_within_ttl(rooms):
+    """TTL 내 같은 날짜 요청은 다른 시간대여도 업스트림을 다시 호출하지 않음"""
+    crawler = CountingCrawler()
+    cache = AvailabilityCache(ttl_seconds=30)
+
+    first = await cache.check_availability("naver", crawler, "2026-05-01", ["19:00", "20:00"], rooms)
+    second = await cache.check_availability("naver", crawler, "2026-05-01", ["17:00", "18:00"], rooms)
+
+    assert len(crawler.calls) == 1
+    assert first[0].available is True
+    assert first[0].available_slots == {"19:00": True, "20:00": True}
+    assert second[0].available is False
+    assert second[0].available_slots == {"17:00": True, "18:00": False}
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_after_ttl(rooms, fake_clock):
+    """TTL이 지나면 업스트림을 다시 호출"""
+    crawler = CountingCrawler()
+    cache = AvailabilityCache(ttl_seconds=30, clock=fake_clock)
+
+    await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+    fake_clock.now = 31
+    await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+
+    assert len(crawler.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_are_bounded_by_max_entries(mock_room_detail_factory, fake_clock):
+    """TTL 안에 서로 다른 키가 몰려도 max_entries를 넘지 않고 오래된 엔트리부터 제거"""
+    crawler = CountingCrawler()
+    cache = AvailabilityCache(ttl_seconds=30, max_entries=3, clock=fake_clock)
+    many_rooms = [mock_room_detail_factory(name=f"룸{i}", biz_item_id=str(i)) for i in range(5)]
+
+    for room in many_rooms:
+        await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], [room])
+
+    assert [key[2] for key in cache._entries] == ["2", "3", "4"]
+
+    await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], [many_rooms[4]])
+    assert len(crawler.calls) == 5  # 남아 있는 최근 엔트리는 그대로 캐시 히트
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_merged(rooms):
+    """같은 키에 대한 동시 요청은 하나의 업스트림 호출로 병합"""
+    crawler = CountingCrawler(delay=0.05)
+    cache = AvailabilityCache(ttl_seconds=30)
+
+    results = await asyncio.gather(*[
+        cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+        for _ in range(10)
+    ])
+
+    assert len(crawler.calls) == 1
+    assert all(len(r) == 2 and r[0].available is True for r in results)
+
+
+@pytest.mark.asyncio
+async def test_partial_hit_fetches_only_missing_rooms(rooms, mock_room_detail_factory):
+    """캐시에 없는 룸만 업스트림에 요청"""
+    crawler = CountingCrawler()
+    cache = AvailabilityCache(ttl_seconds=30)
+
+    await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms[:1])
+    new_room = mock_room_detail_factory(name="C룸", biz_item_id="3")
+    results = await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms + [new_room])
+
+    assert crawler.calls == [["1"], ["2", "3"]]
+    assert [r.room_detail.biz_item_id for r in results] == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(rooms):
+    """에러 결과는 캐싱하지 않고 다음 요청에서 재시도"""
+    crawler = CountingCrawler(fail=True)
+    cache = AvailabilityCache(ttl_seconds=30)
+
+    first = await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+    crawler.fail = False
+    second = await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+
+    assert all(isinstance(r, Exception) for r in first)
+    assert all(isinstance(r, RoomAvailability) for r in second)
+    assert len(crawler.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_upstream_called_with_full_day_slots(rooms):
+    """업스트림에는 항상 하루 전체 슬롯을 요청"""
+    seen = {}
+
+    class SlotRecorder(CountingCrawler):
+        async def check_availability(self, date, hour_slots, target_rooms):
+            seen["slots"] = hour_slots
+            return await super().check_availability(date, hour_slots, target_rooms)
+
+    cache = AvailabilityCache(ttl_seconds=30)
+    await cache.check_availability("naver", SlotRecorder(), "2026-05-01", ["19:00"], rooms)
+
+    assert seen["slots"] == FULL_DAY_SLOTS
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_bypasses(rooms):
+    """TTL이 0이면 매번 크롤러를 직접 호출"""
+    crawler = CountingCrawler()
+    cache = AvailabilityCache(ttl_seconds=0)
+
+    await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+    await cache.check_availability("naver", crawler, "2026-05-01", ["19:00"], rooms)
+
+    assert len(crawler.calls) == 2
@@ -0,0 +1,166 @@
+# tests/services/test_availability_changes.py
+"""
+예약 현황 변경 감지 / 변경분 구독(SSE) 테스트
+
+테스트 대상:
+- 직전 하루 일정 대비 새로 예약 / 비워짐 / 조회 불가로 바뀐 슬롯 계산
+- 스냅샷 저장소 put 시 변경분 발행 (처음 보는 룸, 변경 없음은 발행하지 않음)
+- 스냅샷 스케줄러 없이 실시간 조회(예약 현황 캐시)만으로 변경분 발행
+- 날짜 + 지도 영역 기준 구독 필터링, 큐가 넘치면 resync 요청
+- SSE 직렬화와 연결 종료 시 구독 해제
+
+실행: pytest tests/services/test_availability_changes.py -v
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.available_room import _encode_sse
+from app.crawler.base import BaseCrawler
+from app.models.dto import DaySchedule
+from app.services.availability_changes import RESYNC, AvailabilityChangeFeed, diff_day_schedules
+from app.services.availability_cache import AvailabilityCache
+from app.services.availability_service import AvailabilityService
+from app.services.availability_snapshot import AvailabilitySnapshotStore
+
+DATE = "2030-05-01"
+
+
+def _schedule(room, available_hours, unknown_hours=()):
+    hourly = ["unknown" if h in unknown_hours else h in available_hours for h in range(24)]
+    return DaySchedule(room_detail=room, date=DATE, hourly=hourly)
+
+
+@pytest.fixture
+def room(mock_room_detail_factory):
+    return mock_room_detail_factory(business_id="1001", biz_item_id="a1", lat=37.55, lng=126.92)
+
+
+def test_diff_reports_only_changed_slots(room):
+    previous = _schedule(room, available_hours={18, 19, 20})
+    current = _schedule(room, available_hours={19, 20, 22}, unknown_hours={23})
+
+    delta = diff_day_schedules(previous, current, checked_at="2030-05-01T10:00:00+09:00")
+
+    assert delta.booked == ["18:00"]
+    assert delta.freed == ["22:00"]
+    assert delta.unknown == ["23:00"]
+    assert (delta.business_id, delta.biz_item_id, delta.date) == ("1001", "a1", DATE)
+    assert diff_day_schedules(previous, _schedule(room, available_hours={18, 19, 20})) is None
+
+
+def test_store_publishes_delta_only_when_schedule_changes(room):
+    feed = AvailabilityChangeFeed()
+    store = AvailabilitySnapshotStore(feed=feed)
+    subscription = feed.subscribe(DATE, 37.5, 126.9, 37.6, 127.0)
+
+    store.put("naver", _schedule(room, available_hours={18}))  # 처음 → 비교 대상 없음
+    store.put("naver", _schedule(room, available_hours={18}))  # 변경 없음
+    store.put("naver", _schedule(room, available_hours=set()))
+
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait().booked == ["18:00"]
+    assert feed.snapshot() == {"subscribers": 1, "published": 1}
+
+
+class ChangingCrawler(BaseCrawler):
+    """조회할 때마다 미리 정한 예약 가능 시간대를 차례로 돌려주는 가짜 크롤러"""
+
+    def __init__(self, *available_hours):
+        self.available_hours = list(available_hours)
+
+    async def check_availability(self, date, hour_slots, rooms):
+        raise AssertionError("하루 일정 조회만 사용")
+
+    async def fetch_day_schedules(self, date, rooms):
+        hours = self.available_hours.pop(0)
+        return [_schedule(room, available_hours=hours) for room in rooms]
+
+
+@pytest.mark.asyncio
+async def test_live_fetches_publish_delta_without_snapshot_scheduler(room):
+    now = [0.0]
+    feed = AvailabilityChangeFeed()
+    crawler = ChangingCrawler({18, 19}, {18, 19}, {19})
+    cache = AvailabilityCache(ttl_seconds=30, clock=lambda: now[0], feed=feed)
+    service = AvailabilityService({"naver": crawler}, cache=cache)
+    subscription = feed.subscribe(DATE, 37.5, 126.9, 37.6, 127.0)
+
+    await service._run_crawler("naver", crawler, DATE, ["18:00"], [room])  # 처음 → 비교 대상 없음
+    now[0] += 31
+    await service._run_crawler("naver", crawler, DATE, ["18:00"], [room])  # 변경 없음
+    assert subscription.queue.empty()
+
+    now[0] += 31
+    result = await service._run_crawler("naver", crawler, DATE, ["18:00"], [room])
+
+    assert result[0].available is False
+    delta = subscription.queue.get_nowait()
+    assert (delta.biz_item_id, delta.booked, delta.freed) == ("a1", ["18:00"], [])
+    assert delta.checked_at is not None
+
+
+def test_feed_filters_by_date_and_viewport(room, mock_room_detail_factory):
+    feed = AvailabilityChangeFeed()
+    inside = feed.subscribe(DATE, 37.5, 126.9, 37.6, 127.0)
+    other_area = feed.subscribe(DATE, 35.0, 129.0, 35.2, 129.2)
+    other_date = feed.subscribe("2030-05-02", 37.5, 126.9, 37.6, 127.0)
+
+    delta = diff_day_schedules(_schedule(room, {18}), _schedule(room, set()))
+    feed.publish(delta, room)
+
+    assert inside.queue.qsize() == 1
+    assert other_area.queue.empty()
+    assert other_date.queue.empty()
+
+    # 좌표 없는 룸은 어떤 영역에도 포함되지 않음
+    feed.publish(delta, mock_room_detail_factory(lat=None, lng=None))
+    assert inside.queue.qsize() == 1
+
+
+def test_overflowing_subscription_requests_resync(room):
+    feed = AvailabilityChangeFeed(max_queue=2)
+    subscription = feed.subscribe(DATE, 37.5, 126.9, 37.6, 127.0)
+    delta = diff_day_schedules(_schedule(room, {18}), _schedule(room, set()))
+
+    for _ in range(3):
+        feed.publish(delta, room)
+
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait() == RESYNC
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_sends_deltas_keepalives_and_unsubscribes(room):
+    feed = AvailabilityChangeFeed()
+    subscription = feed.subscribe(DATE, 37.5, 126.9, 37.6, 127.0)
+    stream = _encode_sse(feed, subscription, keepalive_seconds=0.01)
+
+    assert await stream.__anext__() == b": subscribed\n\n"
+    assert await stream.__anext__() == b": keepalive\n\n"
+
+    feed.publish(diff_day_schedules(_schedule(room, {18}), _schedule(room, {18, 19})), room)
+    event = (await stream.__anext__()).decode()
+    assert event.startswith("event: delta\ndata: ")
+    assert json.loads(event.split("data: ", 1)[1]) == {
+        "date": DATE, "business_id": "1001", "biz_item_id": "a1",
+        "booked": [], "freed": ["19:00"], "unknown": [], "checked_at": None,
+    }
+
+    await stream.aclose()
+    assert feed.snapshot()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_changes_endpoint_validation_error_before_streaming(async_client):
+    params = {
+        "date": (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d"),
+        "swLat": 37.6, "swLng": 126.9, "neLat": 37.5, "neLng": 127.0,
+    }
+
+    response = await async_client.get("/api/rooms/availability/changes", params=params)
+
+    assert response.status_code == 400
+    assert response.json()["isSuccess"] is False
@@ -0,0 +1,82 @@
+# tests/services/test_availability_deadline.py
+"""
+AvailabilityService 크롤러별 응답 대기 한도(deadline) 테스트
+
+실행: pytest tests/services/test_availability_deadline.py -v
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from app.crawler.base import BaseCrawler, RoomResult
+from app.models.dto import AvailabilityRequest, RoomAvailability, RoomDetail
+from app.services.availability_cache import AvailabilityCache
+from app.services.availability_service import AvailabilityService
+
+
+class SleepyCrawler(BaseCrawler):
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def check_availability(self, date: str, hour_slots: List[str], rooms: List[RoomDetail]) -> List[RoomResult]:
+        await asyncio.sleep(self.delay)
+        return [
+            RoomAvailability(room_detail=room, available=True, available_slots={s: True for s in hour_slots})
+            for room in rooms
+        ]
+
+
+@pytest.fixture
+def request_dto():
+    return AvailabilityRequest(
+        date=(datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"),
+        capacity=2, start_hour="18:00", end_hour="19:00",
+        swLat=37.0, swLng=126.0, neLat=38.0, neLng=128.0,
+    )
+
+
+@pytest.fixture
+def rooms(mock_room_detail_factory):
+    return [
+        mock_room_detail_factory(name="네이버", business_id="1001", biz_item_id="n1"),
+        mock_room_detail_factory(name="그루브", business_id="sadang", biz_item_id="g1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_crawler_returns_unknown_within_deadline(rooms, request_dto):
+    service = AvailabilityService(
+        {"naver": SleepyCrawler(0), "groove": SleepyCrawler(5)}, deadline_seconds=0.1
+    )
+
+    with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+        started = time.monotonic()
+        response = await service.check_availability(request_dto)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 1
+    assert response.available_biz_item_ids == ["n1"]
+
+    groove_result = await service._run_crawler("groove", SleepyCrawler(5), request_dto.date, ["18:00"], [rooms[1]])
+    assert groove_result[0].available == "unknown"
+    assert groove_result[0].available_slots == {"18:00": "unknown"}
+
+
+@pytest.mark.asyncio
+async def test_late_result_is_cached_for_next_request(rooms, request_dto):
+    """deadline을 넘긴 캐시 조회는 백그라운드에서 완료되어 다음 요청에 재사용됨"""
+    crawler = SleepyCrawler(0.15)
+    service = AvailabilityService({"groove": crawler}, cache=AvailabilityCache(ttl_seconds=60), deadline_seconds=0.05)
+    groove_rooms = [rooms[1]]
+
+    first = await service._run_crawler("groove", crawler, request_dto.date, ["18:00"], groove_rooms)
+    assert first[0].available == "unknown"
+
+    await asyncio.sleep(0.2)
+    second = await service._run_crawler("groove", crawler, request_dto.date, ["18:00"], groove_rooms)
+    assert second[0].available is True
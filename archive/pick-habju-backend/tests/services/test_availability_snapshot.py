@@ -0,0 +1,249 @@
+# tests/services/test_availability_snapshot.py
+"""
+예약 현황 스냅샷 (AvailabilitySnapshotStore / SnapshotScheduler / snapshot 모드 / recheck) 테스트
+
+테스트 대상:
+- 스케줄러: 앞으로 N일 사전 조회, 가까운 날짜 / 조회가 많은 지점일수록 자주 갱신
+- 스케줄러: live 조회와 같은 크롤러 서킷 브레이커 적용, 파일 잠금으로 워커 하나에서만 실행
+- 저장소: 오래된 스냅샷은 사용하지 않음, 지난 날짜 정리
+- 서비스 snapshot 모드: 스냅샷이 있는 룸은 업스트림 호출 없이 checked_at과 함께 응답, 없는 룸만 실시간 조회
+- recheck 엔드포인트: 캐시/스냅샷 없이 재조회 후 스냅샷 갱신
+
+실행: pytest tests/services/test_availability_snapshot.py -v
+"""
+
+from datetime import date, datetime, timedelta
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from app.api.dependencies import get_availability_service
+from app.crawler.base import BaseCrawler, DayResult, RoomResult, slice_day_results
+from app.main import app
+from app.models.dto import AvailabilityRequest, DaySchedule, RoomDetail
+from app.services.availability_service import AvailabilityService
+from app.services.availability_snapshot import AvailabilitySnapshotStore, SnapshotScheduler
+from app.utils.circuit_breaker import OPEN, CircuitBreaker, CircuitBreakerRegistry
+from tests.conftest import FakeClock
+
+TODAY = date(2030, 5, 1)
+
+
+@pytest.fixture
+def fake_clock():
+    """스냅샷 저장소는 벽시계(time.time) 기준이므로 0이 아닌 시각에서 시작"""
+    return FakeClock(now=1_000_000.0)
+
+
+class RecordingCrawler(BaseCrawler):
+    """18시만 예약 가능한 하루 일정을 반환하고 호출 내역을 기록하는 가짜 크롤러"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def check_availability(self, date: str, hour_slots: List[str], rooms: List[RoomDetail]) -> List[RoomResult]:
+        return slice_day_results(await self.fetch_day_schedules(date, rooms), hour_slots)
+
+    async def fetch_day_schedules(self, date: str, rooms: List[RoomDetail]) -> List[DayResult]:
+        self.calls.append((date, [room.biz_item_id for room in rooms]))
+        return [DaySchedule(room_detail=room, date=date, hourly=[h == 18 for h in range(24)]) for room in rooms]
+
+
+@pytest.fixture
+def rooms(mock_room_detail_factory):
+    return [
+        mock_room_detail_factory(name="네이버A", business_id="1001", biz_item_id="a1"),
+        mock_room_detail_factory(name="네이버B", business_id="1002", biz_item_id="b1"),
+        mock_room_detail_factory(name="그루브", business_id="sadang", biz_item_id="g1"),
+    ]
+
+
+def _make_scheduler(rooms, clock, store=None, days=3):
+    crawlers = {"naver": RecordingCrawler(), "groove": RecordingCrawler()}
+    store = store or AvailabilitySnapshotStore(clock=clock)
+    scheduler = SnapshotScheduler(
+        crawlers, store, room_loader=lambda: rooms, days=days,
+        base_interval=100, min_interval=10, distance_days=1, clock=clock, today=lambda: TODAY,
+    )
+    return scheduler, crawlers, store
+
+
+@pytest.mark.asyncio
+async def test_scheduler_prefetches_next_days_then_refreshes_near_dates_first(rooms, fake_clock):
+    scheduler, crawlers, store = _make_scheduler(rooms, fake_clock)
+
+    assert await scheduler.refresh_due() == 9  # 3일 x 3개 룸
+    assert [d for d, _ in crawlers["naver"].calls] == ["2030-05-01", "2030-05-02", "2030-05-03"]
+    assert crawlers["naver"].calls[0][1] == ["a1", "b1"]
+    assert crawlers["groove"].calls[0][1] == ["g1"]
+
+    # 주기 전에는 갱신하지 않음
+    fake_clock.now += 50
+    assert await scheduler.refresh_due() == 0
+
+    # 오늘(주기 100초)만 갱신, 내일(200초) / 모레(300초)는 아직
+    fake_clock.now += 60
+    assert await scheduler.refresh_due() == 3
+    assert crawlers["naver"].calls[-1][0] == "2030-05-01"
+
+    fake_clock.now += 100
+    assert await scheduler.refresh_due() == 6  # 오늘 + 내일
+
+
+class FailingDayCrawler(RecordingCrawler):
+    async def fetch_day_schedules(self, date: str, rooms: List[RoomDetail]) -> List[DayResult]:
+        self.calls.append((date, [room.biz_item_id for room in rooms]))
+        return [RuntimeError("site down") for _ in rooms]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_respects_crawler_circuit_breaker(rooms, fake_clock):
+    crawler = FailingDayCrawler()
+    registry = CircuitBreakerRegistry(lambda name: CircuitBreaker(name, failure_threshold=2, recovery_seconds=3600))
+    guard = AvailabilityService({"naver": crawler}, breakers=registry)
+    scheduler = SnapshotScheduler(
+        {"naver": crawler}, AvailabilitySnapshotStore(clock=fake_clock), room_loader=lambda: rooms[:1], days=1,
+        base_interval=100, min_interval=10, clock=fake_clock, today=lambda: TODAY,
+        fetch=guard.refresh_day_schedules, lock_path=None,
+    )
+
+    for _ in range(4):
+        assert await scheduler.refresh_due() == 0
+        fake_clock.now += 101
+
+    # 연속 2회 실패로 서킷이 열린 뒤에는 갱신 주기가 돌아와도 업스트림을 호출하지 않음
+    assert len(crawler.calls) == 2
+    assert registry.for_crawler("naver").state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_only_one_scheduler_runs_per_lock_file(tmp_path):
+    lock_path = str(tmp_path / "snapshot.lock")
+
+    def make():
+        return SnapshotScheduler({}, AvailabilitySnapshotStore(), room_loader=lambda: [], days=1, lock_path=lock_path)
+
+    first, second = make(), make()
+    assert first.start() is True
+    assert second.start() is False
+
+    await first.stop()
+    assert second.start() is True
+    await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_popular_branch_refreshes_more_often(rooms, fake_clock):
+    scheduler, crawlers, store = _make_scheduler(rooms, fake_clock, days=1)
+    await scheduler.refresh_due()
+
+    for _ in range(4):
+        store.record_demand("2030-05-01", rooms[:1])
+
+    assert scheduler.refresh_interval("2030-05-01", "1001") == pytest.approx(20)
+    assert scheduler.refresh_interval("2030-05-01", "1002") == 100
+
+    fake_clock.now += 25
+    assert await scheduler.refresh_due() == 1
+    assert crawlers["naver"].calls[-1] == ("2030-05-01", ["a1"])
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_snapshot(rooms, fake_clock):
+    scheduler, crawlers, store = _make_scheduler(rooms, fake_clock, days=1)
+    await scheduler.refresh_due()
+
+    async def failing(date, rooms):
+        return [RuntimeError("upstream down") for _ in rooms]
+
+    crawlers["naver"].fetch_day_schedules = failing
+    fake_clock.now += 100
+    await scheduler.refresh_due()
+
+    fetched_at, schedule = store.lookup("naver", "2030-05-01", rooms[:1])[0]
+    assert fetched_at == 1_000_000.0
+    assert schedule.hourly[18] is True
+
+
+def test_store_ignores_stale_entries_and_prunes_past_dates(rooms, fake_clock):
+    store = AvailabilitySnapshotStore(max_age_seconds=60, clock=fake_clock)
+    store.put("naver", DaySchedule(room_detail=rooms[0], date="2030-05-01", hourly=[True] * 24))
+    store.put("naver", DaySchedule(room_detail=rooms[0], date="2030-04-30", hourly=[True] * 24))
+
+    assert store.lookup("naver", "2030-05-01", rooms[:1])[0] is not None
+    fake_clock.now += 61
+    assert store.lookup("naver", "2030-05-01", rooms[:1]) == [None]
+
+    store.prune("2030-05-01")
+    assert store.snapshot()["dates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_mode_reads_store_and_fetches_only_missing_rooms(rooms):
+    request_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+    store = AvailabilitySnapshotStore()
+    store.put("naver", DaySchedule(room_detail=rooms[0], date=request_date, hourly=[True] * 24), fetched_at=1_900_000_000)
+    crawlers = {"naver": RecordingCrawler(), "groove": RecordingCrawler()}
+    service = AvailabilityService(crawlers, snapshots=store)
+
+    request = AvailabilityRequest(
+        date=request_date, capacity=2, start_hour="18:00", end_hour="19:00",
+        swLat=37.0, swLng=126.0, neLat=38.0, neLng=128.0, mode="snapshot",
+    )
+    with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+        response = await service.check_availability(request)
+
+    # 스냅샷이 있는 a1은 업스트림 호출 없음
+    assert crawlers["naver"].calls == [(request_date, ["b1"])]
+    assert response.available_biz_item_ids == ["a1"]
+    assert response.results[0].checked_at == datetime.fromtimestamp(1_900_000_000).astimezone().isoformat(timespec="seconds")
+
+    # 조회 수요 기록 (스케줄러 갱신 주기 조절용)
+    assert store.demand(request_date, "1001") > 0
+
+
+@pytest.mark.asyncio
+async def test_live_mode_ignores_snapshots(rooms):
+    request_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+    store = AvailabilitySnapshotStore()
+    store.put("naver", DaySchedule(room_detail=rooms[0], date=request_date, hourly=[True] * 24))
+    crawlers = {"naver": RecordingCrawler(), "groove": RecordingCrawler()}
+    service = AvailabilityService(crawlers, snapshots=store)
+
+    request = AvailabilityRequest(
+        date=request_date, capacity=2, start_hour="18:00", end_hour="19:00",
+        swLat=37.0, swLng=126.0, neLat=38.0, neLng=128.0,
+    )
+    with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+        response = await service.check_availability(request)
+
+    assert crawlers["naver"].calls == [(request_date, ["a1", "b1"])]
+    assert response.available_biz_item_ids == []
+    assert all(r.checked_at is None for r in response.results)
+
+
+@pytest.mark.asyncio
+async def test_recheck_endpoint_fetches_live_and_updates_snapshot(async_client, rooms):
+    request_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+    store = AvailabilitySnapshotStore()
+    crawlers = {"naver": RecordingCrawler(), "groove": RecordingCrawler()}
+    app.dependency_overrides[get_availability_service] = lambda: AvailabilityService(crawlers, snapshots=store)
+    params = {"date": request_date, "start_hour": "18:00", "end_hour": "18:00", "business_id": "sadang", "biz_item_id": "g1"}
+    try:
+        with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+            response = await async_client.get("/api/rooms/availability/recheck", params=params)
+            missing = await async_client.get(
+                "/api/rooms/availability/recheck", params={**params, "biz_item_id": "nope"}
+            )
+    finally:
+        del app.dependency_overrides[get_availability_service]
+
+    assert response.status_code == 200
+    body = response.json()["result"]
+    assert body["available"] is True
+    assert body["checked_at"] is not None
+    assert crawlers["groove"].calls == [(request_date, ["g1"])]
+    assert store.lookup("groove", request_date, [rooms[2]])[0] is not None
+
+    assert missing.status_code == 404
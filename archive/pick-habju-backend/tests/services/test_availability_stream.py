@@ -0,0 +1,137 @@
+# tests/services/test_availability_stream.py
+"""
+AvailabilityService.stream_availability / 스트리밍 엔드포인트 테스트
+
+테스트 대상:
+- 빠른 크롤러의 결과가 느린 크롤러를 기다리지 않고 먼저 전송됨
+- branch_summary 프레임은 변경된 지점만 담은 delta, 마지막 summary 프레임은 전체 집계
+- NDJSON 응답 형식 및 스트리밍 시작 전 검증 에러 처리
+
+실행: pytest tests/services/test_availability_stream.py -v
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from app.api.dependencies import get_availability_service
+from app.crawler.base import BaseCrawler, RoomResult
+from app.main import app
+from app.models.dto import AvailabilityRequest, RoomAvailability, RoomDetail
+from app.services.availability_service import AvailabilityService
+
+
+class GatedCrawler(BaseCrawler):
+    """gate가 열릴 때까지 응답을 미루는 가짜 크롤러 (모든 룸 예약 가능)"""
+
+    def __init__(self, gate: asyncio.Event = None, fail_ids=()):
+        self.gate = gate
+        self.fail_ids = set(fail_ids)
+
+    async def check_availability(self, date: str, hour_slots: List[str], rooms: List[RoomDetail]) -> List[RoomResult]:
+        if self.gate is not None:
+            await self.gate.wait()
+        return [
+            Exception(f"[{room.name}] 실패") if room.biz_item_id in self.fail_ids
+            else RoomAvailability(room_detail=room, available=True, available_slots={s: True for s in hour_slots})
+            for room in rooms
+        ]
+
+
+@pytest.fixture
+def future_date():
+    return (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def stream_request(future_date):
+    return AvailabilityRequest(
+        date=future_date, capacity=2, start_hour="18:00", end_hour="19:00",
+        swLat=37.0, swLng=126.0, neLat=38.0, neLng=128.0,
+    )
+
+
+@pytest.fixture
+def rooms(mock_room_detail_factory):
+    return [
+        mock_room_detail_factory(name="네이버A", business_id="1001", biz_item_id="a1", price=20000),
+        mock_room_detail_factory(name="네이버B", business_id="1001", biz_item_id="a2", price=15000),
+        mock_room_detail_factory(name="네이버C", business_id="1002", biz_item_id="b1", price=30000),
+        mock_room_detail_factory(name="그루브A", business_id="sadang", biz_item_id="g1", price=12000),
+        mock_room_detail_factory(name="그루브B", business_id="sadang", biz_item_id="g2", price=11000),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fast_crawler_frames_arrive_before_slow_crawler(rooms, stream_request):
+    gate = asyncio.Event()
+    service = AvailabilityService({"naver": GatedCrawler(), "groove": GatedCrawler(gate, fail_ids={"g2"})})
+
+    with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+        frames = await service.stream_availability(stream_request)
+
+        received = []
+        async for frame_type, data in frames:
+            received.append((frame_type, data))
+            # 네이버 결과가 모두 도착한 뒤에야 그루브 응답을 허용
+            if frame_type == "branch_summary" and not gate.is_set():
+                assert [d.room_detail.biz_item_id for t, d in received if t == "room"] == ["a1", "a2", "b1"]
+                assert set(data) == {"1001", "1002"}
+                assert data["1001"].available_count == 2
+                assert data["1001"].min_price == 15000
+                gate.set()
+
+    types = [t for t, _ in received]
+    assert types == ["room", "room", "room", "branch_summary", "room", "branch_summary", "summary"]
+
+    # 두 번째 delta는 그루브 지점만 포함
+    assert set(received[5][1]) == {"sadang"}
+
+    summary = received[-1][1]
+    assert summary.available_biz_item_ids == ["a1", "a2", "b1", "g1"]
+    assert set(summary.branch_summary) == {"1001", "1002", "sadang"}
+    assert summary.failed_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_returns_ndjson(async_client, rooms, future_date):
+    app.dependency_overrides[get_availability_service] = lambda: AvailabilityService(
+        {"naver": GatedCrawler(), "groove": GatedCrawler()}
+    )
+    params = {
+        "date": future_date, "capacity": 2, "start_hour": "18:00", "end_hour": "19:00",
+        "swLat": 37.0, "swLng": 126.0, "neLat": 38.0, "neLng": 128.0,
+    }
+    try:
+        with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+            response = await async_client.get("/api/rooms/availability/stream", params=params)
+    finally:
+        del app.dependency_overrides[get_availability_service]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    room_frames = [f for f in lines if f["type"] == "room"]
+    assert len(room_frames) == 5
+    # 일반 응답과 동일하게 alias 기준 직렬화
+    assert "price_per_hour" in room_frames[0]["data"]["room_detail"]
+    assert lines[-1]["type"] == "summary"
+    assert lines[-1]["data"]["branch_summary"]["sadang"]["min_price"] == 11000
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_validation_error_before_streaming(async_client, future_date):
+    params = {
+        "date": future_date, "capacity": 2, "start_hour": "18:00", "end_hour": "19:00",
+        "swLat": 37.5, "swLng": 127.0, "neLat": 37.0, "neLng": 127.1,
+    }
+
+    response = await async_client.get("/api/rooms/availability/stream", params=params)
+
+    assert response.status_code == 400
+    assert response.json()["isSuccess"] is False
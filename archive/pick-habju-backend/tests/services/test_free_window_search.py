@@ -0,0 +1,141 @@
+# tests/services/test_free_window_search.py
+"""
+빈 시간대 검색 (AvailabilityService.find_free_windows / GET /windows) 테스트
+
+테스트 대상:
+- (룸, 날짜)마다 하루 일정을 한 번만 조회하고, 캐시가 있으면 재검색 시 업스트림 호출 없음
+- duration시간 이상 연속 예약 가능한 최대 구간만 반환, 빈 구간 없는 룸은 제외
+- 일부 룸 조회 실패 시 failed_count로 집계
+- 날짜 범위 검증 (순서, 최대 일수)
+
+실행: pytest tests/services/test_free_window_search.py -v
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from app.api.dependencies import get_availability_service
+from app.crawler.base import BaseCrawler, DayResult, RoomResult, slice_day_results
+from app.exception.common.date_exception import InvalidDateRangeError
+from app.main import app
+from app.models.dto import DaySchedule, FreeWindowRequest, RoomDetail
+from app.services.availability_cache import AvailabilityCache
+from app.services.availability_service import AvailabilityService
+
+START = (datetime.now() + timedelta(days=3)).date()
+DATES = [(START + timedelta(days=offset)).isoformat() for offset in range(2)]
+
+
+class ScheduleCrawler(BaseCrawler):
+    """biz_item_id별로 지정한 시각만 예약 가능한 하루 일정을 반환하고 호출 내역을 기록하는 가짜 크롤러"""
+
+    def __init__(self, open_hours: Dict[str, set], failing=()):
+        self.open_hours = open_hours
+        self.failing = set(failing)
+        self.calls = []
+
+    async def check_availability(self, date: str, hour_slots: List[str], rooms: List[RoomDetail]) -> List[RoomResult]:
+        return slice_day_results(await self.fetch_day_schedules(date, rooms), hour_slots)
+
+    async def fetch_day_schedules(self, date: str, rooms: List[RoomDetail]) -> List[DayResult]:
+        self.calls.append((date, [room.biz_item_id for room in rooms]))
+        results = []
+        for room in rooms:
+            if room.biz_item_id in self.failing:
+                results.append(RuntimeError("upstream error"))
+                continue
+            hours = self.open_hours.get(room.biz_item_id, set())
+            results.append(DaySchedule(room_detail=room, date=date, hourly=[h in hours for h in range(24)]))
+        return results
+
+
+@pytest.fixture
+def rooms(mock_room_detail_factory):
+    return [
+        mock_room_detail_factory(name="네이버A", business_id="1001", biz_item_id="a1"),
+        mock_room_detail_factory(name="네이버B", business_id="1002", biz_item_id="b1"),
+        mock_room_detail_factory(name="그루브", business_id="sadang", biz_item_id="g1"),
+    ]
+
+
+def _request(**overrides) -> FreeWindowRequest:
+    params = dict(
+        start_date=DATES[0], end_date=DATES[-1], duration=2, capacity=4,
+        swLat=37.0, swLng=126.0, neLat=38.0, neLng=128.0,
+    )
+    params.update(overrides)
+    return FreeWindowRequest(**params)
+
+
+@pytest.mark.asyncio
+async def test_finds_maximal_windows_once_per_room_and_date(rooms):
+    naver = ScheduleCrawler({"a1": {10, 18, 19, 20, 21}, "b1": {12}})
+    groove = ScheduleCrawler({"g1": {0, 1, 22, 23}})
+    service = AvailabilityService({"naver": naver, "groove": groove}, cache=AvailabilityCache(ttl_seconds=30))
+
+    with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms):
+        response = await service.find_free_windows(_request())
+        again = await service.find_free_windows(_request())
+
+    assert naver.calls == [(date, ["a1", "b1"]) for date in DATES]
+    assert groove.calls == [(date, ["g1"]) for date in DATES]
+    assert again == response
+
+    # b1은 1시간만 비어 있으므로 제외, 10시 단독 슬롯도 구간이 아님
+    assert [r.room_detail.biz_item_id for r in response.rooms] == ["a1", "g1"]
+    a1 = response.rooms[0].windows
+    assert [(w.date, w.start_hour, w.end_hour, w.hours) for w in a1] == [
+        (date, "18:00", "21:00", 4) for date in DATES
+    ]
+    g1 = response.rooms[1].windows
+    assert [(w.start_hour, w.end_hour) for w in g1] == [("00:00", "01:00"), ("22:00", "23:00")] * 2
+    assert response.failed_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_rooms_are_counted(rooms):
+    naver = ScheduleCrawler({"b1": {18, 19}}, failing={"a1"})
+    service = AvailabilityService({"naver": naver})
+
+    with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms[:2]):
+        response = await service.find_free_windows(_request())
+
+    assert [r.room_detail.biz_item_id for r in response.rooms] == ["b1"]
+    assert response.failed_count == len(DATES)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start, end", [
+    (DATES[1], DATES[0]),
+    (DATES[0], (START + timedelta(days=7)).isoformat()),
+])
+async def test_invalid_date_range_is_rejected(start, end):
+    service = AvailabilityService({"naver": ScheduleCrawler({})})
+
+    with pytest.raises(InvalidDateRangeError):
+        await service.find_free_windows(_request(start_date=start, end_date=end))
+
+
+@pytest.mark.asyncio
+async def test_windows_endpoint(async_client, rooms):
+    service = AvailabilityService({"naver": ScheduleCrawler({"a1": {18, 19}})})
+    app.dependency_overrides[get_availability_service] = lambda: service
+    params = {
+        "start_date": DATES[0], "end_date": DATES[0], "duration": 2, "capacity": 4,
+        "swLat": 37.0, "swLng": 126.0, "neLat": 38.0, "neLng": 128.0,
+    }
+
+    try:
+        with patch("app.services.availability_service.get_rooms_by_criteria", return_value=rooms[:1]):
+            response = await async_client.get("/api/rooms/availability/windows", params=params)
+        invalid = await async_client.get("/api/rooms/availability/windows", params={**params, "duration": 0})
+    finally:
+        app.dependency_overrides.pop(get_availability_service, None)
+
+    assert response.status_code == 200
+    result = response.json()["result"]
+    assert result["rooms"][0]["windows"] == [{"date": DATES[0], "start_hour": "18:00", "end_hour": "19:00", "hours": 2}]
+    assert invalid.status_code == 422
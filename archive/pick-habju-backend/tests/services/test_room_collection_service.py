@@ -5,10 +5,15 @@ RoomCollectionService 단위 테스트
 테스트 대상:
 - _extract_price: 가격 정보 추출
 - Data Preservation Logic: 기존 값 보존 로직
+- 수집 파이프라인: 단계 간 큐 제한(backpressure), LLM 동시 호출 수 공유 제한, 보고서,
+  Supabase 저장의 워커 스레드 실행
 
 실행: pytest tests/services/test_room_collection_service.py -v
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
@@ -180,3 +185,135 @@ class TestDataPreservationLogic:
         upsert_data = upsert_call[0][0]
         
         assert upsert_data["price_per_hour"] == 25000  # 기존 가격 유지
+
+
+
+class TestIngestionPipeline:
+    """discover → fetch → parse → persist 파이프라인 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        with patch('app.services.room_collection_service.NaverMapCrawler'), \
+             patch('app.services.room_collection_service.NaverRoomFetcher'), \
+             patch('app.services.room_collection_service.RoomParserService'), \
+             patch('app.services.room_collection_service.get_supabase_client'):
+            from app.services.room_collection_service import RoomCollectionService
+            svc = RoomCollectionService()
+
+        svc.FETCH_WORKERS, svc.PARSE_WORKERS, svc.PERSIST_WORKERS, svc.QUEUE_SIZE = 2, 1, 1, 2
+        svc.fetched = []
+
+        async def fetch_full_info(business_id):
+            svc.fetched.append(business_id)
+            rooms = [{"bizItemId": f"{business_id}-{i}", "name": "룸", "desc": None} for i in range(6)]
+            return {"business": {"businessId": business_id, "businessDisplayName": business_id}, "rooms": rooms}
+
+        svc.room_fetcher.fetch_full_info = AsyncMock(side_effect=fetch_full_info)
+        svc._save_to_db = AsyncMock()
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_slow_llm_stage_bounds_fetching(self, service):
+        release = asyncio.Event()
+
+        async def parse(chunk):
+            await release.wait()
+            return {}
+
+        service.parser_service.parse_room_desc_batch = AsyncMock(side_effect=parse)
+        business_ids = [f"biz{i}" for i in range(30)]
+
+        async def discover():
+            return business_ids
+
+        run = asyncio.create_task(service._run_pipeline(discover))
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+        # parse 워커가 잡은 1개 + parse 큐 2개 + put에서 대기 중인 fetch 워커 2개
+        assert len(service.fetched) == 5
+
+        release.set()
+        report = await run
+
+        assert service.fetched == business_ids
+        assert service._save_to_db.call_count == 30
+        assert report["success"] == 30
+        assert report["failed"] == 0
+        assert report["discovered"] == 30
+        assert report["businesses_per_minute"] > 0
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_share_one_concurrency_limit(self, service):
+        service.PARSE_WORKERS = 3
+        service._llm_slots = asyncio.Semaphore(2)
+        active = peak = 0
+
+        async def parse(chunk):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return {}
+
+        service.parser_service.parse_room_desc_batch = AsyncMock(side_effect=parse)
+
+        async def discover():
+            return [f"biz{i}" for i in range(6)]
+
+        report = await service._run_pipeline(discover)
+
+        assert report["success"] == 6
+        assert service.parser_service.parse_room_desc_batch.call_count == 12  # 6개 지점 x 2개 배치
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stage_failures_are_counted_and_discover_errors_propagate(self, service):
+        service.parser_service.parse_room_desc_batch = AsyncMock(side_effect=RuntimeError("LLM error"))
+
+        async def discover():
+            return ["biz1", "biz2"]
+
+        report = await service._run_pipeline(discover)
+        assert (report["success"], report["failed"]) == (0, 2)
+
+        async def failing_discover():
+            raise RuntimeError("search failed")
+
+        with pytest.raises(RuntimeError, match="search failed"):
+            await service._run_pipeline(failing_discover)
+
+    @pytest.mark.asyncio
+    async def test_persist_runs_blocking_writes_off_the_event_loop(self, service):
+        del service._save_to_db  # 실제 _save_to_db 사용 (동기 저장 본문만 대체)
+        write_threads = []
+        service._write_to_db = MagicMock(side_effect=lambda *args: write_threads.append(threading.get_ident()))
+        service.parser_service.parse_room_desc_batch = AsyncMock(return_value={})
+
+        async def discover():
+            return ["biz1", "biz2"]
+
+        report = await service._run_pipeline(discover)
+
+        assert report["success"] == 2
+        assert len(write_threads) == 2
+        assert threading.get_ident() not in write_threads
+
+    @pytest.mark.asyncio
+    async def test_malformed_business_data_is_counted_without_stalling(self, service):
+        async def fetch_full_info(business_id):
+            if business_id in ("biz0", "biz3"):
+                return {"business": {"businessId": business_id}}  # rooms 누락
+            return {"business": {"businessId": business_id}, "rooms": [{"bizItemId": "1", "name": "룸"}]}
+
+        service.room_fetcher.fetch_full_info = AsyncMock(side_effect=fetch_full_info)
+        service.parser_service.parse_room_desc_batch = AsyncMock(return_value={})
+
+        async def discover():
+            return [f"biz{i}" for i in range(12)]
+
+        report = await asyncio.wait_for(service._run_pipeline(discover), timeout=5)
+
+        assert (report["success"], report["failed"]) == (10, 2)
+        assert service._save_to_db.call_count == 10
@@ -1,5 +1,6 @@
 import pytest
 from app.crawler.dream_checker import DreamCrawler
+from app.models.dto import DaySchedule
 
 # 테스트용 크롤러 인스턴스 생성
 crawler = DreamCrawler()
@@ -12,37 +13,98 @@ def test_parse_available_slot():
         <label title="2024-05-20 15시00분 (월)" class="time">15:00</label>
     </div>
     """
-    hour_slots = ["14:00", "15:00"]
+    hourly = crawler._parse_day_hourly(mock_html)
 
-    result = crawler._parse_html_content(mock_html, hour_slots)
-
-    assert result["14:00"] is True
-    assert result["15:00"] is False
+    assert hourly[14] is True
+    assert hourly[15] is False
 
 def test_parse_unavailable_slot():
     """active 클래스가 없는 경우 예약 불가능으로 판단되는지 테스트"""
     mock_html = '<label title="2024-05-20 14시00분 (월)" class="time">14:00</label>'
-    hour_slots = ["14:00"]
-
-    result = crawler._parse_html_content(mock_html, hour_slots)
 
-    assert result["14:00"] is False
+    assert crawler._parse_day_hourly(mock_html)[14] is False
 
 def test_parse_missing_label():
     """해당 시간대의 label이 없으면 False 반환하는지 테스트"""
     mock_html = '<label title="2024-05-20 18시00분 (월)" class="time active">18:00</label>'
-    hour_slots = ["14:00"] # 14시 라벨 없음
 
-    result = crawler._parse_html_content(mock_html, hour_slots)
-
-    assert result["14:00"] is False
+    # 14시 라벨 없음
+    assert crawler._parse_day_hourly(mock_html)[14] is False
 
 def test_parse_broken_html():
     """깨진 HTML에서도 lxml이 최선으로 파싱하여 동작하는지 확인"""
     # 닫는 태그 누락 등
     mock_html = '<label title="2024-05-20 14시00분 (월)" class="time active">14:00'
-    hour_slots = ["14:00"]
 
-    result = crawler._parse_html_content(mock_html, hour_slots)
+    assert crawler._parse_day_hourly(mock_html)[14] is True
+
+def test_parse_day_hourly_returns_full_day():
+    """하루 전체(0~23시) 결과를 반환하여 다른 시간대 재조회에 재사용 가능한지 테스트"""
+    mock_html = """
+    <label title="2024-05-20 09시00분 (월)" class="time active">09:00</label>
+    <label title="2024-05-20 14시00분 (월)" class="time active">14:00</label>
+    <label title="2024-05-20 15시00분 (월)" class="time">15:00</label>
+    """
+
+    hourly = crawler._parse_day_hourly(mock_html)
+
+    assert len(hourly) == 24
+    assert [hour for hour, ok in enumerate(hourly) if ok] == [9, 14]
+
+def test_parse_first_matching_label_wins():
+    """같은 시간대 label이 여러 개면 문서상 첫 번째 label 기준으로 판단하는지 테스트"""
+    mock_html = """
+    <label title="2024-05-20 14시00분 (월)" class="time">14:00</label>
+    <label title="2024-05-20 14시00분 (월)" class="time active">14:00</label>
+    """
+
+    assert crawler._parse_day_hourly(mock_html)[14] is False
+
+def test_parse_attribute_variants():
+    """속성 순서, 따옴표 종류, 대문자 태그와 무관하게 파싱하는지 테스트"""
+    mock_html = """
+    <LABEL class='time active' title='2024-05-20 09시00분 (월)'>09:00</LABEL>
+    <label for="t10" class=active title="2024-05-20 10시00분 > 오전">10:00</label>
+    <label title="2024-05-20 11시30분 (월)" class="time active">11:30</label>
+    <label data-title="2024-05-20 12시00분 (월)" class="time active">12:00</label>
+    """
+
+    hourly = crawler._parse_day_hourly(mock_html)
+
+    assert [hour for hour, ok in enumerate(hourly) if ok] == [9, 10]
+
+def test_parse_recorded_response_matches_soup_lookup():
+    """녹화된 드림 응답에서 기존 soup.find 방식과 같은 결과를 내는지 테스트"""
+    import html
+    import json
+    from pathlib import Path
+
+    from bs4 import BeautifulSoup
+
+    fixture = Path(__file__).parent / "benchmark" / "fixtures" / "dream_calendar_time.json"
+    items_html = html.unescape(json.loads(fixture.read_text())["items"])
+    soup = BeautifulSoup(items_html, "lxml")
+
+    expected = []
+    for hour in range(24):
+        label = soup.find("label", title=lambda t: t and f"{hour:02d}시00분" in t)
+        expected.append(bool(label) and "active" in label.get("class", []))
+
+    assert crawler._parse_day_hourly(items_html) == expected
+    assert any(expected) and not all(expected)
+
+
+def test_half_hour_slot_follows_its_hour(mock_room_detail_factory):
+    """정각 단위만 있는 드림 일정에서 14:30 요청은 14시 상태를 따르는지 테스트"""
+    mock_html = """
+    <label title="2024-05-20 14시00분 (월)" class="time active">14:00</label>
+    <label title="2024-05-20 15시00분 (월)" class="time">15:00</label>
+    """
+    schedule = DaySchedule(
+        room_detail=mock_room_detail_factory(), date="2024-05-20", hourly=crawler._parse_day_hourly(mock_html)
+    )
 
-    assert result["14:00"] is True
+    assert schedule.to_room_availability(["14:30"]).available is True
+    result = schedule.to_room_availability(["14:30", "15:30"])
+    assert result.available is False
+    assert result.available_slots == {"14:30": True, "15:30": False}
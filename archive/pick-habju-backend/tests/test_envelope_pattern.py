@@ -1,6 +1,8 @@
 import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
-from app.core.response import ApiResponse, success_response, error_response
+from app.core.response import ApiResponse, EnvelopeJSONResponse, success_response, error_response
 from app.core.error_codes import ErrorCode
 
 class DataModel(BaseModel):
@@ -178,4 +180,19 @@ def test_error_response_special_characters():
     special_msg = "에러: [중요] 'value' is <invalid> & \"wrong\""
     response = error_response(message=special_msg, code="SPECIAL_ERROR")
     
-    assert response.message == special_msg
\ No newline at end of file
+    assert response.message == special_msg
+
+def test_envelope_json_response_matches_default_json_response(mock_room_info_factory, mock_availability_response_factory):
+    """EnvelopeJSONResponse는 기본 JSONResponse(jsonable_encoder)와 같은 바이트를 출력"""
+    results = [
+        mock_room_info_factory(name="블랙룸 \"A\" & <B>", available="unknown", baseCapacity=4, extraCharge=3000),
+        mock_room_info_factory(name="룸\n2", lat=37.123456789, lng=None, imageUrls=[]),
+    ]
+    results[1].checked_at = "2030-05-01T10:00:00+09:00"
+    envelope = success_response(result=mock_availability_response_factory(results=results))
+
+    expected = JSONResponse(jsonable_encoder(envelope)).body
+
+    assert EnvelopeJSONResponse(envelope).body == expected
+    assert b'"image_urls"' in expected  # by_alias 직렬화
+    assert EnvelopeJSONResponse({"ok": True}).body == JSONResponse({"ok": True}).body
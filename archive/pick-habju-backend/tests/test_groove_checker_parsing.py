@@ -0,0 +1,89 @@
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.crawler.groove_checker import GrooveCrawler, parse_reserve_table
+from app.models.dto import RoomDetail
+
+# 테스트용 크롤러 인스턴스 생성
+crawler = GrooveCrawler()
+
+FIXTURE = Path(__file__).parent / "benchmark" / "fixtures" / "groove_reserve_table.html"
+
+
+def _room(biz_item_id: str) -> RoomDetail:
+    return RoomDetail(
+        name=f"그루브{biz_item_id}", branch="그루브 사당점", business_id="sadang", biz_item_id=biz_item_id,
+        imageUrls=[], maxCapacity=10, recommendCapacity=5, pricePerHour=10000,
+        canReserveOneHour=True, requiresCallOnSameDay=False,
+    )
+
+
+def _page(room_ids) -> str:
+    page = FIXTURE.read_text()
+    head, rest = page.split("<!--ROOM_ROW_START-->")
+    row, tail = rest.split("<!--ROOM_ROW_END-->")
+    return head + "".join(row.replace("__ROOM__", room_id) for room_id in room_ids) + tail
+
+
+def test_parse_off_class_means_available():
+    """reserve_time_off 클래스가 있으면 예약 가능, reserve_time_on이면 예약 불가로 판단하는지 테스트"""
+    html = """
+    <div id="reserve_time_13_18" class="reserve_time_off">18</div>
+    <div id="reserve_time_13_19" class="reserve_time_on">19</div>
+    """
+
+    slots = parse_reserve_table(html)
+
+    assert slots == {("13", 18): True, ("13", 19): False}
+
+
+def test_parse_attribute_order_and_quotes():
+    """class가 id보다 먼저 오거나, 따옴표 종류가 달라도 동일하게 파싱하는지 테스트"""
+    html = """
+    <td class='slot reserve_time_off' id='reserve_time_7_9'>09</td>
+    <div class=reserve_time_off id=reserve_time_7_10>10</div>
+    <div data-id="reserve_time_7_11" class="reserve_time_off">11</div>
+    """
+
+    slots = parse_reserve_table(html)
+
+    assert slots == {("7", 9): True, ("7", 10): True}
+
+
+def test_missing_slot_is_unavailable():
+    """해당 룸/시간의 태그가 없으면 예약 불가로 판단하는지 테스트"""
+    slots = parse_reserve_table('<div id="reserve_time_13_18" class="reserve_time_off">18</div>')
+
+    assert crawler._check_hour_slot(slots, "13", "18:00") is True
+    assert crawler._check_hour_slot(slots, "13", "17:00") is False
+    assert crawler._check_hour_slot(slots, "99", "18:00") is False
+
+
+def test_room_ids_with_shared_prefix_do_not_collide():
+    """룸 id가 서로의 접두어여도(1, 13) 시간대가 섞이지 않는지 테스트"""
+    html = """
+    <div id="reserve_time_1_3" class="reserve_time_off">03</div>
+    <div id="reserve_time_13_3" class="reserve_time_on">03</div>
+    <div id="reserve_time_1_13" class="reserve_time_on">13</div>
+    """
+
+    slots = parse_reserve_table(html)
+
+    assert slots == {("1", 3): True, ("13", 3): False, ("1", 13): False}
+
+
+def test_matches_css_selector_result_on_full_page():
+    """예약 테이블 전체 페이지에서 기존 CSS 선택자 방식과 같은 DaySchedule을 만드는지 테스트"""
+    room_ids = ["1", "2", "13", "21", "130"]
+    html = _page(room_ids)
+    soup = BeautifulSoup(html, "html.parser")
+
+    slots = parse_reserve_table(html)
+
+    for room_id in room_ids:
+        expected = [
+            bool(soup.select_one(f"#reserve_time_{room_id}_{hour}.reserve_time_off")) for hour in range(24)
+        ]
+        schedule = crawler._build_day_schedule(_room(room_id), "2024-05-20", slots)
+        assert schedule.hourly == expected
@@ -1,9 +1,13 @@
 # te/test_naver_checker.py
+import json
+import httpx
 import pytest
 
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 from app.crawler.naver_checker import NaverCrawler
-from app.models.dto import RoomDetail
+from app.exception.crawler.naver_exception import NaverAvailabilityError
+from app.models.dto import RoomDetail, DaySchedule
 from app.utils.room_loader import get_rooms_by_criteria
 
 @pytest.mark.asyncio
@@ -47,3 +51,140 @@ async def test_get_naver_availability():
     assert len(success_results) > 0, "모든 룸 조회가 실패했습니다. 네트워크 또는 API 문제일 수 있습니다."
     assert all(hasattr(r, "available_slots") for r in success_results)
 
+
+@pytest.mark.asyncio
+async def test_naver_day_schedule_answers_any_hour_range(mock_room_detail_factory):
+    """하루 전체 응답을 DaySchedule로 보존하여 어떤 시간 범위든 재조회 없이 답하는지 테스트"""
+    response = MagicMock()
+    response.json.return_value = {"data": {"schedule": {"bizItemSchedule": {"hourly": [
+        {"unitStartTime": "2026-05-01 18:00:00", "unitStock": 1, "unitBookingCount": 0},
+        {"unitStartTime": "2026-05-01 19:00:00", "unitStock": 1, "unitBookingCount": 1},
+        {"unitStartTime": "2026-05-01 20:00:00", "unitStock": 2, "unitBookingCount": 1},
+    ]}}}}
+    room = mock_room_detail_factory()
+
+    with patch("app.crawler.naver_checker.load_client", AsyncMock(return_value=response)) as mock_load:
+        schedules = await NaverCrawler().fetch_day_schedules("2026-05-01", [room])
+
+    assert mock_load.await_count == 1
+    schedule = schedules[0]
+    assert isinstance(schedule, DaySchedule)
+    assert [hour for hour, ok in enumerate(schedule.hourly) if ok] == [18, 20]
+
+    narrow = schedule.to_room_availability(["18:00"])
+    shifted = schedule.to_room_availability(["19:00", "20:00"])
+    assert narrow.available is True
+    assert shifted.available is False
+    assert shifted.available_slots == {"19:00": False, "20:00": True}
+
+
+@pytest.mark.asyncio
+async def test_naver_half_hour_units_match_exact_slots(mock_room_detail_factory):
+    """30분 단위 상품에서 14:30 요청이 14:00 상태가 아닌 14:30 단위 상태로 답하는지 테스트"""
+    response = MagicMock()
+    response.json.return_value = {"data": {"schedule": {"bizItemSchedule": {"hourly": [
+        {"unitStartTime": "2026-05-01 14:00:00", "unitStock": 1, "unitBookingCount": 1},
+        {"unitStartTime": "2026-05-01 14:30:00", "unitStock": 1, "unitBookingCount": 0},
+        {"unitStartTime": "2026-05-01 15:00:00", "unitStock": 1, "unitBookingCount": 0},
+        {"unitStartTime": "2026-05-01 15:30:00", "unitStock": 1, "unitBookingCount": 1},
+    ]}}}}
+    room = mock_room_detail_factory()
+
+    with patch("app.crawler.naver_checker.load_client", AsyncMock(return_value=response)):
+        schedule = (await NaverCrawler().fetch_day_schedules("2026-05-01", [room]))[0]
+
+    on_the_hour = schedule.to_room_availability(["14:00", "15:00"])
+    assert on_the_hour.available_slots == {"14:00": False, "15:00": True}
+
+    half_past = schedule.to_room_availability(["14:30"])
+    assert half_past.available is True
+    assert half_past.available_slots == {"14:30": True}
+
+    spanning = schedule.to_room_availability(["14:30", "15:30"])
+    assert spanning.available is False
+    assert spanning.available_slots == {"14:30": True, "15:30": False}
+
+    # 업스트림에 없는 시작 시각은 인접 정각 상태를 빌려오지 않음
+    assert schedule.to_room_availability(["15:15"]).available_slots == {"15:15": False}
+    assert DaySchedule.unknown(room, "2026-05-01").to_room_availability(["14:30"]).available == "unknown"
+
+
+def _naver_graphql_handler(calls: list, fail_biz_items=(), reject_batch=False):
+    """별칭(s0, s1, ...) / 단일(schedule) 요청 모두에 응답하는 가짜 네이버 GraphQL 서버"""
+
+    def schedule_for(params):
+        if params["bizItemId"] in fail_biz_items:
+            return None
+        hour = int(params["bizItemId"]) % 24
+        return {"bizItemSchedule": {"hourly": [
+            {"unitStartTime": f"2026-05-01 {hour:02d}:00:00", "unitStock": 1, "unitBookingCount": 0},
+        ]}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(body)
+        variables = body["variables"]
+        if "scheduleParams" in variables:
+            return httpx.Response(200, json={"data": {"schedule": schedule_for(variables["scheduleParams"])}})
+        if reject_batch:
+            return httpx.Response(400, json={"errors": [{"message": "Too many aliases"}]})
+        return httpx.Response(200, json={"data": {
+            f"s{name[1:]}": schedule_for(params) for name, params in variables.items()
+        }})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_naver_batches_rooms_per_business(mock_room_detail_factory):
+    """같은 business_id의 룸들을 하나의 GraphQL 요청으로 묶어 요청 수가 지점 수로 줄어드는지 테스트"""
+    rooms = [
+        mock_room_detail_factory(name=f"룸{i}", business_id=f"biz{i % 3}", biz_item_id=str(i))
+        for i in range(18)
+    ]
+    calls = []
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_naver_graphql_handler(calls)))
+
+    with patch("app.utils.client_loader._shared_client", client):
+        schedules = await NaverCrawler().fetch_day_schedules("2026-05-01", rooms)
+    await client.aclose()
+
+    assert len(calls) == 3  # 룸별 요청이면 18회
+    for i, schedule in enumerate(schedules):
+        assert isinstance(schedule, DaySchedule)
+        assert schedule.room_detail is rooms[i]
+        assert [hour for hour, ok in enumerate(schedule.hourly) if ok] == [i % 24]
+
+
+@pytest.mark.asyncio
+async def test_naver_batch_isolates_failed_alias(mock_room_detail_factory):
+    """배치 응답에서 일부 별칭만 null이면 해당 룸만 에러로 반환"""
+    rooms = [mock_room_detail_factory(name=f"룸{i}", business_id="biz", biz_item_id=str(i)) for i in range(4)]
+    calls = []
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_naver_graphql_handler(calls, fail_biz_items={"2"})))
+
+    with patch("app.utils.client_loader._shared_client", client):
+        schedules = await NaverCrawler().fetch_day_schedules("2026-05-01", rooms)
+    await client.aclose()
+
+    assert len(calls) == 1
+    assert isinstance(schedules[2], NaverAvailabilityError)
+    assert all(isinstance(schedules[i], DaySchedule) for i in (0, 1, 3))
+
+
+@pytest.mark.asyncio
+async def test_naver_batch_rejected_falls_back_to_single_requests(mock_room_detail_factory):
+    """배치 문서가 400으로 거부되면 룸별 개별 요청으로 대체하는지 테스트"""
+    rooms = [mock_room_detail_factory(name=f"룸{i}", business_id="biz", biz_item_id=str(i)) for i in range(4)]
+    calls = []
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_naver_graphql_handler(calls, reject_batch=True)))
+
+    with patch("app.utils.client_loader._shared_client", client):
+        schedules = await NaverCrawler().fetch_day_schedules("2026-05-01", rooms)
+    await client.aclose()
+
+    single_calls = [body for body in calls if "scheduleParams" in body["variables"]]
+    assert len(single_calls) == 4
+    for i, schedule in enumerate(schedules):
+        assert isinstance(schedule, DaySchedule)
+        assert [hour for hour, ok in enumerate(schedule.hourly) if ok] == [i]
@@ -0,0 +1,153 @@
+# tests/utils/test_circuit_breaker.py
+"""
+서킷 브레이커 테스트
+
+테스트 대상:
+- closed → open → half_open → closed/open 상태 전이
+- load_client 호스트 단위 차단 (열린 동안 업스트림 호출 없음)
+- AvailabilityService 크롤러 단위 차단 시 unknown 응답
+- 모니터링 API 상태 노출
+
+실행: pytest tests/utils/test_circuit_breaker.py -v
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.crawler.base import BaseCrawler, RoomResult
+from app.exception.api.client_loader_exception import CircuitOpenError, RequestFailedError
+from app.models.dto import RoomDetail
+from app.services.availability_service import AvailabilityService
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, circuit_breakers
+from app.utils.client_loader import load_client
+
+
+def test_state_transitions(fake_clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_seconds=10, half_open_probes=1, clock=fake_clock)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()  # 성공하면 연속 실패 초기화
+    for _ in range(3):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+    fake_clock.now = 10
+    assert breaker.allow_request()      # 시험 요청 1개 허용
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # 시험 요청 진행 중에는 차단
+
+    breaker.record_failure()            # 시험 요청 실패 → 다시 open
+    assert breaker.state == OPEN
+
+    fake_clock.now = 20
+    assert breaker.allow_request()
+    breaker.record_abandoned()          # 취소된 시험 요청은 슬롯만 반납
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_load_client_short_circuits_open_host():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(429)
+
+    registry = CircuitBreakerRegistry(lambda name: CircuitBreaker(name, failure_threshold=2, recovery_seconds=60))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("app.utils.client_loader._shared_client", client), \
+         patch("app.utils.client_loader.circuit_breakers", registry):
+        for _ in range(2):
+            with pytest.raises(RequestFailedError):
+                await load_client("https://dream.example.com/ajax", upstream="dream", data={})
+        with pytest.raises(CircuitOpenError):
+            await load_client("https://dream.example.com/ajax", upstream="dream", data={})
+    await client.aclose()
+
+    assert len(calls) == 2
+    assert registry.for_host("dream", "https://dream.example.com/x").state == OPEN
+
+
+class FailingCrawler(BaseCrawler):
+    def __init__(self):
+        self.calls = 0
+
+    async def check_availability(self, date: str, hour_slots: List[str], rooms: List[RoomDetail]) -> List[RoomResult]:
+        self.calls += 1
+        return [RuntimeError("site down") for _ in rooms]
+
+
+@pytest.mark.asyncio
+async def test_open_crawler_circuit_returns_unknown_without_calling(mock_room_detail_factory):
+    crawler = FailingCrawler()
+    registry = CircuitBreakerRegistry(lambda name: CircuitBreaker(name, failure_threshold=2, recovery_seconds=60))
+    service = AvailabilityService({"dream": crawler}, breakers=registry)
+    rooms = [mock_room_detail_factory(business_id="dream_sadang", biz_item_id="d1")]
+    date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+
+    for _ in range(2):
+        results = await service._run_crawler("dream", crawler, date, ["18:00"], rooms)
+        assert isinstance(results[0], Exception)
+
+    results = await service._run_crawler("dream", crawler, date, ["18:00"], rooms)
+
+    assert crawler.calls == 2
+    assert results[0].available == "unknown"
+
+
+class HostBlockedCrawler(BaseCrawler):
+    async def check_availability(self, date: str, hour_slots: List[str], rooms: List[RoomDetail]) -> List[RoomResult]:
+        return [CircuitOpenError("host circuit open") for _ in rooms]
+
+
+@pytest.mark.asyncio
+async def test_host_circuit_open_results_do_not_trip_crawler_circuit(mock_room_detail_factory):
+    """호스트 서킷 차단으로 돌아온 결과는 크롤러 서킷 실패로 집계하지 않음"""
+    registry = CircuitBreakerRegistry(lambda name: CircuitBreaker(name, failure_threshold=2, recovery_seconds=60))
+    service = AvailabilityService({"dream": HostBlockedCrawler()}, breakers=registry)
+    rooms = [mock_room_detail_factory(business_id="dream_sadang", biz_item_id="d1")]
+    date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+
+    for _ in range(3):
+        results = await service._run_crawler("dream", HostBlockedCrawler(), date, ["18:00"], rooms)
+        assert results[0].available == "unknown"
+
+    breaker = registry.for_crawler("dream")
+    assert breaker.state == CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_monitoring_endpoint_requires_admin_key(async_client):
+    with patch("app.api.dependencies.IS_DEBUG", False), \
+         patch("app.api.dependencies.MONITORING_API_KEY", "secret"):
+        missing = await async_client.get("/api/monitoring/upstreams")
+        wrong = await async_client.get("/api/monitoring/upstreams", headers={"X-Admin-Key": "nope"})
+
+    assert missing.status_code == 403
+    assert wrong.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_monitoring_endpoint_exposes_state(async_client):
+    breaker = circuit_breakers.for_crawler("dream")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    with patch("app.api.dependencies.IS_DEBUG", False), \
+         patch("app.api.dependencies.MONITORING_API_KEY", "secret"):
+        response = await async_client.get("/api/monitoring/upstreams", headers={"X-Admin-Key": "secret"})
+
+    assert response.status_code == 200
+    states = {b["name"]: b for b in response.json()["result"]["circuit_breakers"]}
+    assert states["crawler:dream"]["state"] == OPEN
+    assert states["crawler:dream"]["retry_in_seconds"] > 0
@@ -0,0 +1,165 @@
+# tests/utils/test_groove_session.py
+"""
+GrooveSessionManager 단위 테스트
+
+테스트 대상:
+- 로그인 세션 재사용 (요청마다 로그인하지 않음)
+- 세션 만료 감지 시 재로그인, 동시 만료 감지 시 단 한 번만 로그인
+- max_age 경과 시 선제적 재로그인
+- 재로그인 후에도 만료 응답이면 GrooveLoginError
+- 세션 교체 시 진행 중인 요청의 클라이언트는 요청이 끝난 뒤에 닫힘
+- 로그인 페이지 링크만 있는 일반 페이지는 만료로 보지 않음
+
+실행: pytest tests/utils/test_groove_session.py -v
+"""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.exception.crawler.groove_exception import GrooveLoginError
+from app.utils.login import GrooveSessionManager
+
+BASE_URL = "https://groove.test"
+RESERVE_URL = f"{BASE_URL}/reservation/reserve_table_view.asp"
+LOGIN_FORM = (
+    "<form action='/member/login_exec.asp' method='post'>"
+    "<input name='login_id'><input type='password' name='login_pw'></form>"
+)
+
+
+class FakeGroove:
+    """로그인 후 발급된 세션 쿠키로만 예약 테이블을 보여주는 가짜 서버"""
+
+    def __init__(self):
+        self.logins = 0
+        self.valid_session = None
+
+    def expire(self):
+        self.valid_session = None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/member/login_exec.asp":
+            self.logins += 1
+            self.valid_session = f"s{self.logins}"
+            return httpx.Response(200, headers={"set-cookie": f"ASPSESSIONID={self.valid_session}; path=/"})
+
+        if self.valid_session and f"ASPSESSIONID={self.valid_session}" in request.headers.get("cookie", ""):
+            return httpx.Response(200, text="<table id='reserve_time_1_10'></table>")
+        return httpx.Response(200, text=LOGIN_FORM)
+
+
+@pytest.fixture
+def groove():
+    server = FakeGroove()
+    with patch("app.utils.login.LOGIN_ID", "id"), \
+         patch("app.utils.login.LOGIN_PW", "pw"), \
+         patch("app.utils.login.GROOVE_BASE_URL", BASE_URL):
+        yield server
+
+
+def make_manager(server: FakeGroove, **kwargs) -> GrooveSessionManager:
+    return GrooveSessionManager(
+        client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+        **kwargs,
+    )
+
+
+async def fetch(client: httpx.AsyncClient) -> httpx.Response:
+    return await client.post(RESERVE_URL, data={"reserve_date": "2026-10-20"})
+
+
+@pytest.mark.asyncio
+async def test_reuses_session_across_requests(groove):
+    manager = make_manager(groove)
+
+    for _ in range(5):
+        resp = await manager.request(fetch)
+        assert "reserve_time_1_10" in resp.text
+
+    assert groove.logins == 1
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_expiry_triggers_single_relogin(groove):
+    manager = make_manager(groove)
+    await manager.request(fetch)
+
+    groove.expire()
+    responses = await asyncio.gather(*(manager.request(fetch) for _ in range(10)))
+
+    assert all("reserve_time_1_10" in r.text for r in responses)
+    assert groove.logins == 2
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_relogins_after_max_age(groove, fake_clock):
+    manager = make_manager(groove, max_age_seconds=60, clock=fake_clock)
+
+    await manager.request(fetch)
+    fake_clock.now = 59
+    await manager.request(fetch)
+    assert groove.logins == 1
+
+    fake_clock.now = 61
+    await manager.request(fetch)
+    assert groove.logins == 2
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_raises_when_session_still_invalid_after_relogin(groove):
+    manager = make_manager(groove)
+
+    async def always_login_page(client: httpx.AsyncClient) -> httpx.Response:
+        return httpx.Response(302, headers={"location": "/member/login.asp"})
+
+    with pytest.raises(GrooveLoginError):
+        await manager.request(always_login_page)
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_relogin_keeps_old_client_open_until_in_flight_requests_finish(groove, fake_clock):
+    manager = make_manager(groove, max_age_seconds=60, clock=fake_clock)
+    started, release = asyncio.Event(), asyncio.Event()
+    used_clients = []
+
+    async def slow_fetch(client: httpx.AsyncClient) -> httpx.Response:
+        used_clients.append(client)
+        started.set()
+        await release.wait()
+        return await fetch(client)
+
+    slow = asyncio.create_task(manager.request(slow_fetch))
+    await started.wait()
+
+    # 세션 만료(TTL)로 다른 요청이 재로그인 → 새 클라이언트로 교체
+    fake_clock.now = 61
+    await manager.request(fetch)
+    assert groove.logins == 2
+    assert not used_clients[0].is_closed
+
+    # 이전 세션 쿠키는 서버에서 무효 → 만료 응답을 받고 새 세션으로 재요청
+    release.set()
+    response = await slow
+    assert "reserve_time_1_10" in response.text
+    assert used_clients[0].is_closed
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_page_linking_to_login_is_not_expired(groove):
+    manager = make_manager(groove)
+
+    async def page_with_login_link(client: httpx.AsyncClient) -> httpx.Response:
+        return httpx.Response(200, text="<a href='/member/login.asp'>로그인</a><table id='reserve_time_1_10'></table>")
+
+    response = await manager.request(page_with_login_link)
+
+    assert "reserve_time_1_10" in response.text
+    assert groove.logins == 1
+    await manager.aclose()
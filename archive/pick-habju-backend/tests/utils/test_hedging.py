@@ -0,0 +1,83 @@
+# tests/utils/test_hedging.py
+"""
+헤지 요청(hedged_call / LatencyTracker) 단위 테스트
+
+실행: pytest tests/utils/test_hedging.py -v
+"""
+
+import asyncio
+import pytest
+
+from app.utils.hedging import LatencyTracker, hedged_call
+
+
+def warmed_tracker(sample: float = 0.01, percentile: float = 0.95) -> LatencyTracker:
+    tracker = LatencyTracker(percentile=percentile, min_samples=5, min_delay=0.01)
+    for _ in range(10):
+        tracker.record(sample)
+    return tracker
+
+
+def test_no_hedge_delay_until_enough_samples():
+    tracker = LatencyTracker(percentile=0.95, min_samples=5)
+    for _ in range(4):
+        tracker.record(0.1)
+    assert tracker.hedge_delay() is None
+
+    tracker.record(0.1)
+    assert tracker.hedge_delay() == pytest.approx(0.1)
+    assert LatencyTracker(percentile=0).hedge_delay() is None
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_faster_response_wins():
+    calls = []
+    release_primary = asyncio.Event()
+
+    async def request():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await release_primary.wait()  # 첫 요청은 응답이 멈춘 상태
+            return "primary"
+        return "hedge"
+
+    result = await hedged_call(request, warmed_tracker())
+
+    assert result == "hedge"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    calls = []
+
+    async def request():
+        calls.append(1)
+        return "ok"
+
+    assert await hedged_call(request, warmed_tracker(sample=1.0)) == "ok"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_waits_for_other_request_when_first_fails():
+    calls = []
+
+    async def request():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            return "primary"
+        raise RuntimeError("hedge failed")
+
+    assert await hedged_call(request, warmed_tracker()) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_raises_when_all_requests_fail():
+    async def request():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        await hedged_call(request, warmed_tracker())
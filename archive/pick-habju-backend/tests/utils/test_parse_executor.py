@@ -0,0 +1,134 @@
+# tests/utils/test_parse_executor.py
+"""
+ParseExecutor 테스트
+
+테스트 대상:
+- 작은 페이로드는 인라인, 큰 페이로드는 풀에서 실행
+- 풀 실행 중에도 이벤트 루프가 멈추지 않음
+- 대기 작업 수 / 파싱 시간 지표
+- 풀 워커 비정상 종료 시 인라인 대체
+- 실제 프로세스 풀(spawn)에서 그루브 예약 테이블 파싱
+
+실행: pytest tests/utils/test_parse_executor.py -v
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.crawler.groove_checker import parse_reserve_table
+from app.utils.parse_executor import ParseExecutor
+
+
+def _thread_name(payload: str) -> str:
+    return threading.current_thread().name
+
+
+def _slow_len(payload: str) -> int:
+    time.sleep(0.2)
+    return len(payload)
+
+
+class BrokenPool(Executor):
+    def submit(self, fn, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+
+@pytest.fixture
+def thread_pool_executor():
+    executor = ParseExecutor(
+        max_workers=2,
+        inline_threshold_bytes=100,
+        pool_factory=lambda n: ThreadPoolExecutor(max_workers=n, thread_name_prefix="parse"),
+    )
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_small_payload_runs_inline_large_payload_uses_pool(thread_pool_executor):
+    inline_thread = await thread_pool_executor.run(_thread_name, "x" * 99)
+    pooled_thread = await thread_pool_executor.run(_thread_name, "x" * 100)
+
+    assert inline_thread == threading.current_thread().name
+    assert pooled_thread.startswith("parse")
+
+    snapshot = thread_pool_executor.snapshot()
+    assert snapshot["inline"]["count"] == 1
+    assert snapshot["pool"]["count"] == 1
+    assert snapshot["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_parsing_does_not_block_event_loop(thread_pool_executor):
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        results = await asyncio.gather(*(thread_pool_executor.run(_slow_len, "x" * 200) for _ in range(3)))
+    finally:
+        ticker_task.cancel()
+
+    assert results == [200, 200, 200]
+    # 파싱(0.2초 x 3건, 워커 2개) 동안 이벤트 루프가 계속 동작
+    assert ticks >= 10
+
+    snapshot = thread_pool_executor.snapshot()
+    assert snapshot["max_queue_depth"] == 3
+    assert snapshot["queue_depth"] == 0
+    assert snapshot["pool"]["max_ms"] >= 200
+
+
+@pytest.mark.asyncio
+async def test_zero_workers_always_inline():
+    executor = ParseExecutor(max_workers=0, inline_threshold_bytes=0)
+
+    assert await executor.run(_thread_name, "x" * 10_000) == threading.current_thread().name
+    assert executor.snapshot()["pool"]["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_inline_and_recreates_pool():
+    created = []
+
+    def factory(n):
+        created.append(n)
+        return BrokenPool()
+
+    executor = ParseExecutor(max_workers=1, inline_threshold_bytes=0, pool_factory=factory)
+
+    assert await executor.run(len, "abc") == 3
+    assert await executor.run(len, "abcd") == 4
+
+    assert len(created) == 2
+    snapshot = executor.snapshot()
+    assert snapshot["fallbacks"] == 2
+    assert snapshot["inline"]["count"] == 2
+    assert snapshot["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_process_pool_parses_reserve_table():
+    html = "".join(
+        f'<div id="reserve_time_{room}_{hour}" class="reserve_time_{"off" if hour % 2 else "on"}"></div>'
+        for room in range(20) for hour in range(24)
+    )
+    executor = ParseExecutor(max_workers=1, inline_threshold_bytes=1)
+    try:
+        slots = await executor.run(parse_reserve_table, html)
+    finally:
+        executor.shutdown()
+
+    assert slots == parse_reserve_table(html)
+    assert slots[("3", 5)] is True and slots[("3", 4)] is False
+    assert executor.snapshot()["pool"]["count"] == 1
@@ -0,0 +1,158 @@
+# tests/utils/test_request_coalescer.py
+"""
+RequestCoalescer / load_client(coalesce=True) 테스트
+
+테스트 대상:
+- 요청 키: 본문 / 헤더의 순서와 무관, 내용이 다르면 다른 키
+- 동시에 진행 중인 같은 요청은 업스트림으로 한 번만 전송, 끝난 뒤의 요청은 새로 전송 (결과 보관 없음)
+- 호출자별 취소 안전성
+- 실패도 합류한 호출자 모두에게 전달
+
+실행: pytest tests/utils/test_request_coalescer.py -v
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.exception.api.client_loader_exception import RequestFailedError
+from app.utils.client_loader import load_client
+from app.utils.request_coalescer import RequestCoalescer, coalesce_key, request_coalescer
+
+URL = "https://upstream.test/api"
+
+
+class SlowUpstream:
+    """release 이벤트가 설정될 때까지 응답을 미루는 가짜 업스트림"""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return httpx.Response(self.status, json={"body": request.content.decode()})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+def test_coalesce_key_ignores_ordering_and_header_case():
+    a = coalesce_key("post", URL, json={"a": 1, "b": {"x": 1, "y": 2}}, headers={"Content-Type": "application/json"})
+    b = coalesce_key("POST", URL, json={"b": {"y": 2, "x": 1}, "a": 1}, headers={"content-type": "application/json"})
+    assert a == b
+
+    assert coalesce_key("POST", URL, data={"rm_ix": "1", "sch_date": "2026-05-01"}) == \
+        coalesce_key("POST", URL, data={"sch_date": "2026-05-01", "rm_ix": "1"})
+
+
+def test_coalesce_key_differs_by_body_url_and_headers():
+    base = coalesce_key("POST", URL, data={"rm_ix": "1"})
+    assert base != coalesce_key("POST", URL, data={"rm_ix": "2"})
+    assert base != coalesce_key("POST", URL + "/v2", data={"rm_ix": "1"})
+    assert base != coalesce_key("POST", URL, data={"rm_ix": "1"}, headers={"Authorization": "x"})
+    assert base != coalesce_key("POST", URL, json={"rm_ix": "1"})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_request():
+    upstream = SlowUpstream()
+    async with upstream.client() as client:
+        with patch("app.utils.client_loader._shared_client", client):
+            tasks = [
+                asyncio.create_task(load_client(URL, coalesce=True, data={"rm_ix": "1"}))
+                for _ in range(10)
+            ]
+            other = asyncio.create_task(load_client(URL, coalesce=True, data={"rm_ix": "2"}))
+            await asyncio.sleep(0.01)
+            upstream.release.set()
+            responses = await asyncio.gather(*tasks, other)
+
+            assert upstream.calls == 2
+            assert all(r.json() == {"body": "rm_ix=1"} for r in responses[:10])
+            assert responses[10].json() == {"body": "rm_ix=2"}
+            assert request_coalescer.snapshot() == {"in_flight": 0, "leaders": 2, "joined": 9}
+
+            # 끝난 요청의 결과는 보관하지 않음 → 다음 요청은 새로 전송
+            await load_client(URL, coalesce=True, data={"rm_ix": "1"})
+            assert upstream.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_without_coalesce_every_call_goes_upstream():
+    upstream = SlowUpstream()
+    upstream.release.set()
+    async with upstream.client() as client:
+        with patch("app.utils.client_loader._shared_client", client):
+            await asyncio.gather(*(load_client(URL, data={"rm_ix": "1"}) for _ in range(3)))
+
+    assert upstream.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    upstream = SlowUpstream()
+    async with upstream.client() as client:
+        with patch("app.utils.client_loader._shared_client", client):
+            first = asyncio.create_task(load_client(URL, coalesce=True, data={"rm_ix": "1"}))
+            second = asyncio.create_task(load_client(URL, coalesce=True, data={"rm_ix": "1"}))
+            await asyncio.sleep(0.01)
+
+            first.cancel()
+            await asyncio.sleep(0.01)
+            upstream.release.set()
+
+            response = await second
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+    assert response.status_code == 200
+    assert upstream.calls == 1
+    assert upstream.cancelled == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_request_cancelled_when_all_callers_cancel():
+    coalescer = RequestCoalescer()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def request():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    callers = [asyncio.create_task(coalescer.run("key", request)) for _ in range(2)]
+    await started.wait()
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert coalescer.snapshot()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_is_delivered_to_all_joined_callers():
+    upstream = SlowUpstream(status=404)
+    async with upstream.client() as client:
+        with patch("app.utils.client_loader._shared_client", client):
+            tasks = [asyncio.create_task(load_client(URL, coalesce=True, data={"rm_ix": "1"})) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            upstream.release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert upstream.calls == 1
+    assert all(isinstance(r, RequestFailedError) for r in results)
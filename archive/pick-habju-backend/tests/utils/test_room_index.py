@@ -0,0 +1,154 @@
+# tests/utils/test_room_index.py
+"""
+RoomSpatialIndex / RoomIndexManager 단위 테스트
+
+테스트 대상:
+- 지도 영역 + 인원수 조건 조회가 전수 비교(brute force) 결과와 일치
+- 좌표 없는 룸 처리
+- TTL / invalidate 기반 갱신, 갱신 실패 시 기존 인덱스 유지
+- 카탈로그 전체 적재 시 페이지 단위(range) 조회
+
+실행: pytest tests/utils/test_room_index.py -v
+"""
+
+import random
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.utils.room_index import RoomSpatialIndex, RoomIndexManager
+from app.utils.room_loader import load_all_rooms
+
+
+@pytest.fixture
+def catalogue(mock_room_detail_factory):
+    rng = random.Random(42)
+    rooms = []
+    for i in range(300):
+        rooms.append(mock_room_detail_factory(
+            name=f"룸{i}",
+            business_id=str(i // 5),
+            biz_item_id=str(i),
+            lat=rng.uniform(37.4, 37.7),
+            lng=rng.uniform(126.8, 127.2),
+            maxCapacity=rng.randint(1, 20),
+        ))
+    return rooms
+
+
+def brute_force(rooms, capacity, swLat, swLng, neLat, neLng):
+    return [
+        r for r in rooms
+        if r.maxCapacity >= capacity and r.lat is not None
+        and swLat <= r.lat <= neLat and swLng <= r.lng <= neLng
+    ]
+
+
+@pytest.mark.parametrize("bbox", [
+    (37.50, 126.90, 37.55, 126.95),   # 좁은 영역
+    (37.40, 126.80, 37.70, 127.20),   # 카탈로그 전체
+    (30.00, 120.00, 45.00, 140.00),   # 전국 단위 (점유 격자 순회)
+    (36.00, 126.00, 36.10, 126.10),   # 룸 없는 영역
+])
+@pytest.mark.parametrize("capacity", [1, 8, 20, 21])
+def test_query_matches_brute_force(catalogue, bbox, capacity):
+    index = RoomSpatialIndex(catalogue)
+
+    result = index.query(capacity, *bbox)
+
+    assert result == brute_force(catalogue, capacity, *bbox)
+
+
+def test_query_without_bbox_filters_capacity_only(catalogue, mock_room_detail_factory):
+    """좌표가 없으면 인원수 조건만 적용 (좌표 없는 룸 포함)"""
+    no_coord = mock_room_detail_factory(name="좌표없음", biz_item_id="x", lat=None, lng=None, maxCapacity=30)
+    index = RoomSpatialIndex(catalogue + [no_coord])
+
+    result = index.query(25)
+
+    assert result == [no_coord]
+    assert no_coord not in index.query(25, 30.0, 120.0, 45.0, 140.0)
+
+
+class TestRoomIndexManager:
+    """RoomIndexManager 갱신 로직 테스트"""
+
+    def test_reuses_index_within_ttl(self, catalogue, fake_clock):
+        calls = []
+        manager = RoomIndexManager(loader=lambda: calls.append(1) or catalogue, ttl_seconds=60, clock=fake_clock)
+
+        manager.get_index()
+        fake_clock.now = 59
+        manager.get_index()
+        assert len(calls) == 1
+
+        fake_clock.now = 61
+        manager.get_index()
+        assert len(calls) == 2
+
+    def test_invalidate_forces_reload(self, catalogue, fake_clock):
+        calls = []
+        manager = RoomIndexManager(loader=lambda: calls.append(1) or catalogue, ttl_seconds=60, clock=fake_clock)
+
+        manager.get_index()
+        manager.invalidate()
+        manager.get_index()
+
+        assert len(calls) == 2
+
+    def test_keeps_previous_index_on_reload_failure(self, catalogue, fake_clock):
+        state = {"fail": False}
+
+        def loader():
+            if state["fail"]:
+                raise RuntimeError("db down")
+            return catalogue
+
+        manager = RoomIndexManager(loader=loader, ttl_seconds=60, clock=fake_clock)
+        first = manager.get_index()
+
+        state["fail"] = True
+        fake_clock.now = 120
+        assert manager.get_index() is first
+
+    def test_raises_when_first_load_fails(self, fake_clock):
+        def loader():
+            raise RuntimeError("db down")
+
+        manager = RoomIndexManager(loader=loader, ttl_seconds=60, clock=fake_clock)
+
+        with pytest.raises(RuntimeError):
+            manager.get_index()
+
+
+def test_load_all_rooms_reads_every_page():
+    """응답 행 수 제한보다 큰 카탈로그를 range 페이지로 끝까지 읽는지 테스트"""
+    rows = [
+        {
+            "name": f"룸{i}", "branch": {"name": "지점", "lat": 37.5, "lng": 127.0},
+            "business_id": "biz", "biz_item_id": str(i), "image_urls": None,
+            "max_capacity": 10, "recommend_capacity": 5, "price_per_hour": 15000,
+            "can_reserve_one_hour": True, "requires_call_on_sameday": False,
+        }
+        for i in range(5)
+    ]
+    ranges = []
+    query = MagicMock()
+    query.select.return_value = query.gte.return_value = query.order.return_value = query
+
+    def page(start, end):
+        ranges.append((start, end))
+        response = MagicMock()
+        response.data = [dict(row) for row in rows[start:end + 1]]
+        return MagicMock(execute=MagicMock(return_value=response))
+
+    query.range.side_effect = page
+    supabase = MagicMock()
+    supabase.table.return_value = query
+
+    with patch("app.utils.room_loader.supabase", supabase), \
+         patch("app.utils.room_loader.ROOM_PAGE_SIZE", 2):
+        rooms = load_all_rooms()
+
+    assert ranges == [(0, 1), (2, 3), (4, 5)]
+    assert [room.biz_item_id for room in rooms] == [str(i) for i in range(5)]
+    assert rooms[0].lat == 37.5
@@ -0,0 +1,120 @@
+# tests/utils/test_slot_mask.py
+"""
+시간대 슬롯 비트마스크 테스트
+
+테스트 대상:
+- 하루 일정 → 예약 가능 / unknown 마스크 변환
+- 마스크 기반 DaySchedule.to_room_availability가 기존 슬롯별 판정과 같은 결과
+- generate_time_slots가 기존 strptime 기반 구현과 같은 슬롯 / 오류
+- 연속 빈 구간(free_windows / window_starts) 계산
+
+실행: pytest tests/utils/test_slot_mask.py -v
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.dto import DaySchedule, RoomAvailability
+from app.services.availability_service import AvailabilityService
+from app.utils.slot_mask import free_windows, hourly_masks, parse_clock, window_starts
+
+
+def _legacy_room_availability(schedule: DaySchedule, hour_slots) -> RoomAvailability:
+    """기존 구현: 슬롯마다 slot_state로 dict를 만든 뒤 값을 훑어 판정"""
+    slots = {slot: schedule.slot_state(slot) for slot in hour_slots}
+    if any(value == "unknown" for value in slots.values()):
+        available = "unknown"
+    else:
+        available = all(value is True for value in slots.values())
+    return RoomAvailability(room_detail=schedule.room_detail, available=available, available_slots=slots)
+
+
+def _legacy_time_slots(start_str: str, end_str: str):
+    start_time = datetime.strptime(start_str, "%H:%M")
+    end_time = datetime.strptime(end_str, "%H:%M")
+    if start_time > end_time:
+        raise ValueError("시작 시간이 종료 시간보다 같거나 늦을 수 없습니다.")
+    slots = []
+    current_time = start_time
+    while current_time <= end_time:
+        slots.append(current_time.strftime("%H:%M"))
+        current_time += timedelta(hours=1)
+    return slots
+
+
+def test_hourly_masks():
+    hourly = [False] * 24
+    hourly[18] = hourly[19] = True
+    hourly[23] = "unknown"
+
+    assert hourly_masks(hourly) == ((1 << 18) | (1 << 19), 1 << 23)
+
+
+def test_mask_availability_matches_legacy_per_slot_check(mock_room_detail_factory):
+    rng = random.Random(7)
+    room = mock_room_detail_factory()
+
+    for _ in range(300):
+        hourly = [rng.choice([True, True, False, "unknown"]) for _ in range(24)]
+        schedule = DaySchedule(room_detail=room, date="2030-05-01", hourly=hourly)
+        start = rng.randrange(24)
+        hour_slots = [f"{h:02d}:00" for h in range(start, min(start + rng.randint(1, 6), 26))]
+
+        assert schedule.to_room_availability(hour_slots) == _legacy_room_availability(schedule, hour_slots)
+
+
+@pytest.mark.parametrize("start, end", [
+    ("00:00", "23:00"), ("14:00", "16:00"), ("18:00", "18:00"), ("9:00", "11:00"),
+    ("14:30", "16:30"), ("14:30", "16:00"), ("10:15", "10:45"), ("23:59", "23:59"),
+])
+def test_generate_time_slots_matches_strptime(start, end):
+    assert AvailabilityService({}).generate_time_slots(start, end) == _legacy_time_slots(start, end)
+
+
+@pytest.mark.parametrize("start, end", [("16:00", "14:00"), ("24:00", "25:00"), ("14:60", "15:00"), ("14", "15:00"), ("", "")])
+def test_generate_time_slots_rejects_like_strptime(start, end):
+    with pytest.raises(ValueError):
+        _legacy_time_slots(start, end)
+    with pytest.raises(ValueError):
+        AvailabilityService({}).generate_time_slots(start, end)
+
+
+def test_parse_clock():
+    assert parse_clock("09:05") == (9, 5)
+    assert parse_clock("9:5") == (9, 5)
+    with pytest.raises(ValueError):
+        parse_clock("09:00:00")
+
+
+def _bits(*hours):
+    mask = 0
+    for hour in hours:
+        mask |= 1 << hour
+    return mask
+
+
+@pytest.mark.parametrize("mask, hours, expected", [
+    (_bits(18, 19, 20, 21), 2, [(18, 21)]),
+    (_bits(18, 19, 20, 21), 4, [(18, 21)]),
+    (_bits(18, 19, 20, 21), 5, []),
+    (_bits(0, 1, 5, 22, 23), 2, [(0, 1), (22, 23)]),
+    (_bits(5, 9), 1, [(5, 5), (9, 9)]),
+    ((1 << 24) - 1, 24, [(0, 23)]),
+    (0, 1, []),
+])
+def test_free_windows(mask, hours, expected):
+    assert free_windows(mask, hours) == expected
+
+
+def test_window_starts_matches_brute_force():
+    rng = random.Random(11)
+    for _ in range(200):
+        mask = rng.getrandbits(24)
+        hours = rng.randint(1, 6)
+        expected = 0
+        for start in range(24 - hours + 1):
+            if all(mask >> h & 1 for h in range(start, start + hours)):
+                expected |= 1 << start
+        assert window_starts(mask, hours) == expected
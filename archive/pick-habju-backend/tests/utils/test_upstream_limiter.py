@@ -0,0 +1,122 @@
+# tests/utils/test_upstream_limiter.py
+"""
+업스트림 제한기(AdaptiveLimiter / TokenBucket) 단위 테스트
+
+테스트 대상:
+- 동시 요청 수가 한도를 넘지 않음 (load_client 경유 포함)
+- 429/5xx 시 한도 절반 감소(cooldown 내 중복 감소 없음), 성공 시 점진 증가
+- 토큰 버킷 속도 제한
+
+실행: pytest tests/utils/test_upstream_limiter.py -v
+"""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.exception.api.client_loader_exception import RequestFailedError
+from app.utils.client_loader import load_client
+from app.utils.upstream_limiter import AdaptiveLimiter, TokenBucket, UpstreamLimiterRegistry
+
+
+@pytest.mark.asyncio
+async def test_concurrency_never_exceeds_limit():
+    limiter = AdaptiveLimiter("test", max_concurrency=4, rate_per_second=0)
+    state = {"active": 0, "peak": 0}
+
+    async def work():
+        await limiter.acquire()
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.001)
+        state["active"] -= 1
+        await limiter.release(False)
+
+    await asyncio.gather(*(work() for _ in range(50)))
+
+    assert state["peak"] == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_aimd_decrease_and_recovery(fake_clock):
+    async def fake_sleep(seconds):
+        fake_clock.now += seconds
+
+    limiter = AdaptiveLimiter(
+        "test", max_concurrency=16, rate_per_second=20, cooldown_seconds=1.0, clock=fake_clock, sleep=fake_sleep
+    )
+
+    for _ in range(3):
+        await limiter.acquire()
+    # 같은 과부하로 인한 연속 실패는 한 번만 반영
+    await limiter.release(True)
+    await limiter.release(True)
+    assert limiter.limit == 8
+    assert limiter.bucket.rate == 10
+
+    fake_clock.now = 2.0
+    await limiter.release(True)
+    assert limiter.limit == 4
+
+    for _ in range(40):
+        await limiter.acquire()
+        await limiter.release(False)
+    assert 4 < limiter.limit <= 16
+    assert limiter.bucket.rate > 5
+
+
+@pytest.mark.asyncio
+async def test_limit_does_not_drop_below_minimum(fake_clock):
+    limiter = AdaptiveLimiter("test", max_concurrency=2, rate_per_second=0, cooldown_seconds=0, clock=fake_clock)
+
+    for i in range(5):
+        fake_clock.now = float(i)
+        await limiter.acquire()
+        await limiter.release(True)
+
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests(fake_clock):
+    async def fake_sleep(seconds):
+        fake_clock.now += seconds
+
+    bucket = TokenBucket(rate=8, burst=1, clock=fake_clock, sleep=fake_sleep)
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert fake_clock.now == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_load_client_applies_upstream_limiter():
+    state = {"active": 0, "peak": 0, "calls": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["calls"] += 1
+        call_no = state["calls"]
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.001)
+        state["active"] -= 1
+        return httpx.Response(429 if call_no == 1 else 200, json={})
+
+    registry = UpstreamLimiterRegistry({"naver": (6, 0)})
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("app.utils.client_loader._shared_client", client), \
+         patch("app.utils.client_loader.upstream_limiters", registry):
+        results = await asyncio.gather(
+            *(load_client("https://booking.naver.com/graphql", upstream="naver", json={}) for _ in range(10)),
+            return_exceptions=True,
+        )
+    await client.aclose()
+
+    # 첫 요청의 429는 즉시 실패 (4xx 재시도 없음) + 한도 감소 (이후 성공으로 일부만 회복)
+    assert sum(isinstance(r, RequestFailedError) for r in results) == 1
+    assert state["peak"] <= 6
+    limiter = registry.get("naver", "https://booking.naver.com/graphql")
+    assert limiter.limit < 6
+    assert registry.get("groove", "https://example.com") is None